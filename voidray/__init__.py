@@ -7,7 +7,9 @@ graphics, audio, input handling, and more.
 """
 
 # Core engine components
-from .core.engine import VoidRayEngine, Engine
+from .core.engine import VoidRayEngine, Engine, SceneHandle
+from .core.engine import (configure, start, stop, get_engine, on_init, on_update,
+                          on_render, register_scene, get_scene_handle, set_scene)
 from .core.scene import Scene
 from .core.game_object import GameObject
 from .core.component import Component
@@ -37,16 +39,13 @@ from .audio.audio_manager import AudioManager
 from .utils.color import Color as UtilColor
 from .utils.time import Time
 from .utils.save_system import save_system
+from .utils.jit import precompile
 
 # Core systems
 from .core.event_system import event_system, EventType, GameEvent
 from .core.scene_transitions import SceneTransition, TransitionType
 
-# Global engine instance
-_engine = None
-
 # Engine version for compatibility
-__version__ = "3.2"
 __compatible_versions__ = ["2.5", "3.0", "3.1"]
 
 def get_version():
@@ -58,71 +57,9 @@ def is_compatible(version: str) -> bool:
     return version in __compatible_versions__ or version == __version__
 
 
-def configure(width: int = 800,
-              height: int = 600,
-              title: str = "VoidRay Game",
-              fps: int = 60):
-    """Configure the game engine with basic settings."""
-    global _engine
-    _engine = VoidRayEngine()
-    _engine.configure(width, height, title, fps)
-    return _engine
-
-
-def start():
-    """Start the game engine."""
-    if _engine:
-        _engine.start()
-    else:
-        print("Error: Engine not configured. Call voidray.configure() first.")
-
-
-def stop():
-    """Stop the game engine."""
-    if _engine:
-        _engine.stop()
-
-
-def get_engine():
-    """Get the current engine instance."""
-    return _engine
-
-
-def on_init(callback):
-    """Register initialization callback."""
-    if _engine:
-        _engine.on_init(callback)
-
-
-def on_update(callback):
-    """Register update callback."""
-    if _engine:
-        _engine.on_update(callback)
-
-
-def on_render(callback):
-    """Register render callback."""
-    if _engine:
-        _engine.on_render(callback)
-
-
-def register_scene(name: str, scene):
-    """Register a scene with the engine."""
-    if _engine:
-        _engine.register_scene(name, scene)
-
-
-def set_scene(name_or_scene):
-    """Set the active scene."""
-    if _engine:
-        _engine.set_scene(name_or_scene)
-
-
 def get_scene():
     """Get the current active scene."""
-    if _engine:
-        return _engine.scene_manager.get_current_scene()
-    return None
+    return Engine.scene_manager.get_current_scene()
 
 
 # Version info
@@ -167,6 +104,7 @@ __all__ = [
     'UtilColor',
     'Time',
     'save_system',
+    'precompile',
 
     # Core systems
     'event_system',
@@ -184,8 +122,20 @@ __all__ = [
     'on_update',
     'on_render',
     'register_scene',
+    'get_scene_handle',
     'set_scene',
-    'get_scene'
+    'get_scene',
+    'SceneHandle'
 ]
+
+
+def __getattr__(name):
+    """Import editor tools lazily so `import voidray` doesn't load them."""
+    if name in ('LevelEditor', 'ProjectTemplateManager'):
+        from . import tools
+        return getattr(tools, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 # Error handling
 from .core.error_dialog import show_fatal_error
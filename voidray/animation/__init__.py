@@ -4,7 +4,7 @@ VoidRay Animation System
 Sprite animations, tweening, and timeline control for 2D/2.5D games.
 """
 
-from .animation_manager import AnimationManager, Animation, SpriteAnimation
+from .animation_manager import AnimationManager, SpriteAnimation
 from .tween import Tween, TweenManager
 
-__all__ = ['AnimationManager', 'Animation', 'SpriteAnimation', 'Tween', 'TweenManager']
+__all__ = ['AnimationManager', 'SpriteAnimation', 'Tween', 'TweenManager']
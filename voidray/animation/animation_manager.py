@@ -4,12 +4,19 @@ Complete animation system supporting sprite animations, tweening, and timelines.
 """
 
 import pygame
-from typing import Dict, List, Optional, Callable, Any
-from ..math.vector2 import Vector2
+import hashlib
+import weakref
+import numpy as np
+from typing import Dict, List, Optional, Callable, Any, Union
 from .tween import TweenManager
+from ..utils.jit import njit, NUMBA_AVAILABLE
 import math
 
 
+# Surface.fblits is only available in pygame-ce
+_HAS_FBLITS = hasattr(pygame.Surface, 'fblits')
+
+
 class SpriteAnimation:
     """Sprite-based animation with frame sequences."""
 
@@ -50,27 +57,43 @@ class SpriteAnimation:
 
     def update(self, delta_time: float):
         """Update animation frame."""
-        if not self.is_playing or not self.frames:
+        frames = self.frames
+        if not frames or not self.is_playing:
             return
 
-        self.time_accumulator += delta_time * self.playback_speed
-
-        if self.time_accumulator >= self.frame_duration:
-            old_frame = self.current_frame
-            self.current_frame += 1
-            self.time_accumulator = 0.0
+        # A negative playback speed holds the current frame rather than
+        # stepping backwards past frame 0
+        time_accumulator = max(0.0, self.time_accumulator + delta_time * self.playback_speed)
+        frame_duration = self.frame_duration
 
-            if self.current_frame >= len(self.frames):
-                if self.is_looping:
-                    self.current_frame = 0
-                else:
-                    self.current_frame = len(self.frames) - 1
-                    self.is_playing = False
-                    if self.on_animation_finished:
-                        self.on_animation_finished()
+        # Whole frames elapsed; the remainder carries over so long frames
+        # don't lose time
+        if frame_duration > 0.0:
+            steps = max(0, int(time_accumulator // frame_duration))
+            time_accumulator -= steps * frame_duration
+        else:
+            steps = 1
+            time_accumulator = 0.0
+        self.time_accumulator = time_accumulator
+        if steps == 0:
+            return
 
-            if old_frame != self.current_frame and self.on_frame_changed:
-                self.on_frame_changed(self.current_frame)
+        old_frame = self.current_frame
+        frame = old_frame + steps
+        frame_count = len(frames)
+        if frame >= frame_count:
+            if self.is_looping:
+                frame %= frame_count
+            else:
+                frame = frame_count - 1
+                self.is_playing = False
+                if self.on_animation_finished:
+                    self.on_animation_finished()
+
+        if frame != old_frame:
+            self.current_frame = frame
+            if self.on_frame_changed:
+                self.on_frame_changed(frame)
 
     def get_current_frame(self) -> Optional[pygame.Surface]:
         """Get the current frame surface."""
@@ -84,6 +107,58 @@ class SpriteAnimation:
             self.current_frame = frame_index
 
 
+_EVENT_FRAME_CHANGED = 1
+_EVENT_FINISHED = 2
+
+# Fewest playing animations AnimationManager advances with _tick_clocks;
+# below this the per-animation loop is faster
+_BATCH_MIN_ANIMATIONS = 256
+
+
+@njit(cache=True, fastmath=True,
+      precompile=("(float64[:], float64[:], float64[:], int64[:], int64[:], boolean[:], "
+                  "boolean[:], uint8[:], int64, float64)",))
+def _tick_clocks(time_accumulator, frame_duration, playback_speed, current_frame,
+                 frame_count, is_looping, is_playing, events, count, delta_time):
+    """
+    Advance the first count animation clocks in one pass.
+
+    Writes each row's _EVENT_* bits to events and returns how many rows
+    have events, so the caller can skip callback dispatch when it's 0.
+    """
+    pending = 0
+    for i in range(count):
+        events[i] = 0
+        if not is_playing[i] or frame_count[i] == 0:
+            continue
+
+        elapsed = max(0.0, time_accumulator[i] + delta_time * playback_speed[i])
+        if frame_duration[i] > 0.0:
+            steps = max(0, int(elapsed // frame_duration[i]))
+            time_accumulator[i] = elapsed - steps * frame_duration[i]
+        else:
+            steps = 1
+            time_accumulator[i] = 0.0
+        if steps == 0:
+            continue
+
+        frame = current_frame[i] + steps
+        if frame >= frame_count[i]:
+            if is_looping[i]:
+                frame %= frame_count[i]
+            else:
+                frame = frame_count[i] - 1
+                is_playing[i] = False
+                events[i] = _EVENT_FINISHED
+
+        if frame != current_frame[i]:
+            current_frame[i] = frame
+            events[i] |= _EVENT_FRAME_CHANGED
+        if events[i]:
+            pending += 1
+    return pending
+
+
 class AnimationState:
     """Animation state for state machines."""
 
@@ -149,6 +224,11 @@ class AnimationManager:
 
     def __init__(self):
         self.animations: Dict[str, SpriteAnimation] = {}
+        self.sprite_sheets: Dict[str, pygame.Surface] = {}
+
+        # Frames with identical pixels share one Surface, keyed by size,
+        # format and a digest of the pixels; entries go away with their frames
+        self._frame_intern = weakref.WeakValueDictionary()
         self.active_animations: List[SpriteAnimation] = []
         self.animation_trees: Dict[str, 'AnimationTree'] = {}
         self.timeline: 'AnimationTimeline' = None
@@ -166,6 +246,11 @@ class AnimationManager:
         # State machine support
         self.state_machines: Dict[str, 'AnimationStateMachine'] = {}
 
+        # Playback control and property tweens
+        self.paused = False
+        self.global_speed_multiplier = 1.0
+        self.tween_manager = TweenManager()
+
     def _bounce_ease(self, t: float) -> float:
         """Bounce easing function."""
         if t < 0.36:
@@ -183,10 +268,24 @@ class AnimationManager:
             return t
         return -(2 ** (10 * (t - 1))) * math.sin((t - 1 - 0.1) * (2 * math.pi) / 0.4)
 
-    def load_sprite_sheet(self, name: str, image_path: str) -> bool:
-        """Load a sprite sheet for creating animations."""
+    def load_sprite_sheet(self, name: str, image: Union[str, pygame.Surface]) -> bool:
+        """
+        Load a sprite sheet for creating animations.
+
+        The sheet is converted to the display's pixel format so frames cut
+        from it blit without per-pixel conversion; the display mode must be
+        set before calling this.
+
+        Args:
+            name: Sprite sheet identifier
+            image: Image file path or an already loaded Surface
+        """
         try:
-            sprite_sheet = pygame.image.load(image_path).convert_alpha()
+            sprite_sheet = pygame.image.load(image) if isinstance(image, str) else image
+            if sprite_sheet.get_flags() & pygame.SRCALPHA:
+                sprite_sheet = sprite_sheet.convert_alpha()
+            else:
+                sprite_sheet = sprite_sheet.convert()
             self.sprite_sheets[name] = sprite_sheet
             return True
         except pygame.error as e:
@@ -197,31 +296,56 @@ class AnimationManager:
                               frame_width: int, frame_height: int, 
                               frame_count: int, frame_duration: float = 0.1,
                               start_x: int = 0, start_y: int = 0) -> SpriteAnimation:
-        """Create sprite animation from sprite sheet."""
+        """
+        Create sprite animation from sprite sheet.
+
+        Frames with identical pixels, within this sheet or any other, share
+        one Surface. Treat frame surfaces as read-only; draw on a copy.
+        """
         if sprite_sheet_name not in self.sprite_sheets:
             raise ValueError(f"Sprite sheet '{sprite_sheet_name}' not found")
 
         sprite_sheet = self.sprite_sheets[sprite_sheet_name]
-        frames = []
-
-        for i in range(frame_count):
-            # Calculate frame position
-            frames_per_row = sprite_sheet.get_width() // frame_width
-            row = i // frames_per_row
-            col = i % frames_per_row
+        sheet_width, sheet_height = sprite_sheet.get_size()
+        frames_per_row = sheet_width // frame_width
 
-            x = start_x + col * frame_width
-            y = start_y + row * frame_height
+        # Copies of a converted sheet keep its pixel format, colorkey and
+        # alpha, so frames need no conversion of their own
+        surface_format = (sprite_sheet.get_bitsize(), sprite_sheet.get_masks(),
+                          sprite_sheet.get_colorkey(), sprite_sheet.get_alpha())
 
-            # Extract frame
-            frame_rect = pygame.Rect(x, y, frame_width, frame_height)
-            frame = sprite_sheet.subsurface(frame_rect).copy()
+        frames = []
+        for i in range(frame_count):
+            x = start_x + (i % frames_per_row) * frame_width
+            y = start_y + (i // frames_per_row) * frame_height
+            if x + frame_width > sheet_width or y + frame_height > sheet_height:
+                raise ValueError(f"Frame {i} of '{name}' lies outside sprite sheet '{sprite_sheet_name}'")
+
+            frame = sprite_sheet.subsurface((x, y, frame_width, frame_height)).copy()
+            key = (frame_width, frame_height, surface_format,
+                   hashlib.blake2b(frame.get_buffer().raw, digest_size=16).digest())
+            shared = self._frame_intern.get(key)
+            if shared is None:
+                self._frame_intern[key] = frame
+            else:
+                frame = shared
             frames.append(frame)
 
         animation = SpriteAnimation(name, frames, frame_duration)
-        self.animations[name] = animation
+        self.add_animation(animation)
         return animation
 
+    def add_animation(self, animation: SpriteAnimation):
+        """
+        Register an animation so update() advances it.
+
+        Replaces any animation registered under the same name.
+
+        Args:
+            animation: Animation to manage
+        """
+        self.animations[animation.name] = animation
+
     def create_state_machine(self, name: str) -> AnimationStateMachine:
         """Create animation state machine."""
         state_machine = AnimationStateMachine()
@@ -243,17 +367,111 @@ class AnimationManager:
 
         effective_delta = delta_time * self.global_speed_multiplier
 
-        # Update sprite animations
-        for animation in self.animations.values():
-            animation.update(effective_delta)
+        # Update sprite animations; large batches go through one compiled
+        # loop, which only pays off with numba and many playing animations
+        animations = self.animations
+        playing = [animation for animation in animations.values() if animation.is_playing]
+        if NUMBA_AVAILABLE and len(playing) >= _BATCH_MIN_ANIMATIONS:
+            self._update_batch(playing, effective_delta)
+        else:
+            for animation in playing:
+                animation.update(effective_delta)
 
-        # Update state machines
+        # Update state machines, skipping those with nothing playing and
+        # those whose animation was already advanced above
         for state_machine in self.state_machines.values():
-            state_machine.update(effective_delta)
+            state = state_machine.current_state
+            if state is None:
+                continue
+            animation = state.animation
+            if animation.is_playing and animations.get(animation.name) is not animation:
+                state_machine.update(effective_delta)
 
         # Update tweens
         self.tween_manager.update(effective_delta)
 
+    def _update_batch(self, animations: List[SpriteAnimation], delta_time: float):
+        """
+        Advance many playing animations with _tick_clocks.
+
+        Matches SpriteAnimation.update, including its callbacks, which run
+        after all animations have advanced.
+        """
+        count = len(animations)
+        time_accumulator = np.fromiter([a.time_accumulator for a in animations], np.float64, count)
+        frame_duration = np.fromiter([a.frame_duration for a in animations], np.float64, count)
+        playback_speed = np.fromiter([a.playback_speed for a in animations], np.float64, count)
+        current_frame = np.fromiter([a.current_frame for a in animations], np.int64, count)
+        frame_count = np.fromiter([len(a.frames) for a in animations], np.int64, count)
+        is_looping = np.fromiter([a.is_looping for a in animations], np.bool_, count)
+        is_playing = np.ones(count, dtype=np.bool_)
+        events = np.zeros(count, dtype=np.uint8)
+
+        pending = _tick_clocks(time_accumulator, frame_duration, playback_speed, current_frame,
+                               frame_count, is_looping, is_playing, events, count, delta_time)
+
+        for animation, accumulator in zip(animations, time_accumulator.tolist()):
+            animation.time_accumulator = accumulator
+        if not pending:
+            return
+
+        rows = np.flatnonzero(events).tolist()
+        for row in rows:
+            animation = animations[row]
+            animation.current_frame = int(current_frame[row])
+            animation.is_playing = bool(is_playing[row])
+        for row in rows:
+            animation = animations[row]
+            event = events[row]
+            if event & _EVENT_FINISHED and animation.on_animation_finished:
+                animation.on_animation_finished()
+            if event & _EVENT_FRAME_CHANGED and animation.on_frame_changed:
+                animation.on_frame_changed(animation.current_frame)
+
+    def draw_all(self, target: pygame.Surface, entries, blend_flag: int = 0,
+                 visible_rect: Optional[pygame.Rect] = None):
+        """
+        Draw the current frames of several animations in one call.
+
+        Frames that fall entirely outside the visible area are skipped
+        before they reach pygame.
+
+        Args:
+            target: Surface to draw onto
+            entries: Iterable of (animation_name, (x, y)) pairs
+            blend_flag: pygame blend flag applied to every frame
+            visible_rect: Area to draw into; defaults to the target's clip rect
+        """
+        clip = visible_rect if visible_rect is not None else target.get_clip()
+        clip_left, clip_top = clip.x, clip.y
+        clip_right, clip_bottom = clip_left + clip.width, clip_top + clip.height
+
+        animations = self.animations
+        sequence = []
+        for name, position in entries:
+            animation = animations.get(name)
+            if animation is None:
+                continue
+            frame = animation.get_current_frame()
+            if frame is None:
+                continue
+
+            x, y = position
+            width, height = frame.get_size()
+            if (x + width <= clip_left or x >= clip_right or
+                    y + height <= clip_top or y >= clip_bottom):
+                continue
+            sequence.append((frame, position))
+
+        if not sequence:
+            return
+
+        if _HAS_FBLITS:
+            target.fblits(sequence, blend_flag)
+        else:
+            target.blits([(frame, position, None, blend_flag) for frame, position in sequence],
+                         doreturn=False)
+
     def pause_all(self):
         """Pause all animations."""
         self.paused = True
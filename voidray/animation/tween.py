@@ -1,11 +1,10 @@
-"""Fixes and improvements to the animation system, addressing potential errors and enhancing functionality."""
 """
 VoidRay Animation Tween System
 Advanced tweening and interpolation for smooth animations.
 """
 
 import math
-from typing import Callable, Any, Union
+from typing import Any, Callable, Dict, List, Union
 from ..math.vector2 import Vector2
 
 
@@ -178,4 +177,85 @@ class Tween:
         try:
             self.start_value = getattr(self.target, self.property_name)
         except AttributeError:
-            pass
\ No newline at end of file
+            pass
+
+
+class TweenManager:
+    """
+    Runs groups of property tweens started through a single id.
+    """
+
+    def __init__(self):
+        """Initialize the tween manager."""
+        self.tweens: Dict[int, List[Tween]] = {}
+        self._next_id = 1
+
+    def _add(self, tweens: List[Tween]) -> int:
+        """Register a group of tweens and return its id."""
+        tween_id = self._next_id
+        self._next_id += 1
+        self.tweens[tween_id] = tweens
+        return tween_id
+
+    def tween_to(self, target_object: Any, target_values: Dict[str, Any],
+                 duration: float, ease_type: str = EaseType.LINEAR) -> int:
+        """
+        Animate properties from their current values to target values.
+
+        Args:
+            target_object: Object whose properties are animated
+            target_values: Property name to end value
+            duration: Animation duration in seconds
+            ease_type: Type of easing to use
+
+        Returns:
+            Id for stop_tween
+        """
+        return self._add([Tween(target_object, name, value, duration, ease_type)
+                          for name, value in target_values.items()])
+
+    def tween_from(self, target_object: Any, start_values: Dict[str, Any],
+                   duration: float, ease_type: str = EaseType.LINEAR) -> int:
+        """
+        Jump properties to start values and animate back to their current values.
+
+        Args:
+            target_object: Object whose properties are animated
+            start_values: Property name to start value
+            duration: Animation duration in seconds
+            ease_type: Type of easing to use
+
+        Returns:
+            Id for stop_tween
+        """
+        end_values = {name: getattr(target_object, name) for name in start_values}
+        for name, value in start_values.items():
+            setattr(target_object, name, value)
+        return self.tween_to(target_object, end_values, duration, ease_type)
+
+    def stop_tween(self, tween_id: int):
+        """Stop a tween group, leaving its properties where they are."""
+        for tween in self.tweens.pop(tween_id, ()):
+            tween.stop()
+
+    def clear_all(self):
+        """Stop all tweens."""
+        for tweens in self.tweens.values():
+            for tween in tweens:
+                tween.stop()
+        self.tweens.clear()
+
+    def update(self, delta_time: float):
+        """Advance all tweens and drop finished groups."""
+        if not self.tweens:
+            return
+
+        finished = []
+        for tween_id, tweens in self.tweens.items():
+            for tween in tweens:
+                tween.update(delta_time)
+            if all(tween.is_complete for tween in tweens):
+                finished.append(tween_id)
+
+        for tween_id in finished:
+            del self.tweens[tween_id]
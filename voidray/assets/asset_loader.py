@@ -9,40 +9,139 @@ import os
 import threading
 import pickle
 import hashlib
-from typing import Dict, Any, Optional, List, Tuple, Union
-from pathlib import Path
+import mmap
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Any, Optional, List, Set, Tuple, Callable
+from ..utils.fonts import get_font
+from ..core.logger import engine_logger
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+
+def _parse_json(raw: bytes) -> Any:
+    """Parse JSON bytes, with orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+# Images at least this large are decoded straight from a memory map
+_MMAP_IMAGE_SIZE = 256 * 1024
+
+
+def _load_image_file(file_path: str) -> pygame.Surface:
+    """
+    Decode an image file.
+
+    Large files are memory-mapped and handed to the decoder as a file
+    object, so it reads pages straight from the OS cache.
+    """
+    try:
+        if os.path.getsize(file_path) >= _MMAP_IMAGE_SIZE:
+            with open(file_path, 'rb') as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return pygame.image.load(mapped, file_path)
+    except (OSError, ValueError, pygame.error):
+        pass  # Fall back to letting pygame open the file itself
+    return pygame.image.load(file_path)
+
+
+def _normalize_search_path(path: str) -> str:
+    """Normalize a search path and give it exactly one trailing separator."""
+    return os.path.join(os.path.normpath(path), "")
+
+
+def _load_json_file(file_path: str) -> Any:
+    """Read a JSON file in binary mode and parse it."""
+    with open(file_path, 'rb') as f:
+        return _parse_json(f.read())
+
+
+def _asset_bytes(value: Any) -> int:
+    """Approximate memory held by a cached asset; only surfaces are counted."""
+    if isinstance(value, pygame.Surface):
+        return value.get_width() * value.get_height() * value.get_bytesize()
+    return 0
 
 
 class AssetCache:
-    """LRU cache for loaded assets."""
+    """LRU cache for loaded assets, bounded by entry count and surface bytes."""
 
-    def __init__(self, max_size: int = 200):
+    def __init__(self, max_size: int = 200, max_bytes: int = 256 * 1024 * 1024):
         self.max_size = max_size
-        self.cache = {}
-        self.access_order = []
+        self.max_bytes = max_bytes
+        self.cache: OrderedDict = OrderedDict()
+        self.pinned: Set[str] = set()
+        self.total_bytes = 0
+        self._sizes: Dict[str, int] = {}
 
     def get(self, key: str) -> Any:
-        if key in self.cache:
+        value = self.cache.get(key)
+        if value is not None:
             # Move to end (most recently used)
-            self.access_order.remove(key)
-            self.access_order.append(key)
-            return self.cache[key]
-        return None
+            self.cache.move_to_end(key)
+        return value
 
-    def put(self, key: str, value: Any):
+    def put(self, key: str, value: Any, pin: bool = False) -> List[str]:
+        """Store value under key and return the keys evicted to make room."""
         if key in self.cache:
-            self.access_order.remove(key)
-        elif len(self.cache) >= self.max_size:
-            # Remove least recently used
-            lru_key = self.access_order.pop(0)
-            del self.cache[lru_key]
+            self.total_bytes -= self._sizes[key]
 
+        size = _asset_bytes(value)
         self.cache[key] = value
-        self.access_order.append(key)
+        self.cache.move_to_end(key)
+        self._sizes[key] = size
+        self.total_bytes += size
+        if pin:
+            self.pinned.add(key)
+
+        return self._evict(key)
+
+    def remove(self, key: str):
+        if key in self.cache:
+            del self.cache[key]
+            self.total_bytes -= self._sizes.pop(key)
+            self.pinned.discard(key)
+
+    def _evict(self, newest: str) -> List[str]:
+        """
+        Drop least recently used unpinned entries until within both limits.
+
+        The entry just stored (newest) is never evicted.
+
+        Returns:
+            The evicted keys
+        """
+        if len(self.cache) <= self.max_size and self.total_bytes <= self.max_bytes:
+            return []
+
+        evicted = []
+        for key in self.cache:
+            if len(self.cache) - len(evicted) <= self.max_size and self.total_bytes <= self.max_bytes:
+                break
+            if key == newest:
+                break
+            if key in self.pinned:
+                continue
+            evicted.append(key)
+            self.total_bytes -= self._sizes[key]
+
+        for key in evicted:
+            del self.cache[key]
+            del self._sizes[key]
+        return evicted
 
     def clear(self):
         self.cache.clear()
-        self.access_order.clear()
+        self.pinned.clear()
+        self._sizes.clear()
+        self.total_bytes = 0
 
 
 class AssetMetadata:
@@ -64,13 +163,15 @@ class AssetLoader:
     Enhanced asset loader with streaming, caching, and performance optimizations.
     """
 
-    def __init__(self, cache_size: int = 200, enable_streaming: bool = True):
+    def __init__(self, cache_size: int = 200, enable_streaming: bool = True,
+                 cache_max_bytes: int = 256 * 1024 * 1024):
         """
         Initialize the enhanced asset loader.
 
         Args:
-            cache_size: Maximum number of assets to keep in memory
+            cache_size: Maximum number of images kept in the cache
             enable_streaming: Whether to enable streaming for large assets
+            cache_max_bytes: Maximum bytes of image data kept in the cache
         """
         self.images: Dict[str, pygame.Surface] = {}
         self.sounds: Dict[str, pygame.mixer.Sound] = {}
@@ -79,13 +180,38 @@ class AssetLoader:
         self.textures: Dict[str, pygame.Surface] = {}  # For 2.5D textures
         self.animations: Dict[str, List[pygame.Surface]] = {}
 
+        # Name that first loaded each (real path, convert_alpha, scale), so
+        # other names for the same file share its surface
+        self._image_owners: Dict[Tuple[str, Optional[bool], Optional[Tuple[int, int]]], str] = {}
+        # Cache key holding the surface behind each image name; names that
+        # share a file point at the owner's key
+        self._image_keys: Dict[str, str] = {}
+        # Same for sounds, keyed by (real path, volume)
+        self._sound_owners: Dict[Tuple[str, float], str] = {}
+
+        # Images loaded before a display mode existed, name -> convert_alpha
+        self._unconverted: Dict[str, bool] = {}
+
+        # Shared "missing image" surfaces by size
+        self._placeholders: Dict[Tuple[int, int], pygame.Surface] = {}
+
         # Enhanced features
-        self.cache = AssetCache(cache_size)
+        self.cache = AssetCache(cache_size, cache_max_bytes)
         self.metadata: Dict[str, AssetMetadata] = {}
         self.enable_streaming = enable_streaming
         self.loading_threads: List[threading.Thread] = []
         self.async_callbacks: Dict[str, callable] = {}
 
+        # File names in each directory searched so far, so lookups don't
+        # stat every search path; see refresh_file_index
+        self._dir_entries: Dict[str, frozenset] = {}
+
+        # _find_file results, including misses, keyed by (filename, asset type)
+        self._resolved_paths: Dict[Tuple[str, str], Optional[str]] = {}
+
+        # File reads started by preload_asset_pack, keyed by file path
+        self._pending_reads: Dict[str, Future] = {}
+
         # Asset search paths with priority
         self.search_paths = {
             "image": ["assets/images/", "assets/textures/", "images/", "textures/", "./"],
@@ -95,6 +221,12 @@ class AssetLoader:
             "texture": ["assets/textures/", "assets/images/", "textures/", "./"],
             "animation": ["assets/animations/", "animations/", "./"]
         }
+        for asset_type, paths in self.search_paths.items():
+            normalized = []
+            for path in map(_normalize_search_path, paths):
+                if path not in normalized:
+                    normalized.append(path)
+            self.search_paths[asset_type] = normalized
 
         # Supported file formats
         self.supported_formats = {
@@ -105,6 +237,17 @@ class AssetLoader:
             "texture": [".png", ".jpg", ".jpeg", ".bmp", ".tga"],
             "animation": [".gif", ".json"]  # JSON for sprite sheets
         }
+        # Extension sets for membership tests, and ordered tuples for trying
+        # extensions in preference order
+        self._format_sets: Dict[str, frozenset] = {
+            asset_type: frozenset(exts) for asset_type, exts in self.supported_formats.items()
+        }
+        self._format_order: Dict[str, Tuple[str, ...]] = {
+            asset_type: tuple(exts) for asset_type, exts in self.supported_formats.items()
+        }
+
+        # PNG decoding needs pygame's extended image support
+        self._png_fast_path = pygame.image.get_extended()
 
         # Asset processing options
         self.default_image_convert = True
@@ -112,7 +255,7 @@ class AssetLoader:
         self.texture_compression = False
         self.auto_generate_mipmaps = False
 
-        print("Enhanced asset loader initialized")
+        engine_logger.info("Enhanced asset loader initialized")
 
     def add_search_path(self, asset_type: str, path: str, priority: int = 0):
         """
@@ -124,32 +267,79 @@ class AssetLoader:
             priority: Priority (0 = highest priority)
         """
         if asset_type in self.search_paths:
+            path = _normalize_search_path(path)
+            paths = self.search_paths[asset_type]
+            # Adding a path again only moves it, so lookups never probe it twice
+            if path in paths:
+                paths.remove(path)
             if priority == 0:
-                self.search_paths[asset_type].insert(0, path)
+                paths.insert(0, path)
             else:
-                self.search_paths[asset_type].append(path)
+                paths.append(path)
+            self.refresh_file_index()
+
+    def refresh_file_index(self):
+        """Forget cached directory listings, e.g. after asset files were added."""
+        self._dir_entries.clear()
+        self._resolved_paths.clear()
+
+    def _entries(self, directory: str) -> frozenset:
+        """Names of the files in a directory, listed once with os.scandir; empty if it's missing."""
+        entries = self._dir_entries.get(directory)
+        if entries is None:
+            try:
+                # is_file() uses the type scandir already read, so no extra stat
+                with os.scandir(directory or ".") as scan:
+                    entries = frozenset(entry.name for entry in scan if entry.is_file())
+            except OSError:
+                entries = frozenset()
+            self._dir_entries[directory] = entries
+        return entries
 
     def _find_file(self, filename: str, asset_type: str) -> Optional[str]:
+        """
+        Find a file in search paths.
+
+        Results are remembered until refresh_file_index(), misses included,
+        so an asset that is requested repeatedly but never shipped costs a
+        dict lookup instead of a directory search each time. An absolute
+        path to an existing file is returned as is, without listing its
+        directory.
+        """
+        if os.path.isabs(filename) and os.path.isfile(filename):
+            return filename
+
+        key = (filename, asset_type)
+        if key in self._resolved_paths:
+            return self._resolved_paths[key]
+        file_path = self._resolved_paths[key] = self._search_file(filename, asset_type)
+        return file_path
+
+    def _search_file(self, filename: str, asset_type: str) -> Optional[str]:
         """Find a file in search paths with format validation."""
         search_paths = self.search_paths.get(asset_type, ["./"])
-        supported_exts = self.supported_formats.get(asset_type, [])
+        if os.path.isabs(filename):
+            search_paths = ("",)
+        supported_exts = self._format_order.get(asset_type, ())
 
         # If filename already has extension, check if supported
-        file_ext = Path(filename).suffix.lower()
-        if file_ext and supported_exts and file_ext not in supported_exts:
-            print(f"Warning: Unsupported format {file_ext} for {asset_type}")
+        file_ext = os.path.splitext(filename)[1].lower()
+        if file_ext and supported_exts and file_ext not in self._format_sets[asset_type]:
+            engine_logger.warning(f"Unsupported format {file_ext} for {asset_type}")
 
+        # Search paths end in a separator, so joining is concatenation
         for path in search_paths:
-            full_path = os.path.join(path, filename)
-            if os.path.exists(full_path):
+            full_path = path + filename
+            directory, name = os.path.split(full_path)
+            entries = self._entries(directory)
+            if name in entries:
                 return full_path
 
             # Try with different extensions if no extension provided
             if not file_ext and supported_exts:
                 for ext in supported_exts:
-                    test_path = full_path + ext
-                    if os.path.exists(test_path):
-                        return test_path
+                    if name + ext in entries:
+                        return full_path + ext
 
         return None
 
@@ -178,7 +368,8 @@ class AssetLoader:
 
     def load_image(self, name: str, filename: str, convert_alpha: bool = None,
                    scale: Tuple[int, int] = None, streaming: bool = False, 
-                   fallback_color: tuple = (255, 0, 255), validate: bool = True) -> pygame.Surface:
+                   fallback_color: tuple = (255, 0, 255), validate: bool = True,
+                   pin: bool = False) -> pygame.Surface:
         """
         Load an image with enhanced options.
 
@@ -188,43 +379,83 @@ class AssetLoader:
             convert_alpha: Whether to convert with alpha (None for auto-detect)
             scale: Optional scaling (width, height)
             streaming: Whether to use streaming for large images
+            pin: Keep the image loaded when the cache evicts (e.g. UI atlases)
         """
-        if name in self.images:
-            return self.images[name]
+        surface = self.images.get(name)
+        if surface is not None:
+            # Refresh the image's place in the LRU order
+            key = self._image_keys.get(name)
+            if key is not None:
+                self.cache.get(key)
+            return surface
 
         # Check cache first
         cached = self.cache.get(f"image_{name}")
         if cached:
             self.images[name] = cached
+            self._image_keys[name] = f"image_{name}"
             return cached
 
         file_path = self._find_file(filename, "image")
         if not file_path:
-            print(f"Image file not found: {filename}")
+            engine_logger.warning(f"Image file not found: {filename}")
             return self._create_placeholder_image(name, (32, 32))
 
+        owner_key = (os.path.realpath(file_path), convert_alpha, tuple(scale) if scale else None)
+        owner = self._image_owners.get(owner_key)
+        shared = self.images.get(owner) if owner is not None else None
+        if shared is not None:
+            key = self._image_keys[owner]
+            self.cache.get(key)
+            if pin:
+                self.cache.pinned.add(key)
+            self.images[name] = shared
+            self._image_keys[name] = key
+            return shared
+
         metadata = self._get_file_metadata(file_path, "image")
 
         try:
-            # Validate image file if requested
-            if validate and not self._validate_image_file(file_path):
-                print(f"Image validation failed: {filename}")
+            # Most images are PNGs loaded with alpha at their own size; they
+            # skip validation and alpha detection, as the decode itself fails
+            # on anything that isn't a readable PNG
+            if (self._png_fast_path and convert_alpha is not False and not scale
+                    and not streaming and file_path[-4:].lower() == ".png"):
+                surface = self._read_file(file_path, _load_image_file)
+                if pygame.display.get_surface() is None:
+                    self._unconverted[name] = True
+                else:
+                    surface = surface.convert_alpha()
+                return self._store_image(name, surface, file_path, owner_key, metadata, pin)
+
+            # Validate image file if requested; the decode below doubles as
+            # the check that it is a readable image
+            if validate and os.path.getsize(file_path) == 0:
+                engine_logger.error(f"Image validation failed: {filename}")
                 return self._create_placeholder_image(name, scale or (32, 32))
             
             # Handle streaming for large images
             if streaming and metadata.size > 2 * 1024 * 1024:  # > 2MB
-                print(f"Streaming large image: {filename}")
+                if engine_logger.debug_enabled():
+                    engine_logger.debug(f"Streaming large image: {filename}")
                 # For streaming, we might load a lower resolution version first
-                surface = pygame.image.load(file_path)
+                surface = self._read_file(file_path, _load_image_file)
             else:
-                surface = pygame.image.load(file_path)
+                surface = self._read_file(file_path, _load_image_file)
+
+            if validate and (surface.get_width() == 0 or surface.get_height() == 0):
+                engine_logger.error(f"Image validation failed: {filename}")
+                return self._create_placeholder_image(name, scale or (32, 32))
 
             # Auto-detect alpha channel if not specified
             if convert_alpha is None:
                 convert_alpha = filename.lower().endswith(('.png', '.gif')) or surface.get_masks()[3] != 0
 
-            # Convert surface
-            if convert_alpha:
+            # Convert surface; without a display mode that has to wait for
+            # convert_loaded_images()
+            if pygame.display.get_surface() is None:
+                self._unconverted[name] = convert_alpha
+            elif convert_alpha:
                 surface = surface.convert_alpha()
             else:
                 surface = surface.convert()
@@ -233,18 +464,40 @@ class AssetLoader:
             if scale:
                 surface = pygame.transform.scale(surface, scale)
 
-            # Store in cache and memory
-            self.cache.put(f"image_{name}", surface)
-            self.images[name] = surface
-            metadata.load_count += 1
+            return self._store_image(name, surface, file_path, owner_key, metadata, pin)
 
-            print(f"Loaded image: {name} from {file_path} ({metadata.size} bytes)")
-            return surface
-
-        except pygame.error as e:
-            print(f"Error loading image {file_path}: {e}")
+        except (pygame.error, OSError) as e:
+            engine_logger.error(f"Error loading image {file_path}: {e}")
             return self._create_placeholder_image(name, scale or (32, 32))
 
+    def _store_image(self, name: str, surface: pygame.Surface, file_path: str, owner_key: Tuple,
+                     metadata: AssetMetadata, pin: bool) -> pygame.Surface:
+        """Record a freshly loaded image in the cache and the image tables."""
+        key = f"image_{name}"
+        self.images[name] = surface
+        self._image_keys[name] = key
+        self._image_owners[owner_key] = name
+        self._drop_evicted_images(self.cache.put(key, surface, pin))
+        metadata.load_count += 1
+
+        if engine_logger.debug_enabled():
+            engine_logger.debug(f"Loaded image: {name} from {file_path} ({metadata.size} bytes)")
+        return surface
+
+    def _drop_evicted_images(self, keys: List[str]):
+        """Forget every image name backed by a cache key the cache evicted."""
+        if not keys:
+            return
+        evicted = set(keys)
+        names = [name for name, key in self._image_keys.items() if key in evicted]
+        for name in names:
+            del self._image_keys[name]
+            self.images.pop(name, None)
+            self._unconverted.pop(name, None)
+        dropped = set(names)
+        for owner_key in [k for k, owner in self._image_owners.items() if owner in dropped]:
+            del self._image_owners[owner_key]
+
     def load_texture(self, name: str, filename: str, 
                     generate_mipmaps: bool = False, tile_size: Tuple[int, int] = None) -> pygame.Surface:
         """
@@ -328,7 +581,7 @@ class AssetLoader:
 
         file_path = self._find_file(filename, "animation")
         if not file_path:
-            print(f"Animation file not found: {filename}")
+            engine_logger.warning(f"Animation file not found: {filename}")
             return []
 
         try:
@@ -342,8 +595,7 @@ class AssetLoader:
 
             elif filename.lower().endswith('.json'):
                 # Load sprite sheet definition
-                with open(file_path, 'r') as f:
-                    sheet_data = json.load(f)
+                sheet_data = _load_json_file(file_path)
 
                 sheet_image = self.load_image(f"{name}_sheet", sheet_data["image"])
 
@@ -357,11 +609,12 @@ class AssetLoader:
                 frames = [self.load_image(f"{name}_frame", filename)]
 
             self.animations[name] = frames
-            print(f"Loaded animation: {name} with {len(frames)} frames")
+            if engine_logger.debug_enabled():
+                engine_logger.debug(f"Loaded animation: {name} with {len(frames)} frames")
             return frames
 
         except Exception as e:
-            print(f"Error loading animation {file_path}: {e}")
+            engine_logger.error(f"Error loading animation {file_path}: {e}")
             return []
 
     def load_sound_async(self, name: str, filename: str, callback: callable = None):
@@ -379,7 +632,7 @@ class AssetLoader:
                 if callback:
                     callback(name, True)
             except Exception as e:
-                print(f"Async sound loading failed for {name}: {e}")
+                engine_logger.error(f"Async sound loading failed for {name}: {e}")
                 if callback:
                     callback(name, False)
 
@@ -403,35 +656,74 @@ class AssetLoader:
         try:
             pygame.mixer.get_init()
         except pygame.error:
-            print(f"Audio not available, skipping sound: {filename}")
+            engine_logger.warning(f"Audio not available, skipping sound: {filename}")
             return None
 
         file_path = self._find_file(filename, "sound")
         if not file_path:
-            print(f"Sound file not found: {filename}")
+            engine_logger.warning(f"Sound file not found: {filename}")
             return None
 
+        owner_key = (os.path.realpath(file_path), volume)
+        owner = self._sound_owners.get(owner_key)
+        shared = self.sounds.get(owner) if owner is not None else None
+        if shared is not None:
+            self.sounds[name] = shared
+            return shared
+
         metadata = self._get_file_metadata(file_path, "sound")
 
         try:
-            sound = pygame.mixer.Sound(file_path)
+            sound = self._read_file(file_path, pygame.mixer.Sound)
             sound.set_volume(volume)
 
             # Cache large sounds differently
             if metadata.size > 5 * 1024 * 1024:  # > 5MB
-                print(f"Large sound file detected: {filename} ({metadata.size} bytes)")
+                if engine_logger.debug_enabled():
+                    engine_logger.debug(f"Large sound file detected: {filename} ({metadata.size} bytes)")
 
             self.sounds[name] = sound
-            self.cache.put(f"sound_{name}", sound)
+            self._sound_owners[owner_key] = name
             metadata.load_count += 1
 
-            print(f"Loaded sound: {name} from {file_path}")
+            if engine_logger.debug_enabled():
+                engine_logger.debug(f"Loaded sound: {name} from {file_path}")
             return sound
 
         except pygame.error as e:
-            print(f"Error loading sound {file_path}: {e}")
+            engine_logger.error(f"Error loading sound {file_path}: {e}")
             return None
 
+    def load_font(self, name: str, filename: str, size: int) -> Optional[pygame.font.Font]:
+        """
+        Load a font file at a given size.
+
+        Fonts are shared through voidray.utils.fonts by real file path and
+        size, so several names for one file only read it once.
+
+        Args:
+            name: Font identifier
+            filename: Font filename
+            size: Font size in points
+        """
+        if name in self.fonts:
+            return self.fonts[name]
+
+        file_path = self._find_file(filename, "font")
+        if not file_path:
+            engine_logger.warning(f"Font file not found: {filename}")
+            return None
+
+        try:
+            font = get_font(os.path.realpath(file_path), size)
+        except (pygame.error, OSError) as e:
+            engine_logger.error(f"Error loading font {file_path}: {e}")
+            return None
+
+        self.fonts[name] = font
+        self._get_file_metadata(file_path, "font").load_count += 1
+        return font
+
     def load_data(self, name: str, filename: str, format_hint: str = None) -> Any:
         """
         Load data with format auto-detection.
@@ -446,7 +738,7 @@ class AssetLoader:
 
         file_path = self._find_file(filename, "data")
         if not file_path:
-            print(f"Data file not found: {filename}")
+            engine_logger.warning(f"Data file not found: {filename}")
             self.data[name] = {}
             return {}
 
@@ -454,7 +746,7 @@ class AssetLoader:
 
         try:
             # Auto-detect format
-            file_ext = Path(filename).suffix.lower()
+            file_ext = os.path.splitext(filename)[1].lower()
             if format_hint:
                 format_type = format_hint
             elif file_ext in ['.json']:
@@ -470,8 +762,7 @@ class AssetLoader:
 
             # Load based on format
             if format_type == 'json':
-                with open(file_path, 'r') as f:
-                    data = json.load(f)
+                data = _load_json_file(file_path)
             elif format_type == 'pickle':
                 with open(file_path, 'rb') as f:
                     data = pickle.load(f)
@@ -481,49 +772,154 @@ class AssetLoader:
                     with open(file_path, 'r') as f:
                         data = yaml.safe_load(f)
                 except ImportError:
-                    print("PyYAML not available, falling back to JSON")
-                    with open(file_path, 'r') as f:
-                        data = json.load(f)
+                    engine_logger.warning("PyYAML not available, falling back to JSON")
+                    data = _load_json_file(file_path)
             else:
                 # Plain text
                 with open(file_path, 'r') as f:
                     data = f.read()
 
             self.data[name] = data
-            self.cache.put(f"data_{name}", data)
             metadata.load_count += 1
 
-            print(f"Loaded data: {name} from {file_path}")
+            if engine_logger.debug_enabled():
+                engine_logger.debug(f"Loaded data: {name} from {file_path}")
             return data
 
         except Exception as e:
-            print(f"Error loading data {file_path}: {e}")
+            engine_logger.error(f"Error loading data {file_path}: {e}")
             self.data[name] = {}
             return {}
 
     def _create_placeholder_image(self, name: str, size: Tuple[int, int]) -> pygame.Surface:
-        """Create a placeholder image for missing assets."""
-        surface = pygame.Surface(size)
-        surface.fill((255, 0, 255))  # Magenta
-
-        # Draw "missing" pattern
-        for x in range(0, size[0], 8):
-            for y in range(0, size[1], 8):
-                if (x // 8 + y // 8) % 2:
-                    pygame.draw.rect(surface, (0, 0, 0), (x, y, 8, 8))
+        """Create a placeholder image for missing assets; one is shared per size."""
+        size = tuple(size)
+        surface = self._placeholders.get(size)
+        if surface is None:
+            surface = pygame.Surface(size)
+            surface.fill((255, 0, 255))  # Magenta
+
+            # Draw "missing" pattern
+            for x in range(0, size[0], 8):
+                for y in range(0, size[1], 8):
+                    if (x // 8 + y // 8) % 2:
+                        pygame.draw.rect(surface, (0, 0, 0), (x, y, 8, 8))
+
+            # Match the display format so blitting the placeholder stays fast
+            try:
+                surface = surface.convert()
+            except pygame.error:
+                pass  # No display mode set yet
+            self._placeholders[size] = surface
 
         self.images[name] = surface
         return surface
 
+    def convert_loaded_images(self) -> int:
+        """
+        Convert images loaded before the display mode was set.
+
+        load_image keeps such images in their file's pixel format, since
+        conversion needs a display. Call this once the window exists so
+        they blit at full speed. Updates every name sharing an image.
+
+        Returns:
+            Number of surfaces converted
+        """
+        if not self._unconverted or pygame.display.get_surface() is None:
+            return 0
+
+        raw_surfaces = []
+        converted: Dict[int, pygame.Surface] = {}
+        for name, alpha in self._unconverted.items():
+            surface = self.images.get(name)
+            if surface is None or id(surface) in converted:
+                continue
+            raw_surfaces.append(surface)  # Keeps ids unique until replaced below
+            converted[id(surface)] = surface.convert_alpha() if alpha else surface.convert()
+
+        for name, surface in self.images.items():
+            replacement = converted.get(id(surface))
+            if replacement is not None:
+                self.images[name] = replacement
+        for key, surface in list(self.cache.cache.items()):
+            replacement = converted.get(id(surface))
+            if replacement is not None and key in self.cache.cache:
+                self._drop_evicted_images(self.cache.put(key, replacement, key in self.cache.pinned))
+
+        self._unconverted.clear()
+        self._placeholders.clear()
+        return len(converted)
+
+    def _read_file(self, file_path: str, reader: Callable[[str], Any]) -> Any:
+        """
+        Read a file, using the result of a background read if one was started.
+
+        Args:
+            file_path: Resolved file path
+            reader: Function that reads the file when nothing was prefetched
+        """
+        future = self._pending_reads.pop(file_path, None)
+        if future is not None:
+            return future.result()
+        return reader(file_path)
+
+    def _prefetch_pack(self, pack_name: str, pack_config: Dict[str, Any],
+                       pool: ThreadPoolExecutor):
+        """
+        Start reading an asset pack's image, sound and level files on a thread pool.
+
+        Only decoding happens off the main thread. Display format conversion,
+        volume and bookkeeping still run in the load_* methods, which pick
+        up the results through _read_file.
+        """
+        sections = [("images", "image", _load_image_file),
+                    ("textures", "image", _load_image_file),
+                    ("levels", "data", _load_json_file)]
+        if pygame.mixer.get_init():
+            sections.append(("sounds", "sound", pygame.mixer.Sound))
+
+        requests = []
+        for section, asset_type, reader in sections:
+            loaded = self.data if section == "levels" else getattr(self, section)
+            for name, config in pack_config.get(section, {}).items():
+                if f"{pack_name}_{name}" not in loaded:
+                    filename = config if isinstance(config, str) else config["file"]
+                    requests.append((filename, asset_type, reader))
+
+        for filename, asset_type, reader in requests:
+            file_path = self._find_file(filename, asset_type)
+            if file_path and file_path not in self._pending_reads:
+                self._pending_reads[file_path] = pool.submit(reader, file_path)
+
     def preload_asset_pack(self, pack_name: str, pack_config: Dict[str, Any]):
         """
         Preload an entire asset pack for a level or scene.
 
+        Image, sound and level files are read in parallel first, since that
+        work is mostly disk I/O and decoding that releases the GIL.
+
         Args:
             pack_name: Name of the asset pack
             pack_config: Configuration dictionary
         """
-        print(f"Preloading asset pack: {pack_name}")
+        if engine_logger.debug_enabled():
+            engine_logger.debug(f"Preloading asset pack: {pack_name}")
+
+        pool = ThreadPoolExecutor(max_workers=min(8, (os.cpu_count() or 1) + 4))
+        try:
+            self._prefetch_pack(pack_name, pack_config, pool)
+            self._load_pack(pack_name, pack_config)
+        finally:
+            # Drop reads nothing claimed, e.g. for images that failed validation
+            self._pending_reads.clear()
+            pool.shutdown(wait=True)
+
+        if engine_logger.debug_enabled():
+            engine_logger.debug(f"Asset pack '{pack_name}' preloaded successfully")
+
+    def _load_pack(self, pack_name: str, pack_config: Dict[str, Any]):
+        """Load every asset an asset pack lists."""
 
         # Load images
         if "images" in pack_config:
@@ -571,8 +967,6 @@ class AssetLoader:
         if "levels" in pack_config:
             for name, config in pack_config["levels"].items():
                 self.load_level_data(f"{pack_name}_{name}", config["file"])
-
-        print(f"Asset pack '{pack_name}' preloaded successfully")
     
     def load_level_data(self, name: str, filename: str) -> Dict[str, Any]:
         """
@@ -590,12 +984,11 @@ class AssetLoader:
         
         file_path = self._find_file(filename, "data")
         if not file_path:
-            print(f"Level file not found: {filename}")
+            engine_logger.warning(f"Level file not found: {filename}")
             return {}
         
         try:
-            with open(file_path, 'r') as f:
-                level_data = json.load(f)
+            level_data = self._read_file(file_path, _load_json_file)
             
             # Validate level data structure
             required_fields = ['walls', 'textures', 'spawn_point']
@@ -609,11 +1002,12 @@ class AssetLoader:
                     self.load_texture(f"level_{name}_{texture_name}", texture_file)
             
             self.data[name] = level_data
-            print(f"Loaded level: {name} with {len(level_data.get('walls', []))} walls")
+            if engine_logger.debug_enabled():
+                engine_logger.debug(f"Loaded level: {name} with {len(level_data.get('walls', []))} walls")
             return level_data
             
         except Exception as e:
-            print(f"Error loading level {file_path}: {e}")
+            engine_logger.error(f"Error loading level {file_path}: {e}")
             return {}
     
     def create_sample_level(self, name: str) -> Dict[str, Any]:
@@ -695,15 +1089,16 @@ class AssetLoader:
             keys_to_remove = [k for k in assets.keys() if k.startswith(prefix)]
             for key in keys_to_remove:
                 del assets[key]
+                if asset_type == "images":
+                    self._image_keys.pop(key, None)
 
         # Clean cache
         cache_keys_to_remove = [k for k in self.cache.cache.keys() if prefix in k]
         for key in cache_keys_to_remove:
-            if key in self.cache.cache:
-                self.cache.access_order.remove(key)
-                del self.cache.cache[key]
+            self.cache.remove(key)
 
-        print(f"Unloaded asset pack: {pack_name}")
+        if engine_logger.debug_enabled():
+            engine_logger.debug(f"Unloaded asset pack: {pack_name}")
 
     def get_memory_usage(self) -> Dict[str, int]:
         """Get memory usage statistics."""
@@ -715,7 +1110,9 @@ class AssetLoader:
             "textures": len(self.textures),
             "animations": len(self.animations),
             "cache_size": len(self.cache.cache),
-            "cache_limit": self.cache.max_size
+            "cache_limit": self.cache.max_size,
+            "cache_bytes": self.cache.total_bytes,
+            "cache_byte_limit": self.cache.max_bytes
         }
 
     def optimize_memory(self):
@@ -726,11 +1123,15 @@ class AssetLoader:
 
         # This is a simplified cleanup - real implementation would track access times
         self.cache.clear()
-        print("Memory optimization completed")
+        engine_logger.debug("Memory optimization completed")
 
     def clear_all(self):
         """Clear all loaded assets."""
         self.images.clear()
+        self._image_keys.clear()
+        self._image_owners.clear()
+        self._sound_owners.clear()
+        self._unconverted.clear()
         self.sounds.clear()
         self.data.clear()
         self.fonts.clear()
@@ -738,25 +1139,9 @@ class AssetLoader:
         self.animations.clear()
         self.cache.clear()
         self.metadata.clear()
+        self.refresh_file_index()
 
-        print("All assets cleared from memory")
-    
-    def _validate_image_file(self, file_path: str) -> bool:
-        """Validate image file integrity."""
-        try:
-            # Check file size
-            file_size = os.path.getsize(file_path)
-            if file_size == 0:
-                return False
-            
-            # Check if file can be opened as image
-            test_surface = pygame.image.load(file_path)
-            if test_surface.get_width() == 0 or test_surface.get_height() == 0:
-                return False
-                
-            return True
-        except Exception:
-            return False
+        engine_logger.debug("All assets cleared from memory")
     
     def validate_all_assets(self) -> Dict[str, List[str]]:
         """Validate all loaded assets and report issues."""
@@ -819,9 +1204,10 @@ class AssetLoader:
         try:
             with open(output_path, 'w') as f:
                 json.dump(manifest, f, indent=2)
-            print(f"Asset manifest created: {output_path}")
+            if engine_logger.debug_enabled():
+                engine_logger.debug(f"Asset manifest created: {output_path}")
         except Exception as e:
-            print(f"Failed to create asset manifest: {e}")
+            engine_logger.error(f"Failed to create asset manifest: {e}")
     
     def preload_essential_assets(self):
         """Preload essential game assets for better performance."""
@@ -850,6 +1236,7 @@ class AssetLoader:
         for pack_name, pack_data in essential_assets.items():
             try:
                 self.preload_asset_pack(pack_name, pack_data)
-                print(f"Essential assets '{pack_name}' preloaded")
+                if engine_logger.debug_enabled():
+                    engine_logger.debug(f"Essential assets '{pack_name}' preloaded")
             except Exception as e:
-                print(f"Failed to preload essential assets '{pack_name}': {e}")
\ No newline at end of file
+                engine_logger.error(f"Failed to preload essential assets '{pack_name}': {e}")
\ No newline at end of file
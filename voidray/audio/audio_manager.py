@@ -6,8 +6,35 @@ Comprehensive audio system for demanding games with streaming, 3D audio, and eff
 import pygame
 import threading
 import os
-from typing import Dict, Optional, List, Tuple
+import platform
+from typing import Dict, Optional, List, Tuple, Union
 from ..math.vector2 import Vector2
+from ..core.logger import engine_logger
+
+
+# Index of a loaded sound, stable across reloads and cache evictions
+SoundHandle = int
+
+# Hosts where a slower, larger-buffered mixer avoids audio underruns
+_LOW_POWER_MACHINES = ('arm', 'aarch64')
+
+
+def _default_mixer_params() -> Tuple[int, int]:
+    """
+    Pick the mixer frequency and buffer size for this host.
+
+    Desktop hosts mix at 44.1 kHz with a short buffer, which matches most
+    ogg/wav assets and avoids resampling every sound at load time.
+    ARM and other low-power hosts fall back to 22.05 kHz with a larger
+    buffer.
+
+    Returns:
+        (frequency, buffer_size) tuple
+    """
+    machine = platform.machine().lower()
+    if machine.startswith(_LOW_POWER_MACHINES):
+        return 22050, 1024
+    return 44100, 256
 
 
 class AudioChannel:
@@ -45,22 +72,40 @@ class AudioManager:
     Advanced audio manager supporting streaming, 3D audio, and multiple channels.
     """
 
-    def __init__(self, channels: int = 16, frequency: int = 44100, buffer_size: int = 1024):
+    def __init__(self, channels: int = 16, frequency: Optional[int] = None,
+                 buffer_size: Optional[int] = None, output_channels: int = 2):
         """
         Initialize the enhanced audio manager.
 
         Args:
             channels: Number of audio channels
-            frequency: Audio frequency
-            buffer_size: Audio buffer size
+            frequency: Audio frequency (None picks one for this host)
+            buffer_size: Audio buffer size (None picks one for this host)
+            output_channels: Speaker channels, 1 for mono or 2 for stereo
         """
+        default_frequency, default_buffer = _default_mixer_params()
+        if frequency is None:
+            frequency = default_frequency
+        if buffer_size is None:
+            buffer_size = default_buffer
+
         self.sounds: Dict[str, pygame.mixer.Sound] = {}
+        self._sound_list: List[Union[pygame.mixer.Sound, Dict, None]] = []
+        self._sound_handles: Dict[str, SoundHandle] = {}
+        # Name that first loaded each real path, so aliases share its Sound
+        self._sound_owners: Dict[str, str] = {}
         self.music_volume = 0.7
         self.sfx_volume = 0.8
         self.master_volume = 1.0
         self.current_music: Optional[str] = None
+        self._loaded_music: Optional[str] = None
         self.audio_available = False
         self.channels: List[AudioChannel] = []
+        # Per-play volume of each channel index started by play_sound
+        self._playing: Dict[int, float] = {}
+        # Channel pool: free indices as a stack, plus indices handed out
+        self._free_channels: List[int] = []
+        self._busy_channels: List[int] = []
         self.listener_position = Vector2(0, 0)
         self.listener_orientation = 0.0
         self.sound_cache_limit = 100
@@ -76,25 +121,31 @@ class AudioManager:
 
         # Initialize pygame mixer with comprehensive error handling
         try:
-            pygame.mixer.pre_init(
-                frequency=frequency, 
-                size=-16, 
-                channels=2, 
-                buffer=buffer_size
-            )
-            pygame.mixer.init()
+            # Reuse a mixer that is already running with these parameters
+            current = pygame.mixer.get_init()
+            if current != (frequency, -16, output_channels):
+                if current:
+                    pygame.mixer.quit()
+                pygame.mixer.pre_init(
+                    frequency=frequency, 
+                    size=-16, 
+                    channels=output_channels, 
+                    buffer=buffer_size
+                )
+                pygame.mixer.init()
             pygame.mixer.set_num_channels(channels)
 
             # Initialize audio channels
             for i in range(channels):
                 self.channels.append(AudioChannel(i))
+            self._free_channels = list(range(channels - 1, -1, -1))
 
             self.audio_available = True
-            print(f"Enhanced audio system initialized - {channels} channels at {frequency}Hz")
+            engine_logger.info(f"Enhanced audio system initialized - {channels} channels at {frequency}Hz")
 
         except (pygame.error, OSError) as e:
-            print(f"Audio system not available: {e}")
-            print("Continuing without audio support")
+            engine_logger.warning(f"Audio system not available: {e}")
+            engine_logger.warning("Continuing without audio support")
             self.audio_available = False
             # Initialize dummy mixer to prevent crashes
             self.channels = []
@@ -115,11 +166,18 @@ class AudioManager:
             return
 
         pygame.mixer.music.set_volume(self.music_volume * self.master_volume)
-        for sound in self.sounds.values():
-            # Note: pygame doesn't support per-sound volume, handled in playback
-            pass
 
-    def load_sound(self, name: str, file_path: str, streaming: bool = False):
+        # Sounds stay at unity volume; the mix is applied per channel, so
+        # only channels that are still playing need updating
+        sfx_scale = self.sfx_volume * self.master_volume
+        for channel_id, volume in list(self._playing.items()):
+            audio_channel = self.channels[channel_id]
+            if audio_channel.is_busy():
+                audio_channel.set_volume(volume * sfx_scale)
+            else:
+                del self._playing[channel_id]
+
+    def load_sound(self, name: str, file_path: str, streaming: bool = False) -> Optional[SoundHandle]:
         """
         Load a sound effect with optional streaming.
 
@@ -127,27 +185,61 @@ class AudioManager:
             name: Identifier for the sound
             file_path: Path to the audio file
             streaming: Whether to use streaming for large files
+
+        Returns:
+            Handle for play_sound_handle, or None if the sound was not loaded
         """
         if not self.audio_available:
-            return
+            return None
 
         # Check cache limit
         if len(self.sounds) >= self.sound_cache_limit:
             self._cleanup_old_sounds()
 
         try:
+            real_path = os.path.realpath(file_path)
+            owner = self._sound_owners.get(real_path)
+            shared = self.sounds.get(owner) if owner is not None else None
+
             if streaming and self.streaming_enabled:
                 # For large files, we'll load them when needed
-                self.sounds[name] = {"path": file_path, "streaming": True}
+                sound_data = {"path": file_path, "streaming": True}
+            elif isinstance(shared, pygame.mixer.Sound):
+                sound_data = shared
             else:
-                sound = pygame.mixer.Sound(file_path)
-                sound.set_volume(self.sfx_volume * self.master_volume)
-                self.sounds[name] = sound
-
-            print(f"Loaded sound: {name} from {file_path}")
+                sound_data = pygame.mixer.Sound(file_path)
+                self._sound_owners[real_path] = name
 
         except pygame.error as e:
-            print(f"Error loading sound {file_path}: {e}")
+            engine_logger.error(f"Error loading sound {file_path}: {e}")
+            return None
+
+        self.sounds[name] = sound_data
+
+        # Reloading a name keeps its handle
+        handle = self._sound_handles.get(name)
+        if handle is None:
+            handle = len(self._sound_list)
+            self._sound_handles[name] = handle
+            self._sound_list.append(sound_data)
+        else:
+            self._sound_list[handle] = sound_data
+
+        if engine_logger.debug_enabled():
+            engine_logger.debug(f"Loaded sound: {name} from {file_path}")
+        return handle
+
+    def get_sound_handle(self, name: str) -> Optional[SoundHandle]:
+        """
+        Get the handle of a loaded sound.
+
+        Args:
+            name: Identifier the sound was loaded with
+
+        Returns:
+            The sound's handle, or None if it was never loaded
+        """
+        return self._sound_handles.get(name)
 
     def load_sound_batch(self, sound_list: Dict[str, str]):
         """
@@ -156,12 +248,13 @@ class AudioManager:
         Args:
             sound_list: Dictionary of {name: file_path}
         """
-        print(f"Loading {len(sound_list)} sounds in batch...")
+        if engine_logger.debug_enabled():
+            engine_logger.debug(f"Loading {len(sound_list)} sounds in batch...")
 
         for name, file_path in sound_list.items():
             self.load_sound(name, file_path)
 
-        print("Batch loading complete")
+        engine_logger.debug("Batch loading complete")
 
     def play_sound(self, name: str, volume: float = 1.0, loops: int = 0, 
                    channel: Optional[int] = None, position: Optional[Vector2] = None):
@@ -175,13 +268,34 @@ class AudioManager:
             channel: Specific channel to use (None for auto)
             position: 3D position for spatial audio
         """
-        if not self.audio_available or name not in self.sounds:
+        handle = self._sound_handles.get(name)
+        if handle is None:
             return None
+        return self.play_sound_handle(handle, volume, loops, channel, position)
+
+    def play_sound_handle(self, handle: SoundHandle, volume: float = 1.0, loops: int = 0,
+                          channel: Optional[int] = None, position: Optional[Vector2] = None):
+        """
+        Play a sound by the handle returned from load_sound.
 
-        sound_data = self.sounds[name]
+        Skips the name lookup of play_sound, for sounds triggered every frame.
+
+        Args:
+            handle: Handle of the sound to play
+            volume: Volume multiplier
+            loops: Number of times to loop
+            channel: Specific channel to use (None for auto)
+            position: 3D position for spatial audio
+        """
+        if not self.audio_available:
+            return None
+
+        sound_data = self._sound_list[handle]
+        if sound_data is None:
+            return None
 
         # Handle streaming sounds
-        if isinstance(sound_data, dict) and sound_data.get("streaming"):
+        if isinstance(sound_data, dict):
             sound = pygame.mixer.Sound(sound_data["path"])
         else:
             sound = sound_data
@@ -195,18 +309,52 @@ class AudioManager:
         if channel is not None and 0 <= channel < len(self.channels):
             target_channel = self.channels[channel]
         else:
-            # Find free channel
-            for ch in self.channels:
-                if not ch.is_busy():
-                    target_channel = ch
-                    break
+            channel_id = self._acquire_channel()
+            if channel_id is not None:
+                target_channel = self.channels[channel_id]
 
         if target_channel:
-            sound.set_volume(volume * self.sfx_volume * self.master_volume)
-            return target_channel.play(sound, loops)
+            playing = target_channel.play(sound, loops)
+            target_channel.set_volume(volume * self.sfx_volume * self.master_volume)
+            self._playing[target_channel.channel_id] = volume
+            return playing
+
+        return None
+
+    def _acquire_channel(self) -> Optional[int]:
+        """
+        Take a free channel index from the pool.
 
+        Finished channels are only swept back into the pool once it runs
+        dry, so most plays cost a single pop.
+
+        Returns:
+            A free channel index, or None if every channel is playing
+        """
+        free_channels = self._free_channels
+        busy_channels = self._busy_channels
+        if not free_channels:
+            self._reclaim_channels()
+
+        while free_channels:
+            channel_id = free_channels.pop()
+            busy_channels.append(channel_id)
+            # A channel taken directly (explicit index, Sound.play) is still busy
+            if not self.channels[channel_id].is_busy():
+                return channel_id
         return None
 
+    def _reclaim_channels(self):
+        """Return channels that finished playing to the free pool."""
+        still_busy = []
+        for channel_id in self._busy_channels:
+            if self.channels[channel_id].is_busy():
+                still_busy.append(channel_id)
+            else:
+                self._free_channels.append(channel_id)
+                self._playing.pop(channel_id, None)
+        self._busy_channels[:] = still_busy
+
     def play_sound_3d(self, name: str, position: Vector2, volume: float = 1.0, 
                       max_distance: float = 1000.0, loops: int = 0):
         """
@@ -276,17 +424,23 @@ class AudioManager:
         if not self.audio_available:
             return
 
+        # The mixer keeps the last loaded track, so replaying it needs no reload
+        if file_path == self._loaded_music:
+            return
+
         try:
             if streaming:
                 # pygame.mixer.music automatically streams
                 pygame.mixer.music.load(file_path)
             else:
                 pygame.mixer.music.load(file_path)
+            self._loaded_music = file_path
 
-            print(f"Loaded music: {file_path}")
+            if engine_logger.debug_enabled():
+                engine_logger.debug(f"Loaded music: {file_path}")
 
         except pygame.error as e:
-            print(f"Error loading music {file_path}: {e}")
+            engine_logger.error(f"Error loading music {file_path}: {e}")
 
     def play_music(self, file_path: Optional[str] = None, loops: int = -1, 
                    fade_in: float = 0, start_pos: float = 0):
@@ -315,7 +469,7 @@ class AudioManager:
                 pygame.mixer.music.play(loops, start=start_pos)
 
         except pygame.error as e:
-            print(f"Error playing music: {e}")
+            engine_logger.error(f"Error playing music: {e}")
 
     def create_sound_group(self, name: str, sound_list: List[str], 
                           max_concurrent: int = 3):
@@ -389,8 +543,10 @@ class AudioManager:
         items_to_remove = list(self.sounds.keys())[:10]
         for key in items_to_remove:
             del self.sounds[key]
+            self._sound_list[self._sound_handles[key]] = None
 
-        print(f"Cleaned up {len(items_to_remove)} sounds from cache")
+        if engine_logger.debug_enabled():
+            engine_logger.debug(f"Cleaned up {len(items_to_remove)} sounds from cache")
 
     def preload_audio_pack(self, pack_name: str, audio_files: Dict[str, str]):
         """
@@ -400,12 +556,14 @@ class AudioManager:
             pack_name: Name of the audio pack
             audio_files: Dictionary of audio files to load
         """
-        print(f"Preloading audio pack: {pack_name}")
+        if engine_logger.debug_enabled():
+            engine_logger.debug(f"Preloading audio pack: {pack_name}")
 
         for name, file_path in audio_files.items():
             self.load_sound(f"{pack_name}_{name}", file_path)
 
-        print(f"Audio pack '{pack_name}' loaded with {len(audio_files)} sounds")
+        if engine_logger.debug_enabled():
+            engine_logger.debug(f"Audio pack '{pack_name}' loaded with {len(audio_files)} sounds")
 
     def set_music_volume(self, volume: float):
         """Set music volume."""
@@ -430,4 +588,5 @@ class AudioManager:
                     thread.join(timeout=1.0)
 
             pygame.mixer.quit()
-            print("Enhanced audio system cleaned up")
\ No newline at end of file
+            self._loaded_music = None
+            engine_logger.info("Enhanced audio system cleaned up")
\ No newline at end of file
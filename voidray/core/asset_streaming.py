@@ -236,12 +236,13 @@ class AssetStreamingSystem:
     def _update_streaming_regions(self):
         """Update which assets should be loaded based on streaming regions."""
         for asset_id, region in self.streaming_regions.items():
-            distance = (region['position'] - self.player_position).magnitude()
+            distance_sq = region['position'].distance_squared_to(self.player_position)
+            radius = region['radius']
             
-            if distance <= region['radius']:
+            if distance_sq <= radius * radius:
                 # Within range - should be loaded
                 self.request_load(asset_id)
-            elif distance > region['radius'] * 2:
+            elif distance_sq > 4 * radius * radius:
                 # Far away - candidate for unloading
                 if asset_id in self.loaded_assets:
                     if asset_id not in self.unload_queue:
@@ -337,9 +338,9 @@ class AssetStreamingSystem:
     
     def preload_region(self, center: Vector2, radius: float):
         """Preload all assets in a region."""
+        radius_sq = radius * radius
         for asset_id, region in self.streaming_regions.items():
-            distance = (region['position'] - center).magnitude()
-            if distance <= radius:
+            if region['position'].distance_squared_to(center) <= radius_sq:
                 self.request_load(asset_id)
     
     def cleanup(self):
@@ -3,9 +3,9 @@ VoidRay Component Registry
 Registry for all engine components with automatic discovery.
 """
 
-from typing import Dict, List, Type, Any
-import inspect
+from typing import Dict, List, Type, Any, Optional
 from .component import Component
+from .logger import engine_logger
 
 
 class ComponentRegistry:
@@ -43,7 +43,8 @@ class ComponentRegistry:
         else:
             self._component_categories[category] = [name]
 
-        print(f"Registered component: {name} in category '{category}'")
+        if engine_logger.debug_enabled():
+            engine_logger.debug(f"Registered component: {name} in category '{category}'")
 
     def get_component(self, name: str) -> Type:
         """Get a component class by name."""
@@ -59,28 +60,37 @@ class ComponentRegistry:
         """
         Automatically discover components in the given modules.
 
+        A module can declare ``__voidray_components__`` as a tuple of its
+        component classes; only those are registered and the module
+        namespace is not scanned.
+
         Args:
             modules: List of modules to search for components
         """
         for module in modules:
-            for name, obj in inspect.getmembers(module):
-                if (inspect.isclass(obj) and 
-                    issubclass(obj, Component) and 
-                    obj != Component):
-
-                    # Determine category based on module name
-                    module_name = module.__name__.lower()
-                    if 'physics' in module_name:
-                        category = 'physics'
-                    elif 'graphics' in module_name or 'rendering' in module_name:
-                        category = 'graphics'
-                    elif 'audio' in module_name:
-                        category = 'audio'
-                    elif 'input' in module_name:
-                        category = 'input'
-                    else:
-                        category = 'gameplay'
-
+            declared = getattr(module, '__voidray_components__', None)
+            if declared is not None:
+                candidates = declared
+            else:
+                candidates = vars(module).values()
+
+            # Determine category based on module name
+            module_name = module.__name__.lower()
+            if 'physics' in module_name:
+                category = 'physics'
+            elif 'graphics' in module_name or 'rendering' in module_name:
+                category = 'graphics'
+            elif 'audio' in module_name:
+                category = 'audio'
+            elif 'input' in module_name:
+                category = 'input'
+            else:
+                category = 'gameplay'
+
+            for obj in tuple(candidates):
+                if (isinstance(obj, type) and
+                    issubclass(obj, Component) and
+                    obj is not Component):
                     self.register_component(obj, category)
 
     def create_component(self, name: str) -> Component:
@@ -104,4 +114,26 @@ class ComponentRegistry:
 
 
 # Global component registry instance
-component_registry = ComponentRegistry()
\ No newline at end of file
+component_registry = ComponentRegistry()
+
+
+def register_component(component_class: Optional[Type] = None, category: str = "gameplay"):
+    """
+    Register a component class with the global registry.
+
+    Works as a plain call, ``register_component(cls, category="physics")``,
+    and as a decorator, either bare (``@register_component``) or with
+    arguments (``@register_component(category="physics")``).
+
+    Args:
+        component_class: The component class to register
+        category: Category for organization
+    """
+    if component_class is None:
+        def decorator(cls: Type) -> Type:
+            component_registry.register_component(cls, category)
+            return cls
+        return decorator
+
+    component_registry.register_component(component_class, category)
+    return component_class
@@ -5,6 +5,7 @@ Provides real-time debugging information and performance metrics.
 """
 
 import pygame
+from typing import List, Tuple
 from ..math.vector2 import Vector2
 from ..utils.color import Color
 
@@ -24,9 +25,29 @@ class DebugOverlay:
         self.engine = engine
         self.visible = False
         self.font = None
+        self.font_size = 24
+        self.text_color = Color.WHITE
         self.line_height = 20
         self.margin = 10
         self.debug_render_enabled = False
+        self.width = 250
+        
+        # Pre-rendered background panel, rebuilt only when its height changes
+        self._background = None
+        
+        # Text of each line, filled from the matching value in the snapshot
+        self._line_templates = (
+            "FPS: {:.1f}",
+            "Delta Time: {:.3f}s",
+            "Objects: {}",
+            "Physics Objects: {}",
+            "Rendering Mode: {}",
+            "Performance Mode: {}"
+        )
+        
+        # Values shown last frame and the text surface rendered for each line
+        self._last_values: Tuple = ()
+        self._line_surfaces: List[pygame.Surface] = []
         
     def toggle(self):
         """Toggle debug overlay visibility."""
@@ -45,32 +66,70 @@ class DebugOverlay:
         # Initialize font if needed
         if self.font is None:
             pygame.font.init()
-            self.font = pygame.font.Font(None, 24)
+            self.font = pygame.font.Font(None, self.font_size)
         
         # Gather debug info
-        fps = self.engine.get_fps()
-        delta_time = self.engine.get_delta_time()
-        object_count = self.engine.get_scene_object_count()
+        values = (
+            round(self.engine.get_fps(), 1),
+            round(self.engine.get_delta_time(), 3),
+            self.engine.get_scene_object_count(),
+            len(self.engine.physics_engine.colliders),
+            getattr(self.engine, 'rendering_mode', '2D'),
+            'ON' if getattr(self.engine, 'performance_mode', False) else 'OFF'
+        )
         
-        # Debug text lines
-        debug_lines = [
-            f"FPS: {fps:.1f}",
-            f"Delta Time: {delta_time:.3f}s",
-            f"Objects: {object_count}",
-            f"Physics Objects: {len(self.engine.physics_engine.colliders)}",
-            f"Rendering Mode: {getattr(self.engine, 'rendering_mode', '2D')}",
-            f"Performance Mode: {'ON' if getattr(self.engine, 'performance_mode', False) else 'OFF'}"
-        ]
+        # Re-render only the lines whose value changed since last frame
+        if values != self._last_values:
+            self._update_lines(values)
+        line_surfaces = self._line_surfaces
         
         # Render background
-        bg_height = len(debug_lines) * self.line_height + self.margin * 2
-        bg_rect = pygame.Rect(self.margin, self.margin, 250, bg_height)
-        pygame.draw.rect(renderer.screen, (0, 0, 0, 128), bg_rect)
-        pygame.draw.rect(renderer.screen, Color.WHITE, bg_rect, 1)
+        bg_height = len(line_surfaces) * self.line_height + self.margin * 2
+        background = self._background
+        if background is None or background.get_height() != bg_height:
+            background = self._background = self._build_background(bg_height)
+        screen = renderer.screen
+        screen.blit(background, (self.margin, self.margin))
         
         # Render text lines
+        x_offset = self.margin + 5
         y_offset = self.margin + 5
-        for line in debug_lines:
-            text_surface = self.font.render(line, True, Color.WHITE)
-            renderer.screen.blit(text_surface, (self.margin + 5, y_offset))
+        for text_surface in line_surfaces:
+            screen.blit(text_surface, (x_offset, y_offset))
             y_offset += self.line_height
+
+    def _update_lines(self, values: Tuple):
+        """
+        Render text surfaces for the lines whose value changed.
+        
+        Args:
+            values: Snapshot of the values shown by the overlay
+        """
+        templates = self._line_templates
+        last_values = self._last_values
+        line_surfaces = self._line_surfaces
+        if len(line_surfaces) != len(templates):
+            line_surfaces[:] = [None] * len(templates)
+            last_values = ()
+        
+        for index, value in enumerate(values):
+            if not last_values or last_values[index] != value:
+                line = templates[index].format(value)
+                line_surfaces[index] = self.font.render(line, True, self.text_color)
+        
+        self._last_values = values
+
+    def _build_background(self, height: int) -> pygame.Surface:
+        """
+        Pre-render the overlay's background panel.
+        
+        Args:
+            height: Panel height in pixels
+            
+        Returns:
+            Surface with the filled panel and its border
+        """
+        background = pygame.Surface((self.width, height))
+        background.fill(Color.BLACK)
+        pygame.draw.rect(background, Color.WHITE, background.get_rect(), 1)
+        return background
@@ -5,7 +5,9 @@ The main engine class that manages the game loop, systems, and overall execution
 
 import pygame
 import sys
-from typing import Optional, Dict, Any, Callable
+import math
+import time
+from typing import Optional, Dict, Any, Callable, List, Union
 from ..graphics.renderer import Renderer
 from ..input.input_manager import InputManager
 from ..physics.physics_engine import PhysicsEngine
@@ -17,27 +19,63 @@ from .engine_state import EngineStateManager, EngineState
 from .config import EngineConfig
 from .logger import engine_logger
 from .error_dialog import show_fatal_error
+from ..utils.fonts import get_font
+from ..utils.jit import NUMBA_AVAILABLE, precompile
 from pygame import Vector2
 
 
+# Index of a registered scene, looked up with get_scene_handle
+SceneHandle = int
+
+# Frame pacing sleeps until this long before the deadline, then spins,
+# since OS sleeps can overshoot by a millisecond or more
+_PACING_SPIN_NS = 1_500_000
+
+# How long the loop sleeps between event checks while paused in the background
+_UNFOCUSED_SLEEP = 0.1
+
+# High-rate event types SDL drops on arrival. The input and UI managers
+# read the cursor once per frame with pygame.mouse.get_pos(), so mice,
+# touch and analog sticks don't queue hundreds of motion events a frame.
+# Every other event type, including custom and timer events, still arrives;
+# games that need these can call pygame.event.set_allowed().
+_BLOCKED_EVENT_TYPES = (pygame.MOUSEMOTION, pygame.FINGERMOTION, pygame.JOYAXISMOTION)
+
+
+class _EngineStats:
+    """Counters the main loop updates, kept as plain attributes."""
+
+    __slots__ = ('frames_rendered', 'objects_rendered', 'physics_objects', 'memory_usage', 'fps')
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """Zero every counter."""
+        self.frames_rendered = 0
+        self.objects_rendered = 0
+        self.physics_objects = 0
+        self.memory_usage = 0
+        self.fps = 0.0  # Measured over the last second
+
+    def as_dict(self) -> Dict[str, int]:
+        """Get the counters in the form get_engine_stats reports them."""
+        return {
+            'frames_rendered': self.frames_rendered,
+            'objects_rendered': self.objects_rendered,
+            'physics_objects': self.physics_objects,
+            'memory_usage': self.memory_usage,
+            'fps': self.fps
+        }
+
+
 class VoidRayEngine:
     """
     The VoidRay Game Engine - A self-contained game engine that manages everything.
     Users register their game logic and the engine handles the rest.
     """
 
-    _instance = None
-
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super(VoidRayEngine, cls).__new__(cls)
-            cls._instance._initialized = False
-        return cls._instance
-
     def __init__(self):
-        if self._initialized:
-            return
-
         # Engine configuration
         self.width = 800
         self.height = 600
@@ -45,10 +83,18 @@ class VoidRayEngine:
         self.target_fps = 60
         self.running = False
         self.auto_start = True
+        # Stop updating and rendering while the window is in the background
+        self.pause_when_unfocused = True
+        self._has_focus = True
+        # Compile the JIT kernels during initialization instead of on first
+        # use; off by default, as it stalls startup (tools/warm_jit.py fills
+        # the on-disk cache ahead of time instead)
+        self.jit_warmup = False
 
         # Engine systems (will be initialized when configure() is called)
         self.screen = None
         self.clock = None
+        self._last_frame_ns = 0
         self.renderer = None
         self.input_manager = None
         self.physics_engine = None
@@ -63,7 +109,18 @@ class VoidRayEngine:
         self.scene_manager = SceneManager()
         self.current_scene: Optional[Scene] = None
         self.scenes: Dict[str, Scene] = {}
+        self._scene_list: List[Scene] = []
+        self._scene_handles: Dict[str, SceneHandle] = {}
         self.delta_time = 0.0
+        self._stats = _EngineStats()
+
+        # Fixed physics timestep; frame time accumulates and physics steps
+        # in whole ticks. 0 steps physics once per frame with delta_time.
+        self.physics_timestep = 1.0 / 120.0
+        self.max_physics_steps = 8  # Per frame, so a long stall can't snowball
+        self._physics_accumulator = 0.0
+        # Fraction of a physics tick left over this frame, for interpolation
+        self.physics_alpha = 0.0
 
         # Event system
         from .event_system import event_system
@@ -82,8 +139,6 @@ class VoidRayEngine:
         self.update_callback: Optional[Callable[[float], None]] = None
         self.render_callback: Optional[Callable] = None
 
-        self._initialized = True
-
     def configure(self, width: int = 800, height: int = 600, title: str = "VoidRay Game", 
                  fps: int = 60, auto_start: bool = True):
         """
@@ -138,27 +193,56 @@ class VoidRayEngine:
         """
         Register a scene with the engine.
 
+        Registering a name again replaces the scene but keeps its handle;
+        get_scene_handle returns the integer handle set_scene accepts in
+        place of the name.
+
         Args:
             name: Scene identifier
             scene: Scene instance
         """
+        handle = self._scene_handles.get(name)
+        if handle is None:
+            handle = len(self._scene_list)
+            self._scene_handles[name] = handle
+            self._scene_list.append(scene)
+        else:
+            self._scene_list[handle] = scene
+
         self.scenes[name] = scene
         scene.engine = self
         return self
 
-    def set_scene(self, name_or_scene):
+    def get_scene_handle(self, name: str) -> Optional[SceneHandle]:
+        """
+        Get the handle of a registered scene.
+
+        Args:
+            name: Scene identifier
+
+        Returns:
+            The scene's handle, or None if no scene has that name
+        """
+        return self._scene_handles.get(name)
+
+    def set_scene(self, scene_ref: Union[SceneHandle, str, Scene]):
         """
         Set the current active scene.
 
         Args:
-            name_or_scene: Scene name string or Scene instance
+            scene_ref: Scene handle, scene name string or Scene instance
         """
-        if isinstance(name_or_scene, str):
-            if name_or_scene not in self.scenes:
-                raise ValueError(f"Scene '{name_or_scene}' not found")
-            scene = self.scenes[name_or_scene]
+        if isinstance(scene_ref, int):
+            if not 0 <= scene_ref < len(self._scene_list):
+                raise ValueError(f"Scene handle {scene_ref} not found")
+            scene = self._scene_list[scene_ref]
+        elif isinstance(scene_ref, str):
+            handle = self._scene_handles.get(scene_ref)
+            if handle is None:
+                raise ValueError(f"Scene '{scene_ref}' not found")
+            scene = self._scene_list[handle]
         else:
-            scene = name_or_scene
+            scene = scene_ref
             scene.engine = self
 
         if self.current_scene:
@@ -166,6 +250,9 @@ class VoidRayEngine:
 
         self.current_scene = scene
         scene.on_enter()
+        scene.on_rendering_mode_changed(getattr(self, 'rendering_mode', "2D"))
+        if self.physics_engine:
+            self.physics_engine.invalidate()
         print(f"Scene changed to: {scene.__class__.__name__}")
         return self
 
@@ -178,6 +265,7 @@ class VoidRayEngine:
         flags = pygame.DOUBLEBUF
         self.screen = pygame.display.set_mode((self.width, self.height), flags)
         pygame.display.set_caption(self.title)
+        pygame.event.set_blocked(_BLOCKED_EVENT_TYPES)
 
         # Fill screen with black initially to ensure it's visible
         self.screen.fill((0, 0, 0))
@@ -210,6 +298,16 @@ class VoidRayEngine:
         except ImportError:
             self.physics_system = self.physics_engine
 
+        # Compile the numeric kernels now (or load them from the on-disk
+        # cache) so the first physics frames don't stall on the JIT
+        if self.jit_warmup and NUMBA_AVAILABLE:
+            try:
+                compiled = precompile()
+                if engine_logger.debug_enabled():
+                    engine_logger.debug(f"Warmed up {compiled} JIT kernel signatures")
+            except Exception as e:
+                engine_logger.warning(f"JIT warm-up failed, kernels will compile on first use: {e}")
+
         # Create default camera
         from ..rendering.camera import Camera
         self.camera = Camera()
@@ -370,34 +468,39 @@ class VoidRayEngine:
         # Performance tracking and statistics
         frame_count = 0
         performance_timer = 0
-        self.engine_stats = {
-            'frames_rendered': 0,
-            'objects_rendered': 0,
-            'physics_objects': 0,
-            'memory_usage': 0,
-            'rendering_mode': self.rendering_mode,
-            'performance_mode': self.performance_mode
-        }
+        # Reset in place; Engine.stats hands out this same object
+        stats = self._stats
+        stats.reset()
+
+        self._last_frame_ns = time.perf_counter_ns()
 
         try:
             while self.running:
+                # In the background only watch for the window coming back,
+                # and restart frame timing so the pause isn't one long frame
+                if not self._has_focus and self.pause_when_unfocused:
+                    time.sleep(_UNFOCUSED_SLEEP)
+                    self._handle_events()
+                    self._last_frame_ns = time.perf_counter_ns()
+                    continue
+
                 # Start frame profiling
                 self.profiler.start_frame()
                 profile_id = self.profiler.start_profile("main_loop")
 
                 # Calculate delta time with frame limiting
-                dt = self.clock.tick(self.target_fps)
+                dt = self._pace()
                 self.delta_time = min(dt / 1000.0, 0.05)  # Cap at 50ms to prevent spiral of death
 
             # Performance monitoring and statistics
                 frame_count += 1
                 performance_timer += self.delta_time
-                self.engine_stats['frames_rendered'] += 1
+                stats.frames_rendered += 1
 
                 if performance_timer >= 1.0:  # Every second
-                    actual_fps = frame_count / performance_timer
-                    self.engine_stats['objects_rendered'] = len(self.current_scene.objects) if self.current_scene else 0
-                    self.engine_stats['physics_objects'] = len(self.physics_engine.colliders)
+                    actual_fps = stats.fps = frame_count / performance_timer
+                    stats.objects_rendered = len(self.current_scene.objects) if self.current_scene else 0
+                    stats.physics_objects = len(self.physics_engine.colliders)
 
                     if actual_fps < self.target_fps * 0.8:  # If FPS drops below 80% of target
                         engine_logger.warning(f"Performance warning: FPS dropped to {actual_fps:.1f}")
@@ -423,8 +526,8 @@ class VoidRayEngine:
 
                 # Debug: Check scene status
                 if not self.current_scene:
-                    if frame_count % 60 == 0:  # Print every second
-                        print("Warning: No current scene set")
+                    if frame_count % 60 == 0:  # Warn every second
+                        engine_logger.warning("No current scene set")
                     continue
 
                 try:
@@ -447,9 +550,7 @@ class VoidRayEngine:
 
                     # Update physics with optimization
                     physics_profile = self.profiler.start_profile("physics_update")
-                    self.physics_engine.update(self.delta_time)
-                    if hasattr(self, 'physics_system'):
-                        self.physics_system.update(self.delta_time)
+                    self._step_physics(self.delta_time)
                     self.profiler.end_profile(physics_profile)
 
                     # Update advanced systems
@@ -500,11 +601,11 @@ class VoidRayEngine:
                     scene_render_profile = self.profiler.start_profile("scene_render")
                     if self.current_scene:
                         self.current_scene.render(self.renderer)
-                        if frame_count % 60 == 0:  # Debug output every second
-                            print(f"Rendering scene with {len(self.current_scene.objects)} objects")
+                        if frame_count % 60 == 0 and engine_logger.debug_enabled():  # Debug output every second
+                            engine_logger.debug(f"Rendering scene with {len(self.current_scene.objects)} objects")
                     else:
                         # Draw a debug message if no scene
-                        font = pygame.font.Font(None, 24)
+                        font = get_font(None, 24)
                         text = font.render("No Scene Loaded", True, (255, 255, 255))
                         self.screen.blit(text, (10, 10))
                     self.profiler.end_profile(scene_render_profile)
@@ -613,16 +714,87 @@ class VoidRayEngine:
         self.running = False
         print("Stopping VoidRay engine...")
 
+    def _pace(self) -> float:
+        """
+        Wait until the next frame is due and measure the frame time.
+
+        Sleeps for the bulk of the wait and spins on perf_counter_ns for
+        the last stretch, which lands much closer to the deadline than
+        Clock.tick's SDL_Delay. The clock still ticks once per frame so
+        get_fps() keeps working.
+
+        Returns:
+            Milliseconds since the previous frame
+        """
+        now = time.perf_counter_ns()
+        if self.target_fps > 0:
+            deadline = self._last_frame_ns + 1_000_000_000 // self.target_fps
+            remaining = deadline - now
+            if remaining > _PACING_SPIN_NS:
+                time.sleep((remaining - _PACING_SPIN_NS) / 1e9)
+            while time.perf_counter_ns() < deadline:
+                pass
+            now = time.perf_counter_ns()
+
+        elapsed_ns = now - self._last_frame_ns
+        self._last_frame_ns = now
+        self.clock.tick()
+        return elapsed_ns / 1e6
+
+    def _step_physics(self, delta_time: float):
+        """
+        Advance physics by the frame time in fixed physics_timestep ticks.
+
+        Fast frames may run no tick and slow frames several, so the
+        simulation rate doesn't follow the render rate. At most
+        max_physics_steps ticks run per frame; time beyond that is dropped.
+        """
+        physics_system = getattr(self, 'physics_system', None)
+        if physics_system is self.physics_engine:
+            physics_system = None
+
+        timestep = self.physics_timestep
+        if timestep <= 0:
+            self.physics_engine.update(delta_time)
+            if physics_system is not None:
+                physics_system.update(delta_time)
+            self.physics_alpha = 0.0
+            return
+
+        accumulator = self._physics_accumulator + delta_time
+        steps = 0
+        while accumulator >= timestep and steps < self.max_physics_steps:
+            self.physics_engine.update(timestep)
+            if physics_system is not None:
+                physics_system.update(timestep)
+            accumulator -= timestep
+            steps += 1
+
+        if accumulator >= timestep:
+            accumulator = 0.0
+        self._physics_accumulator = accumulator
+        self.physics_alpha = accumulator / timestep
+
     def _handle_events(self):
         """
         Process pygame events and update input manager.
         """
-        events = pygame.event.get()
-
-        for event in events:
-            if event.type == pygame.QUIT:
+        # Poll one event at a time so no per-frame event list is built
+        poll = pygame.event.poll
+        noevent = pygame.NOEVENT
+        while True:
+            event = poll()
+            event_type = event.type
+            if event_type == noevent:
+                break
+
+            if event_type == pygame.QUIT:
                 self.stop()
-            elif event.type == pygame.KEYDOWN:
+            elif event_type == pygame.WINDOWFOCUSGAINED or event_type == pygame.WINDOWRESTORED:
+                self._has_focus = True
+            elif event_type == pygame.WINDOWFOCUSLOST or event_type == pygame.WINDOWMINIMIZED:
+                self._has_focus = False
+            elif event_type == pygame.KEYDOWN:
                 if event.key == pygame.K_F3:  # F3 to toggle debug overlay
                     self.debug_overlay.toggle()
                 elif event.key == pygame.K_F12:  # F12 to take screenshot
@@ -808,9 +980,27 @@ class VoidRayEngine:
         """Get the time elapsed since the last frame in seconds."""
         return self.delta_time
 
+    @property
+    def stats(self) -> _EngineStats:
+        """
+        The live main loop counters, updated in place every frame.
+
+        Unlike engine_stats this builds nothing, so per-frame readers such
+        as overlays can poll it freely. Treat it as read-only.
+        """
+        return self._stats
+
+    @property
+    def engine_stats(self) -> dict:
+        """Snapshot of the main loop counters and current rendering modes."""
+        stats = self._stats.as_dict()
+        stats['rendering_mode'] = getattr(self, 'rendering_mode', '2D')
+        stats['performance_mode'] = getattr(self, 'performance_mode', False)
+        return stats
+
     def get_engine_stats(self) -> dict:
         """Get engine performance statistics."""
-        stats = self.engine_stats.copy()
+        stats = self.engine_stats
         if hasattr(self, 'audio_manager'):
             stats['audio_info'] = self.audio_manager.get_audio_info()
         if hasattr(self, 'asset_loader'):
@@ -886,6 +1076,9 @@ class VoidRayEngine:
         if mode in ["2D", "2.5D"]:
             self.rendering_mode = mode
             self.renderer.set_rendering_mode(mode)
+            if self.current_scene:
+                self.current_scene.on_rendering_mode_changed(mode)
+                self.physics_engine.invalidate()
             print(f"Rendering mode set to {mode}")
 
     def enable_performance_mode(self, enabled: bool = True):
@@ -966,8 +1159,8 @@ class VoidRayEngine:
     def load_level(self, level_name: str, scene_name: str = None):
         """Load a 2.5D level into the current or specified scene."""
         target_scene = self.current_scene
-        if scene_name and scene_name in self.scenes:
-            target_scene = self.scenes[scene_name]
+        if scene_name:
+            target_scene = self.scenes.get(scene_name, target_scene)
 
         if target_scene:
             target_scene.load_level(level_name, self.asset_loader)
@@ -994,6 +1187,10 @@ class VoidRayEngine:
 
             self.renderer.add_wall(start, end, texture, height)
 
+        # Pack wall geometry once so the raycaster never touches level dicts
+        if hasattr(self.renderer, 'build_wall_arrays'):
+            self.renderer.build_wall_arrays()
+
         # Add light sources
         for light_data in scene.get_light_sources():
             position = Vector2(light_data['x'], light_data['y'])
@@ -1023,6 +1220,35 @@ class VoidRayEngine:
         self.camera_position = position
         self.camera_angle = angle
 
+    def move_camera_2_5d(self, forward: float, strafe: float, turn: float,
+                         move_speed: float, turn_speed: float, delta_time: float):
+        """
+        Integrate 2.5D camera motion for one frame in a single pass.
+
+        The local (forward, strafe) input is rotated into world space by the
+        camera's rotation matrix and applied together with the turn, so
+        callers don't build intermediate vectors per key.
+
+        Args:
+            forward: Forward axis input (-1 to 1), e.g. W minus S
+            strafe: Strafe axis input (-1 to 1), e.g. D minus A
+            turn: Turn axis input (-1 to 1)
+            move_speed: Movement speed in units per second
+            turn_speed: Turn speed in radians per second
+            delta_time: Time elapsed since last frame
+        """
+        angle = self.camera_angle + turn * turn_speed * delta_time
+        cs = math.cos(angle)
+        sn = math.sin(angle)
+        step = move_speed * delta_time
+
+        # [dx, dy] = R(angle) @ [forward, strafe] * step
+        dx = (cs * forward - sn * strafe) * step
+        dy = (sn * forward + cs * strafe) * step
+
+        self.set_camera_2_5d(Vector2(self.camera_position.x + dx,
+                                     self.camera_position.y + dy), angle)
+
     # Game Creation Utilities
     def create_particle_effect(self, position: Vector2, effect_type: str = "explosion", duration: float = 2.0):
         """Create a particle effect at the specified position."""
@@ -1104,15 +1330,17 @@ class VoidRayEngine:
 
     def add_simple_enemy_ai(self, enemy_object, target_object, speed: float = 100.0):
         """Add simple AI that follows a target."""
+        stop_distance_sq = 50 * 50  # Don't get too close
+
         def ai_update(delta_time):
             if not enemy_object.active or not target_object.active:
                 return
 
-            # Simple follow AI
+            # Simple follow AI; only normalize once it has decided to move
             direction = target_object.transform.position - enemy_object.transform.position
-            if direction.magnitude() > 50:  # Don't get too close
-                direction = direction.normalized()
-                enemy_object.transform.position += direction * speed * delta_time
+            if direction.magnitude_squared() > stop_distance_sq:
+                direction.normalize()
+                enemy_object.transform.position.add_scaled(direction, speed * delta_time)
 
         # In a real implementation, this would be a proper component
         if not hasattr(enemy_object, '_ai_update'):
@@ -1128,7 +1356,8 @@ class VoidRayEngine:
         return True
 
 
-# Global engine instance
+# Global engine instance; the module-level functions below and the
+# voidray package API all drive this one object
 Engine = VoidRayEngine()
 
 
@@ -1159,9 +1388,14 @@ def register_scene(name: str, scene: Scene):
     return Engine.register_scene(name, scene)
 
 
-def set_scene(name_or_scene):
-    """Set the current scene."""
-    return Engine.set_scene(name_or_scene)
+def get_scene_handle(name: str) -> Optional[SceneHandle]:
+    """Get the handle of a registered scene."""
+    return Engine.get_scene_handle(name)
+
+
+def set_scene(scene_ref):
+    """Set the current scene by handle, name or instance."""
+    return Engine.set_scene(scene_ref)
 
 
 def start():
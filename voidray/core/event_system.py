@@ -1,6 +1,8 @@
 
+import time
 from typing import Dict, List, Callable, Any
 from enum import Enum
+from .logger import engine_logger
 
 
 class EventType(Enum):
@@ -27,14 +29,7 @@ class GameEvent:
         """
         self.type = event_type
         self.data = data or {}
-        self.timestamp = None
-        
-        # Set timestamp if available
-        try:
-            import time
-            self.timestamp = time.time()
-        except:
-            pass
+        self.timestamp = time.time()
 
 
 class EventSystem:
@@ -60,7 +55,8 @@ class EventSystem:
             self.listeners[event_type] = []
         
         self.listeners[event_type].append(callback)
-        print(f"Subscribed to event: {event_type}")
+        if engine_logger.debug_enabled():
+            engine_logger.debug(f"Subscribed to event: {event_type}")
     
     def unsubscribe(self, event_type: str, callback: Callable):
         """
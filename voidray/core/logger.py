@@ -74,6 +74,15 @@ class EngineLogger:
         """Log critical message."""
         self.logger.critical(message)
 
+    def debug_enabled(self) -> bool:
+        """
+        Check whether debug messages are being logged.
+
+        Guard debug calls in per-frame code with this so their f-strings
+        aren't formatted when the message would be dropped anyway.
+        """
+        return self.logger.isEnabledFor(logging.DEBUG)
+
     def engine_start(self, width: int, height: int, fps: int):
         """Log engine startup information."""
         self.info(f"VoidRay Engine starting - Resolution: {width}x{height}, Target FPS: {fps}")
@@ -26,6 +26,24 @@ class ProfileData:
     frame_number: int
 
 
+class _ThreadStats:
+    """Running sample count and total time for one thread."""
+
+    __slots__ = ('samples', 'total_time')
+
+    def __init__(self):
+        self.samples = 0
+        self.total_time = 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Get the stats in the form get_thread_stats reports them."""
+        return {
+            'samples': self.samples,
+            'total_time': self.total_time,
+            'avg_time': self.total_time / self.samples if self.samples else 0.0
+        }
+
+
 class PerformanceProfiler:
     """
     Advanced performance profiler for game engines.
@@ -53,11 +71,7 @@ class PerformanceProfiler:
         
         # Threading
         self.lock = threading.Lock()
-        self.thread_stats: Dict[int, Dict[str, Any]] = defaultdict(lambda: {
-            'samples': 0,
-            'total_time': 0.0,
-            'avg_time': 0.0
-        })
+        self.thread_stats: Dict[int, _ThreadStats] = defaultdict(_ThreadStats)
         
         # Frame tracking
         self.current_frame = 0
@@ -136,9 +150,8 @@ class PerformanceProfiler:
             
             # Update thread stats
             thread_stats = self.thread_stats[thread_id]
-            thread_stats['samples'] += 1
-            thread_stats['total_time'] += profile_data.duration
-            thread_stats['avg_time'] = thread_stats['total_time'] / thread_stats['samples']
+            thread_stats.samples += 1
+            thread_stats.total_time += profile_data.duration
             
             # Check for hotspots
             if profile_data.duration > self.hotspot_threshold:
@@ -316,7 +329,8 @@ class PerformanceProfiler:
     
     def get_thread_stats(self) -> Dict[int, Dict[str, Any]]:
         """Get statistics for all threads."""
-        return dict(self.thread_stats)
+        with self.lock:
+            return {thread_id: stats.as_dict() for thread_id, stats in self.thread_stats.items()}
     
     def generate_report(self) -> Dict[str, Any]:
         """Generate a comprehensive performance report."""
@@ -49,6 +49,11 @@ class ObjectPool(Generic[T]):
         if obj in self.active_objects:
             self.active_objects.remove(obj)
     
+    def prewarm(self, count: int):
+        """Fill the pool up to count objects ahead of time."""
+        while len(self.pool) < min(count, self.max_size):
+            self.pool.append(self.factory())
+    
     def clear(self):
         """Clear the pool."""
         self.pool.clear()
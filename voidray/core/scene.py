@@ -31,6 +31,9 @@ class Scene:
         self.light_sources = []
         self.sprites = []
 
+        # Objects deactivated because they don't belong to the current rendering mode
+        self._mode_suspended: List[GameObject] = []
+
         # Layer management
         self.layers = {
             "background": [],
@@ -100,7 +103,7 @@ class Scene:
         """
         result = []
         for obj in self.objects:
-            if hasattr(obj, 'tags') and tag in obj.tags:
+            if tag in obj.tags:
                 result.append(obj)
         return result
 
@@ -144,6 +147,34 @@ class Scene:
         """Called when the scene is resumed from pause."""
         self.active = True
 
+    def on_rendering_mode_changed(self, mode: str):
+        """
+        Called when the engine switches between 2D and 2.5D rendering.
+
+        Objects tagged "2d_only" are deactivated while in 2.5D mode and
+        objects tagged "2.5d_only" while in 2D mode, so hidden objects
+        don't spend update and physics time. Only objects suspended here
+        are reactivated when the mode switches back.
+
+        Args:
+            mode: New rendering mode ("2D" or "2.5D")
+        """
+        hidden_tag = "2d_only" if mode == "2.5D" else "2.5d_only"
+        suspended = getattr(self, '_mode_suspended', None)
+        if suspended is None:
+            # Subclasses that skip Scene.__init__ still get the behaviour
+            suspended = self._mode_suspended = []
+
+        for obj in suspended:
+            if obj.scene is self:
+                obj.active = True
+        suspended.clear()
+
+        for obj in self.objects:
+            if obj.active and hidden_tag in obj.tags:
+                obj.active = False
+                suspended.append(obj)
+
     def update(self, delta_time: float):
         """
         Update all objects in the scene.
@@ -100,8 +100,8 @@ class SceneManager:
 
     def preload_scene(self, name: str):
         """Preload a scene for faster transitions."""
-        if name in self.scenes and name not in self.preloaded_scenes:
-            scene = self.scenes[name]
+        scene = self.scenes.get(name)
+        if scene is not None and name not in self.preloaded_scenes:
             self.scene_states[name] = SceneState.LOADING
 
             start_time = time.time()
@@ -157,8 +157,9 @@ class SceneManager:
 
         self.current_scene = new_scene
         self.scene_states[name] = SceneState.ACTIVE
-        self.scene_metrics[name]['last_accessed'] = time.time()
-        self.scene_metrics[name]['load_time'] = load_time
+        metrics = self.scene_metrics[name]
+        metrics['last_accessed'] = time.time()
+        metrics['load_time'] = load_time
 
         # Call transition callbacks
         self._call_transition_callbacks('scene_loaded', old_scene, new_scene)
@@ -4,10 +4,10 @@ VoidRay Effects System
 Visual effects, particles, and post-processing for enhanced 2D/2.5D games.
 """
 
-from .particle_system import ParticleSystem, ParticleSystemManager, Particle
+from .particle_system import ParticleSystem, ParticleSystemManager, Particle, ParticleField
 from .post_processing import PostProcessingPipeline, BloomEffect, BlurEffect
 
 __all__ = [
-    'ParticleSystem', 'ParticleSystemManager', 'Particle',
+    'ParticleSystem', 'ParticleSystemManager', 'Particle', 'ParticleField',
     'PostProcessingPipeline', 'BloomEffect', 'BlurEffect'
 ]
@@ -6,18 +6,47 @@ Advanced particle effects for 2D/2.5D games.
 import pygame
 import random
 import math
+import numpy as np
 from typing import List, Callable, Optional, Dict, Any
 from ..math.vector2 import Vector2
 from ..utils.color import Color
+from ..core.resource_pool import ObjectPool
+
+
+# Precomputed (x, y) jitter pairs in [-1, 1], scaled per emitter at emission
+# time so spawning a particle costs a table index instead of two uniform() calls
+_JITTER_TABLE_SIZE = 256
+
+
+def _build_jitter_table(size: int) -> List[tuple]:
+    """Build the jitter table from a fixed seed so it is stable across runs."""
+    rng = random.Random(0)
+    return [(rng.uniform(-1.0, 1.0), rng.uniform(-1.0, 1.0)) for _ in range(size)]
+
+
+_JITTER_TABLE = _build_jitter_table(_JITTER_TABLE_SIZE)
 
 
 class Particle:
     """Individual particle with physics and rendering properties."""
 
     def __init__(self, position: Vector2):
-        self.position = position
+        self.position = Vector2.zero()
         self.velocity = Vector2.zero()
         self.acceleration = Vector2.zero()
+        self.custom_data = {}
+        self.reset(position.x, position.y)
+
+    def reset(self, x: float, y: float):
+        """
+        Restore default state at (x, y) so a pooled particle can be re-emitted.
+
+        The particle's vectors are updated in place rather than replaced.
+        """
+        self.position.x = x
+        self.position.y = y
+        self.velocity.x = self.velocity.y = 0.0
+        self.acceleration.x = self.acceleration.y = 0.0
 
         # Visual properties
         self.color = Color.WHITE
@@ -33,22 +62,22 @@ class Particle:
         self.angular_velocity = 0.0
 
         # Custom properties
-        self.custom_data = {}
+        if self.custom_data:
+            self.custom_data.clear()
 
-    def update(self, delta_time: float, gravity: Vector2 = Vector2.zero()):
+    def update(self, delta_time: float, gravity: Vector2 = Vector2.ZERO):
         """Update particle physics and properties."""
         # Apply gravity
-        if gravity.magnitude() > 0:
-            self.acceleration += gravity * self.gravity_scale
+        if gravity.x or gravity.y:
+            self.acceleration.add_scaled(gravity, self.gravity_scale)
 
         # Apply drag
         if self.drag > 0:
-            drag_force = self.velocity * -self.drag
-            self.velocity += drag_force * delta_time
+            self.velocity *= 1.0 - self.drag * delta_time
 
         # Update physics
-        self.velocity += self.acceleration * delta_time
-        self.position += self.velocity * delta_time
+        self.velocity.add_scaled(self.acceleration, delta_time)
+        self.position.add_scaled(self.velocity, delta_time)
         self.rotation += self.angular_velocity * delta_time
 
         # Update life
@@ -59,7 +88,7 @@ class Particle:
         self.alpha = int(255 * max(0, life_ratio))
 
         # Reset acceleration (forces are applied each frame)
-        self.acceleration = Vector2.zero()
+        self.acceleration.x = self.acceleration.y = 0.0
 
     def is_alive(self) -> bool:
         """Check if particle is still alive."""
@@ -113,22 +142,25 @@ class ParticleSystem:
         # Custom update functions
         self.update_functions: List[Callable[[Particle, float], None]] = []
 
+        # Dead particles are recycled instead of reallocated on every emission
+        self.particle_pool: ObjectPool[Particle] = ObjectPool(
+            lambda: Particle(Vector2.zero()), max_size=max_particles
+        )
+
     def emit_particle(self) -> Particle:
         """Emit a single particle."""
         # Random spawn position within area
-        spawn_offset = Vector2(
-            random.uniform(-self.spawn_area.x/2, self.spawn_area.x/2),
-            random.uniform(-self.spawn_area.y/2, self.spawn_area.y/2)
-        )
-        spawn_pos = self.position + spawn_offset
-
-        # Create particle
-        particle = Particle(spawn_pos)
+        jitter_x, jitter_y = _JITTER_TABLE[random.randrange(_JITTER_TABLE_SIZE)]
+        # Reuse a pooled particle when one is available
+        particle = self.particle_pool.get()
+        particle.reset(self.position.x + jitter_x * self.spawn_area.x * 0.5,
+                       self.position.y + jitter_y * self.spawn_area.y * 0.5)
 
         # Set initial velocity with variation
-        vel_x = self.initial_velocity.x + random.uniform(-self.velocity_variation.x, self.velocity_variation.x)
-        vel_y = self.initial_velocity.y + random.uniform(-self.velocity_variation.y, self.velocity_variation.y)
-        particle.velocity = Vector2(vel_x, vel_y)
+        jitter_x, jitter_y = _JITTER_TABLE[random.randrange(_JITTER_TABLE_SIZE)]
+        velocity = particle.velocity
+        velocity.x = self.initial_velocity.x + jitter_x * self.velocity_variation.x
+        velocity.y = self.initial_velocity.y + jitter_y * self.velocity_variation.y
 
         # Set life
         particle.life = random.uniform(*self.life_range)
@@ -152,6 +184,10 @@ class ParticleSystem:
                 particle = self.emit_particle()
                 self.particles.append(particle)
 
+    def prewarm(self, count: int):
+        """Pre-allocate pooled particles so emission never allocates mid-game."""
+        self.particle_pool.prewarm(min(count, self.max_particles))
+
     def add_update_function(self, func: Callable[[Particle, float], None]):
         """Add custom particle update function."""
         self.update_functions.append(func)
@@ -180,16 +216,20 @@ class ParticleSystem:
             self.burst_count = 0
 
         # Update particles
-        for particle in self.particles[:]:
+        alive_particles = []
+        for particle in self.particles:
             particle.update(delta_time, self.gravity)
 
             # Apply custom update functions
             for update_func in self.update_functions:
                 update_func(particle, delta_time)
 
-            # Remove dead particles
-            if not particle.is_alive():
-                self.particles.remove(particle)
+            # Recycle dead particles
+            if particle.is_alive():
+                alive_particles.append(particle)
+            else:
+                self.particle_pool.return_object(particle)
+        self.particles = alive_particles
 
     def render(self, renderer):
         """Render all particles."""
@@ -198,6 +238,8 @@ class ParticleSystem:
 
     def clear(self):
         """Remove all particles."""
+        for particle in self.particles:
+            self.particle_pool.return_object(particle)
         self.particles.clear()
 
     def get_particle_count(self) -> int:
@@ -205,6 +247,138 @@ class ParticleSystem:
         return len(self.particles)
 
 
+class ParticleField:
+    """
+    Particle emitter that stores particle state as parallel numpy arrays.
+
+    Uses the same emission and physics settings as ParticleSystem, but with
+    no per-particle objects, so integration and culling are a handful of
+    array operations per frame however many particles are alive. Suited to
+    dense effects that don't need custom per-particle update functions.
+    """
+
+    def __init__(self, position: Vector2, max_particles: int = 5000):
+        self.position = position
+        self.max_particles = max_particles
+        self.active = True
+
+        # Emission properties
+        self.emission_rate = 50.0  # particles per second
+        self.emission_timer = 0.0
+        self.auto_emit = True
+        self.burst_count = 0
+
+        # Particle spawn properties
+        self.spawn_area = Vector2(10, 10)
+        self.initial_velocity = Vector2(0, -100)
+        self.velocity_variation = Vector2(50, 20)
+        self.life_range = (1.0, 3.0)
+        self.size_range = (2.0, 8.0)
+        self.color_start = Color.WHITE
+        self.color_end = Color.RED
+
+        # Physics
+        self.gravity = Vector2(0, 98)
+        self.drag = 0.1
+
+        # Particle state; rows [0, count) are alive
+        self.count = 0
+        self.positions = np.zeros((max_particles, 2))
+        self.velocities = np.zeros((max_particles, 2))
+        self.life = np.zeros(max_particles)
+        self.max_life = np.ones(max_particles)
+        self.sizes = np.zeros(max_particles)
+
+    def emit_burst(self, count: int):
+        """Emit a burst of particles."""
+        count = min(count, self.max_particles - self.count)
+        if count <= 0:
+            return
+
+        start = self.count
+        end = start + count
+
+        jitter = np.random.uniform(-0.5, 0.5, (count, 2))
+        self.positions[start:end, 0] = self.position.x + jitter[:, 0] * self.spawn_area.x
+        self.positions[start:end, 1] = self.position.y + jitter[:, 1] * self.spawn_area.y
+
+        jitter = np.random.uniform(-1.0, 1.0, (count, 2))
+        self.velocities[start:end, 0] = self.initial_velocity.x + jitter[:, 0] * self.velocity_variation.x
+        self.velocities[start:end, 1] = self.initial_velocity.y + jitter[:, 1] * self.velocity_variation.y
+
+        life = np.random.uniform(self.life_range[0], self.life_range[1], count)
+        self.life[start:end] = life
+        self.max_life[start:end] = life
+        self.sizes[start:end] = np.random.uniform(self.size_range[0], self.size_range[1], count)
+
+        self.count = end
+
+    def update(self, delta_time: float):
+        """Update all particles and emission."""
+        if not self.active:
+            return
+
+        # Handle emission
+        if self.auto_emit and self.emission_rate > 0:
+            self.emission_timer += delta_time
+            particles_to_emit = int(self.emission_timer * self.emission_rate)
+
+            if particles_to_emit > 0:
+                self.emission_timer -= particles_to_emit / self.emission_rate
+                self.emit_burst(particles_to_emit)
+
+        # Handle burst emission
+        if self.burst_count > 0:
+            self.emit_burst(self.burst_count)
+            self.burst_count = 0
+
+        count = self.count
+        if count == 0:
+            return
+
+        positions = self.positions[:count]
+        velocities = self.velocities[:count]
+
+        # Same integration order as Particle.update: drag, gravity, position
+        if self.drag > 0:
+            velocities *= 1.0 - self.drag * delta_time
+        velocities[:, 0] += self.gravity.x * delta_time
+        velocities[:, 1] += self.gravity.y * delta_time
+        positions += velocities * delta_time
+        self.life[:count] -= delta_time
+
+        # Compact surviving particles to the front of the arrays
+        alive = self.life[:count] > 0
+        alive_count = int(np.count_nonzero(alive))
+        if alive_count != count:
+            for array in (self.positions, self.velocities, self.life,
+                          self.max_life, self.sizes):
+                array[:alive_count] = array[:count][alive]
+            self.count = alive_count
+
+    def render(self, renderer):
+        """Render all particles."""
+        count = self.count
+        if count == 0:
+            return
+
+        screen = renderer.screen
+        color = self.color_start[:3]
+        draw_circle = pygame.draw.circle
+        points = self.positions[:count].astype(np.int32).tolist()
+        radii = self.sizes[:count].astype(np.int32).tolist()
+        for point, radius in zip(points, radii):
+            draw_circle(screen, color, point, radius)
+
+    def clear(self):
+        """Remove all particles."""
+        self.count = 0
+
+    def get_particle_count(self) -> int:
+        """Get current particle count."""
+        return self.count
+
+
 class ParticleSystemManager:
     """Manages multiple particle systems."""
 
@@ -267,6 +441,19 @@ class ParticleSystemManager:
         self.systems[str(id(system))] = system
         return system
 
+    def create_field(self, position: Vector2, preset: str = None,
+                     max_particles: int = 5000) -> ParticleField:
+        """Create a new array-backed particle field for dense effects."""
+        field = ParticleField(position, max_particles)
+
+        if preset and preset in self.presets:
+            for key, value in self.presets[preset].items():
+                if hasattr(field, key):
+                    setattr(field, key, value)
+
+        self.systems[str(id(field))] = field
+        return field
+
     def remove_system(self, system: ParticleSystem):
         """Remove a particle system."""
         system_id = str(id(system))
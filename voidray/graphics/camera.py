@@ -3,8 +3,11 @@ VoidRay Camera System
 Handles camera positioning, following, and viewport management.
 """
 
+import random
+
 from ..core.game_object import GameObject
 from ..math.vector2 import Vector2
+from ..math._fastmath import clamp_magnitude
 
 
 class Camera(GameObject):
@@ -97,14 +100,22 @@ class Camera(GameObject):
             
             if self.follow_speed > 0:
                 move_distance = self.follow_speed * delta_time
-                if direction.magnitude() > move_distance:
-                    direction = direction.normalized() * move_distance
+                direction.x, direction.y = clamp_magnitude(direction.x, direction.y, move_distance)
             
             new_pos = current_pos + direction
             
-            # Apply bounds
-            new_pos.x = max(self.bounds_min.x, min(self.bounds_max.x, new_pos.x))
-            new_pos.y = max(self.bounds_min.y, min(self.bounds_max.y, new_pos.y))
+            # Apply bounds (upper limit first so the minimum wins on overlap,
+            # matching max(lo, min(hi, v)) without the builtin calls)
+            bounds_min = self.bounds_min
+            bounds_max = self.bounds_max
+            if new_pos.x > bounds_max.x:
+                new_pos.x = bounds_max.x
+            if new_pos.x < bounds_min.x:
+                new_pos.x = bounds_min.x
+            if new_pos.y > bounds_max.y:
+                new_pos.y = bounds_max.y
+            if new_pos.y < bounds_min.y:
+                new_pos.y = bounds_min.y
             
             self.transform.position = new_pos
         
@@ -125,7 +136,6 @@ class Camera(GameObject):
         
         # Apply shake
         if self.shake_intensity > 0:
-            import random
             shake_x = random.uniform(-self.shake_intensity, self.shake_intensity)
             shake_y = random.uniform(-self.shake_intensity, self.shake_intensity)
             pos.x += shake_x
@@ -177,16 +187,10 @@ class Camera(GameObject):
         """
         camera_pos = self.get_view_position()
         
-        # Calculate view bounds
-        half_screen = Vector2(screen_size.x / 2, screen_size.y / 2)
-        view_min = camera_pos - half_screen
-        view_max = camera_pos + half_screen
-        
-        # Calculate object bounds
-        half_size = Vector2(size.x / 2, size.y / 2)
-        obj_min = world_pos - half_size
-        obj_max = world_pos + half_size
+        # Objects overlap the view when their centers are closer than the
+        # summed half extents on both axes
+        half_width = (screen_size.x + size.x) * 0.5
+        half_height = (screen_size.y + size.y) * 0.5
         
-        # Check overlap
-        return not (obj_max.x < view_min.x or obj_min.x > view_max.x or
-                   obj_max.y < view_min.y or obj_min.y > view_max.y)
+        return (abs(world_pos.x - camera_pos.x) <= half_width and
+                abs(world_pos.y - camera_pos.y) <= half_height)
@@ -9,6 +9,7 @@ import math
 import numpy as np
 from typing import Optional, Tuple, List, Dict, Union
 from ..math.vector2 import Vector2
+from ..utils.fonts import get_font
 
 
 class Color:
@@ -592,7 +593,7 @@ class AdvancedRenderer:
         scaled_font_size = max(8, int(font_size * self.camera_zoom))
         
         try:
-            font = pygame.font.Font(font_name, scaled_font_size)
+            font = get_font(font_name, scaled_font_size)
             
             # Apply lighting
             final_color = color
@@ -677,7 +678,7 @@ class AdvancedRenderer:
         
         y_offset = 10
         for info in debug_info:
-            text_surface = pygame.font.Font(None, 24).render(info, True, Color.WHITE)
+            text_surface = get_font(None, 24).render(info, True, Color.WHITE)
             self.screen.blit(text_surface, (10, y_offset))
             y_offset += 25
 
@@ -4,7 +4,7 @@ Centralized input handling for keyboard, mouse, and other devices.
 """
 
 import pygame
-from typing import Dict, Set
+from typing import Callable, Dict, Set, Sequence
 from ..math.vector2 import Vector2
 
 
@@ -108,6 +108,10 @@ class InputManager:
         self.keys_just_pressed: Set[int] = set()
         self.keys_just_released: Set[int] = set()
         
+        # Snapshot of the full keyboard state, refreshed once per frame.
+        # Index it by key code (e.g. keys[Keys.W]) to skip per-call lookups.
+        self.keys: Sequence[bool] = ()
+        
         # Mouse state
         self.mouse_position = Vector2(0, 0)
         self.mouse_buttons_pressed: Set[int] = set()
@@ -137,6 +141,16 @@ class InputManager:
         self._prev_keys_pressed: Set[int] = set()
         self._prev_mouse_buttons_pressed: Set[int] = set()
         self._prev_gamepad_buttons_pressed = {}
+        
+        # Event type -> handler, so each event costs one dict lookup
+        self._event_handlers: Dict[int, Callable[[pygame.event.Event], None]] = {
+            pygame.KEYDOWN: self._on_key_down,
+            pygame.KEYUP: self._on_key_up,
+            pygame.MOUSEBUTTONDOWN: self._on_mouse_button_down,
+            pygame.MOUSEBUTTONUP: self._on_mouse_button_up,
+            pygame.MOUSEMOTION: self._on_mouse_motion,
+            pygame.MOUSEWHEEL: self._on_mouse_wheel,
+        }
     
     def handle_event(self, event: pygame.event.Event):
         """
@@ -145,26 +159,39 @@ class InputManager:
         Args:
             event: The pygame event to handle
         """
-        if event.type == pygame.KEYDOWN:
-            self.keys_pressed.add(event.key)
-        elif event.type == pygame.KEYUP:
-            self.keys_pressed.discard(event.key)
-        elif event.type == pygame.MOUSEBUTTONDOWN:
-            self.mouse_buttons_pressed.add(event.button)
-        elif event.type == pygame.MOUSEBUTTONUP:
-            self.mouse_buttons_pressed.discard(event.button)
-        elif event.type == pygame.MOUSEMOTION:
-            self.mouse_position = Vector2(event.pos[0], event.pos[1])
-        elif event.type == pygame.MOUSEWHEEL:
-            self.mouse_wheel_delta = event.y
+        handler = self._event_handlers.get(event.type)
+        if handler is not None:
+            handler(event)
+    
+    def _on_key_down(self, event: pygame.event.Event):
+        self.keys_pressed.add(event.key)
+    
+    def _on_key_up(self, event: pygame.event.Event):
+        self.keys_pressed.discard(event.key)
+    
+    def _on_mouse_button_down(self, event: pygame.event.Event):
+        self.mouse_buttons_pressed.add(event.button)
+    
+    def _on_mouse_button_up(self, event: pygame.event.Event):
+        self.mouse_buttons_pressed.discard(event.button)
+    
+    def _on_mouse_motion(self, event: pygame.event.Event):
+        self.mouse_position.x, self.mouse_position.y = event.pos
+    
+    def _on_mouse_wheel(self, event: pygame.event.Event):
+        self.mouse_wheel_delta = event.y
     
     def update(self):
         """
         Update input state. Call this once per frame after handling events.
         """
-        # Update mouse position
-        mouse_pos = pygame.mouse.get_pos()
-        self.mouse_position = Vector2(mouse_pos[0], mouse_pos[1])
+        # Snapshot keyboard state once so per-frame key queries don't re-fetch it
+        self.keys = pygame.key.get_pressed()
+        
+        # Update mouse position in place; get_mouse_position hands out copies
+        mouse_x, mouse_y = pygame.mouse.get_pos()
+        self.mouse_position.x = mouse_x
+        self.mouse_position.y = mouse_y
         
         # Calculate just pressed/released keys
         self.keys_just_pressed = self.keys_pressed - self._prev_keys_pressed
@@ -218,6 +245,30 @@ class InputManager:
         """
         return key in self.keys_just_released
     
+    def get_key_mask(self, *keys: int) -> int:
+        """
+        Pack the held state of several keys into a bitmask.
+        
+        Bit i is set when keys[i] is down in this frame's keyboard snapshot,
+        so a caller can fetch its whole control set once and test it with
+        bitwise AND.
+        
+        Args:
+            keys: Key codes to pack, in bit order
+            
+        Returns:
+            Integer bitmask of held keys
+        """
+        key_state = self.keys
+        if not key_state:
+            return 0
+        
+        mask = 0
+        for bit, key in enumerate(keys):
+            if key_state[key]:
+                mask |= 1 << bit
+        return mask
+    
     def get_axis(self, negative_key: int, positive_key: int) -> float:
         """
         Get an axis value based on two keys (-1 to 1).
@@ -229,12 +280,8 @@ class InputManager:
         Returns:
             Axis value from -1 to 1
         """
-        value = 0.0
-        if self.is_key_pressed(negative_key):
-            value -= 1.0
-        if self.is_key_pressed(positive_key):
-            value += 1.0
-        return value
+        pressed = self.keys_pressed
+        return float((positive_key in pressed) - (negative_key in pressed))
     
     def get_movement_vector(self) -> Vector2:
         """
@@ -243,12 +290,16 @@ class InputManager:
         Returns:
             Movement vector as Vector2
         """
-        x = self.get_axis(Keys.A, Keys.D) + self.get_axis(Keys.LEFT, Keys.RIGHT)
-        y = self.get_axis(Keys.W, Keys.S) + self.get_axis(Keys.UP, Keys.DOWN)
+        # One set lookup per key instead of four get_axis calls
+        pressed = self.keys_pressed
+        x = ((Keys.D in pressed) - (Keys.A in pressed)
+             + (Keys.RIGHT in pressed) - (Keys.LEFT in pressed))
+        y = ((Keys.S in pressed) - (Keys.W in pressed)
+             + (Keys.DOWN in pressed) - (Keys.UP in pressed))
         
         movement = Vector2(x, -y)  # Invert Y for screen coordinates
-        if movement.magnitude() > 1.0:
-            movement = movement.normalized()
+        if x * x + y * y > 1:
+            movement.normalize()
         
         return movement
     
@@ -177,7 +177,7 @@ class LightingSystem:
         
         return tinted_surface
         
-    def render_light_map(self, renderer, camera_offset: Vector2 = Vector2.zero()):
+    def render_light_map(self, renderer, camera_offset: Vector2 = Vector2.ZERO):
         """Render the light map as an overlay."""
         if not self.enabled or not self.light_map:
             return
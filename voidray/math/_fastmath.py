@@ -0,0 +1,23 @@
+"""
+VoidRay Fast Math Kernels
+Scalar 2D math helpers for hot paths.
+
+These work on plain floats instead of Vector2 so per-frame code avoids
+temporary vectors and operator dispatch. They are compiled with numba when
+it is installed (see voidray.utils.jit) and run as plain Python otherwise.
+Vector2 remains the public API; use these only inside engine internals.
+"""
+
+import math
+
+from ..utils.jit import njit
+
+
+@njit(cache=True, fastmath=True, precompile=("(float64, float64, float64)",))
+def clamp_magnitude(x: float, y: float, max_length: float):
+    """Scale (x, y) down to max_length if it is longer; returns the new (x, y)."""
+    mag_sq = x * x + y * y
+    if mag_sq <= max_length * max_length:
+        return x, y
+    scale = max_length / math.sqrt(mag_sq)
+    return x * scale, y * scale
@@ -3,6 +3,8 @@ VoidRay Transform Class
 Represents position, rotation, and scale transformations.
 """
 
+import math
+
 from .vector2 import Vector2
 
 
@@ -11,6 +13,8 @@ class Transform:
     Represents a 2D transformation with position, rotation, and scale.
     """
     
+    __slots__ = ('position', 'rotation', 'scale')
+    
     def __init__(self, position: Vector2 = None, rotation: float = 0, scale: Vector2 = None):
         """
         Initialize a transform.
@@ -20,9 +24,27 @@ class Transform:
             rotation: Rotation in degrees (defaults to 0)
             scale: Scale as Vector2 (defaults to (1, 1))
         """
-        self.position = position or Vector2.zero()
+        # Copies, so in-place moves don't write through to the caller's vectors
+        self.position = position.copy() if position is not None else Vector2.zero()
         self.rotation = rotation  # In degrees
-        self.scale = scale or Vector2.one()
+        self.scale = scale.copy() if scale is not None else Vector2.one()
+    
+    def __getstate__(self):
+        """Pickle as a plain attribute dict, the form older versions wrote."""
+        return {name: getattr(self, name) for name in Transform.__slots__}
+    
+    def __setstate__(self, state):
+        """
+        Restore a pickled instance.
+
+        Accepts the (dict, slots) tuple form of slotted pickles as well as
+        the plain attribute dict of pickles saved before __slots__.
+        """
+        if isinstance(state, tuple):
+            dict_state, slot_state = state
+            state = dict(dict_state or {}, **(slot_state or {}))
+        for name, value in state.items():
+            setattr(self, name, value)
     
     def translate(self, offset: Vector2):
         """
@@ -151,8 +173,7 @@ class Transform:
             target: Target position to look at
         """
         direction = target - self.position
-        if direction.magnitude() > 0:
-            import math
+        if direction.x or direction.y:
             self.rotation = math.degrees(math.atan2(direction.y, direction.x))
     
     def copy(self) -> 'Transform':
@@ -12,6 +12,9 @@ class Vector2:
     A 2D vector class with common vector operations.
     """
     
+    # No per-instance __dict__: vectors are created constantly, so keep them small
+    __slots__ = ('x', 'y')
+    
     def __init__(self, x: float = 0, y: float = 0):
         """
         Initialize a 2D vector.
@@ -23,6 +26,23 @@ class Vector2:
         self.x = float(x)
         self.y = float(y)
     
+    def __getstate__(self):
+        """Pickle as a plain attribute dict, the form older versions wrote."""
+        return {name: getattr(self, name) for name in Vector2.__slots__}
+    
+    def __setstate__(self, state):
+        """
+        Restore a pickled instance.
+
+        Accepts the (dict, slots) tuple form of slotted pickles as well as
+        the plain attribute dict of pickles saved before __slots__.
+        """
+        if isinstance(state, tuple):
+            dict_state, slot_state = state
+            state = dict(dict_state or {}, **(slot_state or {}))
+        for name, value in state.items():
+            setattr(self, name, value)
+    
     def __str__(self) -> str:
         return f"Vector2({self.x:.2f}, {self.y:.2f})"
     
@@ -68,10 +88,62 @@ class Vector2:
         else:
             raise TypeError("Can only divide Vector2 by number or Vector2")
     
+    def __iadd__(self, other: 'Vector2') -> 'Vector2':
+        """Add another vector in place."""
+        self.x += other.x
+        self.y += other.y
+        return self
+    
+    def __isub__(self, other: 'Vector2') -> 'Vector2':
+        """Subtract another vector in place."""
+        self.x -= other.x
+        self.y -= other.y
+        return self
+    
+    def __imul__(self, scalar: Union[float, int, 'Vector2']) -> 'Vector2':
+        """Multiply in place by scalar or component-wise with another vector."""
+        if isinstance(scalar, (int, float)):
+            self.x *= scalar
+            self.y *= scalar
+        elif isinstance(scalar, Vector2):
+            self.x *= scalar.x
+            self.y *= scalar.y
+        else:
+            raise TypeError("Can only multiply Vector2 by number or Vector2")
+        return self
+    
+    def __itruediv__(self, scalar: Union[float, int]) -> 'Vector2':
+        """Divide in place by scalar."""
+        if not isinstance(scalar, (int, float)):
+            raise TypeError("Can only divide Vector2 in place by number")
+        if scalar == 0:
+            raise ZeroDivisionError("Cannot divide vector by zero")
+        self.x /= scalar
+        self.y /= scalar
+        return self
+    
     def __neg__(self) -> 'Vector2':
         """Negate the vector."""
         return Vector2(-self.x, -self.y)
     
+    def add_scaled(self, other: 'Vector2', scalar: float) -> 'Vector2':
+        """
+        Add another vector multiplied by a scalar, in place.
+        
+        Equivalent to ``self += other * scalar`` without allocating the
+        intermediate vector, e.g. ``position.add_scaled(velocity, delta_time)``.
+        
+        Args:
+            other: Vector to add
+            scalar: Factor to scale other by
+            
+        Returns:
+            This vector
+        """
+        self.x += other.x * scalar
+        self.y += other.y * scalar
+        return self
+    
     def magnitude(self) -> float:
         """
         Get the magnitude (length) of the vector.
@@ -346,3 +418,34 @@ class Vector2:
             New vector pointing in the specified direction
         """
         return Vector2.from_angle(math.radians(angle_degrees), magnitude)
+
+
+class _ReadOnlyVector2(Vector2):
+    """Vector2 whose components can't change; in-place operations raise."""
+    
+    __slots__ = ()
+    
+    def __init__(self, x: float = 0, y: float = 0):
+        object.__setattr__(self, 'x', float(x))
+        object.__setattr__(self, 'y', float(y))
+    
+    def __setattr__(self, name, value):
+        raise AttributeError("Vector2 constant is read-only; use copy() to get a mutable vector")
+    
+    def __delattr__(self, name):
+        raise AttributeError("Vector2 constant is read-only; use copy() to get a mutable vector")
+    
+    def __reduce__(self):
+        # Copies and unpickles resolve to the shared constant
+        return (_zero_vector, ())
+
+
+def _zero_vector() -> Vector2:
+    """Return Vector2.ZERO; unpickling target for the read-only constant."""
+    return Vector2.ZERO
+
+
+# Shared zero vector for read-only uses such as default arguments, so hot
+# code doesn't allocate one per call. It can't be modified; use
+# Vector2.zero() when the vector will be.
+Vector2.ZERO = _ReadOnlyVector2(0.0, 0.0)
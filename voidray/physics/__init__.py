@@ -8,6 +8,7 @@ from .physics_engine import PhysicsEngine
 from .physics_system import PhysicsSystem
 from .collider import Collider, RectCollider, CircleCollider, BoxCollider
 from .rigidbody import Rigidbody
+from .broadphase import UniformGrid
 
 __all__ = [
     'PhysicsEngine', 
@@ -16,5 +17,6 @@ __all__ = [
     'RectCollider', 
     'CircleCollider',
     'BoxCollider',  # Legacy alias
-    'Rigidbody'
+    'Rigidbody',
+    'UniformGrid'
 ]
@@ -0,0 +1,169 @@
+"""
+VoidRay Broad Phase
+Uniform grid spatial hashing for collision candidate generation.
+"""
+
+from typing import Any, Dict, Iterator, List, Set, Tuple
+
+
+class UniformGrid:
+    """
+    Uniform grid broad phase.
+
+    Objects are bucketed into every cell their axis-aligned bounds overlap.
+    Each object remembers its cell range, so an update that stays inside the
+    same cells costs nothing and removal never has to scan the whole grid.
+    """
+
+    def __init__(self, cell_size: float = 100.0):
+        """
+        Initialize the grid.
+
+        Args:
+            cell_size: Width and height of a grid cell in world units
+        """
+        self.cell_size = float(cell_size)
+        self.cells: Dict[Tuple[int, int], List[Any]] = {}
+        self._ranges: Dict[Any, Tuple[int, int, int, int]] = {}
+        
+        # Emptied cell lists kept for reuse so moving objects don't churn lists
+        self._free_buckets: List[List[Any]] = []
+
+    def __len__(self) -> int:
+        return len(self._ranges)
+
+    def __contains__(self, obj: Any) -> bool:
+        return obj in self._ranges
+
+    def _cell_range(self, aabb: Tuple[float, float, float, float]) -> Tuple[int, int, int, int]:
+        """Get the (min_x, min_y, max_x, max_y) cell range covered by an AABB."""
+        x, y, width, height = aabb
+        size = self.cell_size
+        return (int(x // size), int(y // size),
+                int((x + width) // size), int((y + height) // size))
+
+    def insert(self, obj: Any, aabb: Tuple[float, float, float, float]) -> bool:
+        """
+        Insert an object, or move it if it is already in the grid.
+
+        Args:
+            obj: Object to store
+            aabb: Bounds as (x, y, width, height)
+
+        Returns:
+            True if the object's cells changed, False if it stayed put
+        """
+        cell_range = self._cell_range(aabb)
+        old_range = self._ranges.get(obj)
+        if old_range == cell_range:
+            return False
+
+        if old_range is not None:
+            self._unlink(obj, old_range)
+
+        self._ranges[obj] = cell_range
+        cells = self.cells
+        min_x, min_y, max_x, max_y = cell_range
+        for grid_x in range(min_x, max_x + 1):
+            for grid_y in range(min_y, max_y + 1):
+                bucket = cells.get((grid_x, grid_y))
+                if bucket is None:
+                    bucket = self._free_buckets.pop() if self._free_buckets else []
+                    cells[(grid_x, grid_y)] = bucket
+                bucket.append(obj)
+        return True
+
+    def remove(self, obj: Any) -> bool:
+        """
+        Remove an object from the grid.
+
+        Args:
+            obj: Object to remove
+
+        Returns:
+            True if the object was in the grid
+        """
+        cell_range = self._ranges.pop(obj, None)
+        if cell_range is None:
+            return False
+        self._unlink(obj, cell_range)
+        return True
+
+    def _unlink(self, obj: Any, cell_range: Tuple[int, int, int, int]):
+        """Remove an object from the cells of a range, dropping emptied cells."""
+        cells = self.cells
+        min_x, min_y, max_x, max_y = cell_range
+        for grid_x in range(min_x, max_x + 1):
+            for grid_y in range(min_y, max_y + 1):
+                key = (grid_x, grid_y)
+                bucket = cells.get(key)
+                if bucket is None:
+                    continue
+                try:
+                    bucket.remove(obj)
+                except ValueError:
+                    continue
+                if not bucket:
+                    del cells[key]
+                    self._free_buckets.append(bucket)
+
+    def query(self, aabb: Tuple[float, float, float, float]) -> Iterator[Any]:
+        """
+        Iterate over objects whose cells overlap an AABB.
+
+        This is a broad phase: results may not actually intersect the
+        bounds and still need a narrow phase test.
+
+        Args:
+            aabb: Query bounds as (x, y, width, height)
+        """
+        cells = self.cells
+        seen: Set[int] = set()
+        min_x, min_y, max_x, max_y = self._cell_range(aabb)
+        for grid_x in range(min_x, max_x + 1):
+            for grid_y in range(min_y, max_y + 1):
+                bucket = cells.get((grid_x, grid_y))
+                if not bucket:
+                    continue
+                for obj in bucket:
+                    obj_id = id(obj)
+                    if obj_id not in seen:
+                        seen.add(obj_id)
+                        yield obj
+
+    def pairs(self) -> Iterator[Tuple[Any, Any]]:
+        """Iterate over each unique pair of objects that share a cell."""
+        seen: Set[Tuple[int, int]] = set()
+        for bucket in self.cells.values():
+            count = len(bucket)
+            if count < 2:
+                continue
+            for i in range(count):
+                first = bucket[i]
+                first_id = id(first)
+                for j in range(i + 1, count):
+                    second = bucket[j]
+                    second_id = id(second)
+                    pair_id = ((first_id, second_id) if first_id < second_id
+                               else (second_id, first_id))
+                    if pair_id not in seen:
+                        seen.add(pair_id)
+                        yield first, second
+
+    def set_cell_size(self, cell_size: float):
+        """
+        Change the cell size. Empties the grid; callers must re-insert.
+
+        Args:
+            cell_size: New cell size in world units
+        """
+        self.cell_size = float(cell_size)
+        self.clear()
+
+    def clear(self):
+        """Remove all objects from the grid."""
+        for bucket in self.cells.values():
+            bucket.clear()
+            self._free_buckets.append(bucket)
+        self.cells.clear()
+        self._ranges.clear()
@@ -29,6 +29,10 @@ class Collider(Component):
         self.on_trigger_enter: Optional[Callable[['Collider'], None]] = None
         self.on_trigger_exit: Optional[Callable[['Collider'], None]] = None
 
+        # Sleep state, managed by the physics engine
+        self.is_sleeping = False
+        self.sleep_timer = 0.0
+
         # Internal state
         self._in_collision_with = set()
 
@@ -175,9 +179,9 @@ class RectCollider(Collider):
         Returns:
             Tuple of (x, y, width, height)
         """
-        center = self.get_world_position() + self.offset
-        x = center.x - self.width / 2
-        y = center.y - self.height / 2
+        position = self.get_world_position()
+        x = position.x + self.offset.x - self.width * 0.5
+        y = position.y + self.offset.y - self.height * 0.5
         return (x, y, self.width, self.height)
 
     def check_collision(self, other: Collider) -> bool:
@@ -214,19 +218,23 @@ class RectCollider(Collider):
 
     def _check_rect_rect(self, other: 'RectCollider') -> bool:
         """Check collision between two rectangles."""
-        x1, y1, w1, h1 = self.get_rect_bounds()
-        x2, y2, w2, h2 = other.get_rect_bounds()
+        # Center distance against summed half-extents; no bounds tuples needed
+        pos1 = self.get_world_position()
+        pos2 = other.get_world_position()
+        dx = (pos1.x + self.offset.x) - (pos2.x + other.offset.x)
+        dy = (pos1.y + self.offset.y) - (pos2.y + other.offset.y)
 
-        return not (x1 + w1 < x2 or x2 + w2 < x1 or y1 + h1 < y2 or y2 + h2 < y1)
+        return (abs(dx) <= (self.width + other.width) * 0.5 and
+                abs(dy) <= (self.height + other.height) * 0.5)
 
     def _get_rect_rect_info(self, other: 'RectCollider') -> Optional[Dict[str, Any]]:
         """Get detailed collision info for rect-rect collision."""
-        if not self._check_rect_rect(other):
-            return None
-
         x1, y1, w1, h1 = self.get_rect_bounds()
         x2, y2, w2, h2 = other.get_rect_bounds()
 
+        if x1 + w1 < x2 or x2 + w2 < x1 or y1 + h1 < y2 or y2 + h2 < y1:
+            return None
+
         # Calculate overlap
         overlap_x = min(x1 + w1, x2 + w2) - max(x1, x2)
         overlap_y = min(y1 + h1, y2 + h2) - max(y1, y2)
@@ -262,10 +270,11 @@ class RectCollider(Collider):
         closest_x = max(rect_x, min(circle_center.x, rect_x + rect_w))
         closest_y = max(rect_y, min(circle_center.y, rect_y + rect_h))
 
-        # Calculate distance from circle center to closest point
-        distance = math.sqrt((circle_center.x - closest_x) ** 2 + (circle_center.y - closest_y) ** 2)
+        # Compare squared distance from circle center to closest point
+        dx = circle_center.x - closest_x
+        dy = circle_center.y - closest_y
 
-        return distance <= circle_radius
+        return dx * dx + dy * dy <= circle_radius * circle_radius
 
     def _get_rect_circle_info(self, other: 'CircleCollider') -> Optional[Dict[str, Any]]:
         """Get detailed collision info for rect-circle collision."""
@@ -376,9 +385,9 @@ class CircleCollider(Collider):
         """Check collision between two circles."""
         center1 = self.get_center()
         center2 = other.get_center()
-        distance = (center1 - center2).magnitude()
+        combined_radius = self.radius + other.radius
 
-        return distance <= (self.radius + other.radius)
+        return center1.distance_squared_to(center2) <= combined_radius * combined_radius
 
     def _get_circle_circle_info(self, other: 'CircleCollider') -> Optional[Dict[str, Any]]:
         """Get detailed collision info for circle-circle collision."""
@@ -407,8 +416,7 @@ class CircleCollider(Collider):
     def contains_point(self, point: Vector2) -> bool:
         """Check if a point is inside this circle."""
         center = self.get_center()
-        distance = (point - center).magnitude()
-        return distance <= self.radius
+        return point.distance_squared_to(center) <= self.radius * self.radius
 
     def get_bounds_radius(self) -> float:
         """Get the bounding radius of this circle."""
@@ -416,4 +424,7 @@ class CircleCollider(Collider):
 
 
 # Legacy aliases for backward compatibility
-BoxCollider = RectCollider
\ No newline at end of file
+BoxCollider = RectCollider
+
+# Component classes registered by ComponentRegistry.auto_discover
+__voidray_components__ = (Collider, RectCollider, CircleCollider)
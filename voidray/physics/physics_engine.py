@@ -6,10 +6,31 @@ Enhanced physics simulation with optimized collision detection, advanced feature
 
 from typing import List, Callable, Optional, Set, Dict, Any, Tuple
 from ..math.vector2 import Vector2
-from .collider import Collider
+from ..math._fastmath import clamp_magnitude
+from .collider import Collider, CircleCollider
+from .collision import BoxCollider
+from .rigidbody import Rigidbody
+from .broadphase import UniformGrid
+from ..core.logger import engine_logger
+from itertools import combinations
+import math
 import time
 
 
+def _average_friction(friction1: float, friction2: float) -> float:
+    return (friction1 + friction2) / 2
+
+
+# Friction combination modes; looked up once per contact instead of
+# comparing the mode string against each option
+_FRICTION_COMBINERS: Dict[str, Callable[[float, float], float]] = {
+    "average": _average_friction,
+    "multiply": lambda friction1, friction2: friction1 * friction2,
+    "min": min,
+    "max": max,
+}
+
+
 class PhysicsEngine:
     """
     Advanced physics engine with optimized collision detection and enhanced features.
@@ -23,7 +44,9 @@ class PhysicsEngine:
         
         # Advanced spatial partitioning with quadtree
         self.spatial_grid_size = 64.0
-        self.spatial_grid: Dict[Tuple[int, int], List[Collider]] = {}
+        self.broadphase = UniformGrid(self.spatial_grid_size)
+        self.broadphase_threshold = 32  # Fewer active colliders: test all pairs directly
+        self.spatial_grid: Dict[Tuple[int, int], List[Collider]] = self.broadphase.cells
         self.use_quadtree = True
         self.quadtree = None
         self.world_bounds = (-10000, -10000, 20000, 20000)
@@ -97,7 +120,22 @@ class PhysicsEngine:
         if 'iterations' in kwargs:
             self.collision_iterations = max(1, kwargs['iterations'])
         if 'grid_size' in kwargs:
-            self.spatial_grid_size = max(32.0, kwargs['grid_size'])
+            self.set_spatial_grid_size(kwargs['grid_size'])
+
+    def set_spatial_grid_size(self, size: float):
+        """Set the broad phase cell size; the grid is rebuilt on the next update."""
+        self.spatial_grid_size = max(32.0, size)
+        self.broadphase.set_cell_size(self.spatial_grid_size)
+        self._cache_dirty = True
+
+    def invalidate(self):
+        """
+        Rebuild the active collider list and broad phase on the next update.
+
+        Call after activating or deactivating game objects outside of
+        add_collider/remove_collider, e.g. when a scene suspends objects.
+        """
+        self._cache_dirty = True
 
     def add_collider(self, collider: Collider):
         """Add a collider with enhanced tracking."""
@@ -105,9 +143,12 @@ class PhysicsEngine:
             self.colliders.append(collider)
             self._cache_dirty = True
             # Initialize sleep state
-            if hasattr(collider, 'sleep_timer'):
-                collider.sleep_timer = 0.0
-                collider.is_sleeping = False
+            collider.sleep_timer = 0.0
+            collider.is_sleeping = False
+            # Claim the body now so it isn't also moved by its component update
+            rigidbody = collider.game_object.get_component(Rigidbody) if collider.game_object else None
+            if rigidbody and rigidbody.managed_by is None:
+                rigidbody.managed_by = self
 
     def remove_collider(self, collider: Collider):
         """Remove a collider with cleanup."""
@@ -117,6 +158,10 @@ class PhysicsEngine:
             self._cache_dirty = True
             # Clear from spatial grid
             self._remove_from_spatial_grid(collider)
+            # Hand the body back to its component update
+            rigidbody = collider.game_object.get_component(Rigidbody) if collider.game_object else None
+            if rigidbody and rigidbody.managed_by is self:
+                rigidbody.managed_by = None
 
     def update(self, delta_time: float):
         """Enhanced physics update with advanced features."""
@@ -165,116 +210,91 @@ class PhysicsEngine:
 
     def _rebuild_spatial_grid(self):
         """Rebuild the spatial partitioning grid."""
-        self.spatial_grid.clear()
+        self.broadphase.clear()
         for collider in self._active_colliders_cache:
             self._add_to_spatial_grid(collider)
 
     def _update_spatial_grid(self):
         """Update spatial grid for moved objects."""
+        if len(self._active_colliders_cache) < self.broadphase_threshold:
+            return  # Small scenes don't use the grid (see _perform_collision_detection)
+        
         for collider in self._active_colliders_cache:
             if collider not in self._sleeping_colliders:
-                self._remove_from_spatial_grid(collider)
                 self._add_to_spatial_grid(collider)
 
     def _add_to_spatial_grid(self, collider: Collider):
-        """Add collider to spatial grid."""
+        """Add collider to spatial grid, or move it if it's already there."""
         if not collider.game_object:
             return
             
         pos = collider.get_world_position()
         bounds_radius = collider.get_bounds_radius()
-        
-        # Calculate grid cells
-        min_x = int((pos.x - bounds_radius) // self.spatial_grid_size)
-        max_x = int((pos.x + bounds_radius) // self.spatial_grid_size)
-        min_y = int((pos.y - bounds_radius) // self.spatial_grid_size)
-        max_y = int((pos.y + bounds_radius) // self.spatial_grid_size)
-        
-        for grid_x in range(min_x, max_x + 1):
-            for grid_y in range(min_y, max_y + 1):
-                grid_key = (grid_x, grid_y)
-                if grid_key not in self.spatial_grid:
-                    self.spatial_grid[grid_key] = []
-                if collider not in self.spatial_grid[grid_key]:
-                    self.spatial_grid[grid_key].append(collider)
+        self.broadphase.insert(collider, (pos.x - bounds_radius, pos.y - bounds_radius,
+                                          bounds_radius * 2, bounds_radius * 2))
 
     def _remove_from_spatial_grid(self, collider: Collider):
         """Remove collider from spatial grid."""
-        keys_to_clean = []
-        for grid_key, colliders in self.spatial_grid.items():
-            if collider in colliders:
-                colliders.remove(collider)
-                if not colliders:
-                    keys_to_clean.append(grid_key)
-        
-        for key in keys_to_clean:
-            del self.spatial_grid[key]
+        self.broadphase.remove(collider)
 
     def _update_collider_physics(self, collider: Collider, delta_time: float):
         """Enhanced collider physics update."""
         if not collider.game_object:
             return
         
-        try:
-            from .rigidbody import Rigidbody
-            rigidbody = collider.game_object.get_component(Rigidbody)
-            if rigidbody and not rigidbody.is_kinematic:
+        rigidbody = collider.game_object.get_component(Rigidbody)
+        if rigidbody and not rigidbody.is_kinematic:
+            # Update rigidbody physics; claiming the body stops its component
+            # update and any other stepper from integrating it again. Bodies
+            # another stepper owns get their gravity from that stepper.
+            if rigidbody.managed_by is None:
+                rigidbody.managed_by = self
+            if rigidbody.managed_by is self:
                 # Apply gravity
-                if rigidbody.use_gravity and self.gravity.magnitude() > 0:
+                if rigidbody.use_gravity and (self.gravity.x or self.gravity.y):
                     rigidbody.add_force(self.gravity * rigidbody.mass)
                 
                 # Store previous position for continuous collision detection
                 if self.enable_continuous_collision:
-                    rigidbody.previous_position = rigidbody.game_object.transform.position
+                    rigidbody.previous_position = rigidbody.game_object.transform.position.copy()
                 
-                # Update rigidbody physics
-                rigidbody.update(delta_time * self.time_scale)
-                
-                # Velocity limiting
-                if rigidbody.velocity.magnitude() > self.max_velocity:
-                    rigidbody.velocity = rigidbody.velocity.normalized() * self.max_velocity
-                
-                # Advanced damping
-                self._apply_advanced_damping(rigidbody, delta_time)
-                
-        except ImportError:
-            pass
+                rigidbody.step(delta_time * self.time_scale)
+            
+            # Velocity limiting (squared compare skips the sqrt in the common case)
+            velocity = rigidbody.velocity
+            if velocity.magnitude_squared() > self.max_velocity * self.max_velocity:
+                velocity.x, velocity.y = clamp_magnitude(velocity.x, velocity.y, self.max_velocity)
+            
+            # Advanced damping
+            self._apply_advanced_damping(rigidbody, delta_time)
 
     def _apply_advanced_damping(self, rigidbody, delta_time: float):
         """Apply advanced damping effects."""
-        # Air resistance (quadratic drag)
-        if rigidbody.velocity.magnitude() > 0:
-            drag_force = rigidbody.velocity.normalized() * -rigidbody.drag * rigidbody.velocity.magnitude_squared()
-            rigidbody.add_force(drag_force * delta_time)
+        # Air resistance (quadratic drag): v.normalized() * |v|^2 == v * |v|
+        speed = rigidbody.velocity.magnitude()
+        if speed > 0:
+            rigidbody.add_force(rigidbody.velocity * (-rigidbody.drag * speed * delta_time))
         
         # Angular damping
-        if hasattr(rigidbody, 'angular_velocity') and hasattr(rigidbody, 'angular_drag'):
-            rigidbody.angular_velocity *= (1.0 - rigidbody.angular_drag * delta_time)
+        rigidbody.angular_velocity *= (1.0 - rigidbody.angular_drag * delta_time)
 
     def _perform_collision_detection(self):
         """Enhanced collision detection with spatial partitioning."""
-        checked_pairs: Set[Tuple[int, int]] = set()
+        sleeping = self._sleeping_colliders
+        active = self._active_colliders_cache
         
-        for grid_colliders in self.spatial_grid.values():
-            if len(grid_colliders) < 2:
+        # Below the threshold, brute force beats maintaining and walking the grid
+        if len(active) < self.broadphase_threshold:
+            pairs = combinations(active, 2)
+        else:
+            pairs = self.broadphase.pairs()
+        
+        for collider1, collider2 in pairs:
+            # Skip sleeping pairs
+            if collider1 in sleeping and collider2 in sleeping:
                 continue
-                
-            for i in range(len(grid_colliders)):
-                for j in range(i + 1, len(grid_colliders)):
-                    collider1, collider2 = grid_colliders[i], grid_colliders[j]
-                    
-                    # Create unique pair ID
-                    pair_id = (min(id(collider1), id(collider2)), max(id(collider1), id(collider2)))
-                    
-                    if pair_id not in checked_pairs:
-                        checked_pairs.add(pair_id)
-                        
-                        # Skip sleeping pairs
-                        if (collider1 in self._sleeping_colliders and 
-                            collider2 in self._sleeping_colliders):
-                            continue
-                        
-                        self._process_collision_pair(collider1, collider2)
+            
+            self._process_collision_pair(collider1, collider2)
 
     def _process_collision_pair(self, collider1: Collider, collider2: Collider):
         """Enhanced collision pair processing."""
@@ -316,22 +336,14 @@ class PhysicsEngine:
 
     def _check_collision_layers(self, collider1: Collider, collider2: Collider) -> bool:
         """Check if colliders should collide based on layers."""
-        # Default implementation - can be extended with collision matrix
-        layer1 = getattr(collider1, 'collision_layer', 0)
-        layer2 = getattr(collider2, 'collision_layer', 0)
-        
-        # For now, allow all layer collisions
+        # Default implementation - can be extended with collision matrix.
+        # For now, allow all layer collisions.
         return True
 
     def _get_enhanced_collision_info(self, collider1: Collider, collider2: Collider) -> Optional[Dict[str, Any]]:
         """Get enhanced collision information with backward compatibility."""
         try:
-            # Try new method first
-            if hasattr(collider1, 'get_collision_info'):
-                collision_info = collider1.get_collision_info(collider2)
-            else:
-                # Fallback for older colliders
-                collision_info = self._basic_collision_check(collider1, collider2)
+            collision_info = collider1.get_collision_info(collider2)
             
             if collision_info and self.enable_continuous_collision:
                 # Add continuous collision detection data
@@ -339,47 +351,20 @@ class PhysicsEngine:
             
             return collision_info
         except Exception as e:
-            print(f"Collision detection error: {e}")
+            engine_logger.error(f"Collision detection error: {e}")
             return None
     
-    def _basic_collision_check(self, collider1: Collider, collider2: Collider) -> Optional[Dict[str, Any]]:
-        """Basic collision check for backward compatibility."""
-        if not collider1.game_object or not collider2.game_object:
-            return None
-        
-        pos1 = collider1.game_object.transform.position
-        pos2 = collider2.game_object.transform.position
-        
-        # Simple distance-based collision
-        distance = (pos1 - pos2).magnitude()
-        combined_radius = getattr(collider1, 'radius', 32) + getattr(collider2, 'radius', 32)
-        
-        if distance <= combined_radius:
-            normal = (pos1 - pos2).normalized() if distance > 0 else Vector2(1, 0)
-            return {
-                'normal': normal,
-                'penetration': combined_radius - distance,
-                'contact_point': pos2 + normal * getattr(collider2, 'radius', 32)
-            }
-        
-        return None
-
     def _get_continuous_collision_info(self, collider1: Collider, collider2: Collider) -> Dict[str, Any]:
         """Calculate continuous collision detection information."""
         continuous_info = {}
         
-        try:
-            from .rigidbody import Rigidbody
-            rb1 = collider1.game_object.get_component(Rigidbody) if collider1.game_object else None
-            rb2 = collider2.game_object.get_component(Rigidbody) if collider2.game_object else None
-            
-            if rb1 and hasattr(rb1, 'previous_position'):
-                continuous_info['rb1_movement'] = rb1.game_object.transform.position - rb1.previous_position
-            if rb2 and hasattr(rb2, 'previous_position'):
-                continuous_info['rb2_movement'] = rb2.game_object.transform.position - rb2.previous_position
-                
-        except ImportError:
-            pass
+        rb1 = collider1.game_object.get_component(Rigidbody) if collider1.game_object else None
+        rb2 = collider2.game_object.get_component(Rigidbody) if collider2.game_object else None
+        
+        if rb1 and rb1.previous_position is not None:
+            continuous_info['rb1_movement'] = rb1.game_object.transform.position - rb1.previous_position
+        if rb2 and rb2.previous_position is not None:
+            continuous_info['rb2_movement'] = rb2.game_object.transform.position - rb2.previous_position
         
         return continuous_info
 
@@ -392,12 +377,8 @@ class PhysicsEngine:
             return
         
         # Get rigidbodies
-        try:
-            from .rigidbody import Rigidbody
-            rb1 = collider1.game_object.get_component(Rigidbody) if collider1.game_object else None
-            rb2 = collider2.game_object.get_component(Rigidbody) if collider2.game_object else None
-        except ImportError:
-            rb1 = rb2 = None
+        rb1 = collider1.game_object.get_component(Rigidbody) if collider1.game_object else None
+        rb2 = collider2.game_object.get_component(Rigidbody) if collider2.game_object else None
         
         # Enhanced positional correction
         self._resolve_position_correction(collider1, collider2, normal, penetration, rb1, rb2)
@@ -411,37 +392,44 @@ class PhysicsEngine:
         """Enhanced position correction with mass consideration."""
         correction_magnitude = max(penetration - self.penetration_slop, 0) * self.position_correction_percent
         
+        # Corrections are applied in place along the normal, so no
+        # temporary vectors are built per contact
         if collider1.is_static and not collider2.is_static:
-            correction = normal * correction_magnitude
             if collider2.game_object:
-                collider2.game_object.transform.position += correction
+                collider2.game_object.transform.position.add_scaled(normal, correction_magnitude)
         elif collider2.is_static and not collider1.is_static:
-            correction = -normal * correction_magnitude
             if collider1.game_object:
-                collider1.game_object.transform.position += correction
+                collider1.game_object.transform.position.add_scaled(normal, -correction_magnitude)
         elif not collider1.is_static and not collider2.is_static:
             # Mass-based correction
             if rb1 and rb2:
-                total_inv_mass = (1.0 / rb1.mass) + (1.0 / rb2.mass)
+                inv_mass1 = 1.0 / rb1.mass
+                inv_mass2 = 1.0 / rb2.mass
+                total_inv_mass = inv_mass1 + inv_mass2
                 if total_inv_mass > 0:
-                    correction1 = -normal * correction_magnitude * (1.0 / rb1.mass) / total_inv_mass
-                    correction2 = normal * correction_magnitude * (1.0 / rb2.mass) / total_inv_mass
+                    share1 = correction_magnitude * inv_mass1 / total_inv_mass
+                    share2 = correction_magnitude * inv_mass2 / total_inv_mass
                 else:
-                    correction1 = correction2 = Vector2.zero()
+                    share1 = share2 = 0.0
             else:
-                correction1 = -normal * correction_magnitude * 0.5
-                correction2 = normal * correction_magnitude * 0.5
+                share1 = share2 = correction_magnitude * 0.5
             
             if collider1.game_object:
-                collider1.game_object.transform.position += correction1
+                collider1.game_object.transform.position.add_scaled(normal, -share1)
             if collider2.game_object:
-                collider2.game_object.transform.position += correction2
+                collider2.game_object.transform.position.add_scaled(normal, share2)
 
     def _resolve_enhanced_velocities(self, rb1, rb2, normal: Vector2, collision_info: Dict[str, Any]):
         """Enhanced velocity resolution with improved physics."""
+        velocity1 = rb1.velocity
+        velocity2 = rb2.velocity
+        normal_x = normal.x
+        normal_y = normal.y
+        
         # Calculate relative velocity
-        relative_velocity = rb1.velocity - rb2.velocity
-        velocity_along_normal = relative_velocity.dot(normal)
+        relative_x = velocity1.x - velocity2.x
+        relative_y = velocity1.y - velocity2.y
+        velocity_along_normal = relative_x * normal_x + relative_y * normal_y
         
         # Skip if separating
         if velocity_along_normal > 0:
@@ -450,21 +438,31 @@ class PhysicsEngine:
         # Enhanced restitution calculation
         restitution = self._calculate_restitution(rb1, rb2, velocity_along_normal)
         
-        # Calculate impulse with enhanced mass handling
+        # Inverse masses are computed once and shared with the friction step
         inv_mass1 = 1.0 / rb1.mass if rb1.mass > 0 else 0
         inv_mass2 = 1.0 / rb2.mass if rb2.mass > 0 else 0
+        inv_mass_sum = inv_mass1 + inv_mass2
         
-        impulse_scalar = -(1 + restitution) * velocity_along_normal / (inv_mass1 + inv_mass2)
+        impulse_scalar = -(1 + restitution) * velocity_along_normal / inv_mass_sum
         
         # Apply impulse
-        impulse = normal * impulse_scalar
         if not rb1.is_kinematic:
-            rb1.velocity += impulse * inv_mass1
+            velocity1.add_scaled(normal, impulse_scalar * inv_mass1)
         if not rb2.is_kinematic:
-            rb2.velocity -= impulse * inv_mass2
+            velocity2.add_scaled(normal, -impulse_scalar * inv_mass2)
+        
+        # Tangent of the pre-impulse relative velocity
+        tangent_x = relative_x - normal_x * velocity_along_normal
+        tangent_y = relative_y - normal_y * velocity_along_normal
+        tangent_sq = tangent_x * tangent_x + tangent_y * tangent_y
+        if tangent_sq < 0.001 * 0.001:
+            return
         
         # Enhanced friction
-        self._apply_enhanced_friction(rb1, rb2, normal, impulse_scalar, relative_velocity)
+        inv_tangent_length = 1.0 / math.sqrt(tangent_sq)
+        self._apply_enhanced_friction(rb1, rb2, impulse_scalar, relative_x, relative_y,
+                                      tangent_x * inv_tangent_length, tangent_y * inv_tangent_length,
+                                      inv_mass1, inv_mass2)
 
     def _calculate_restitution(self, rb1, rb2, velocity_along_normal: float) -> float:
         """Calculate restitution with threshold."""
@@ -476,23 +474,16 @@ class PhysicsEngine:
         
         return base_restitution
 
-    def _apply_enhanced_friction(self, rb1, rb2, normal: Vector2, normal_impulse: float, relative_velocity: Vector2):
+    def _apply_enhanced_friction(self, rb1, rb2, normal_impulse: float,
+                                 relative_x: float, relative_y: float,
+                                 tangent_x: float, tangent_y: float,
+                                 inv_mass1: float, inv_mass2: float):
         """Enhanced friction with multiple combination modes."""
-        # Calculate tangent
-        tangent = relative_velocity - normal * relative_velocity.dot(normal)
-        if tangent.magnitude() < 0.001:
-            return
-        
-        tangent = tangent.normalized()
-        
         # Combine friction coefficients
         friction = self._combine_friction(rb1.friction, rb2.friction)
         
         # Calculate friction impulse
-        inv_mass1 = 1.0 / rb1.mass if rb1.mass > 0 else 0
-        inv_mass2 = 1.0 / rb2.mass if rb2.mass > 0 else 0
-        
-        friction_impulse = -relative_velocity.dot(tangent) / (inv_mass1 + inv_mass2)
+        friction_impulse = -(relative_x * tangent_x + relative_y * tangent_y) / (inv_mass1 + inv_mass2)
         
         # Coulomb friction
         max_friction = abs(normal_impulse * friction)
@@ -500,24 +491,21 @@ class PhysicsEngine:
             friction_impulse = max_friction * (-1 if friction_impulse > 0 else 1)
         
         # Apply friction
-        friction_vector = tangent * friction_impulse
         if not rb1.is_kinematic:
-            rb1.velocity += friction_vector * inv_mass1
+            scale = friction_impulse * inv_mass1
+            velocity = rb1.velocity
+            velocity.x += tangent_x * scale
+            velocity.y += tangent_y * scale
         if not rb2.is_kinematic:
-            rb2.velocity -= friction_vector * inv_mass2
+            scale = friction_impulse * inv_mass2
+            velocity = rb2.velocity
+            velocity.x -= tangent_x * scale
+            velocity.y -= tangent_y * scale
 
     def _combine_friction(self, friction1: float, friction2: float) -> float:
         """Combine friction coefficients using specified mode."""
-        if self.friction_combine_mode == "average":
-            return (friction1 + friction2) / 2
-        elif self.friction_combine_mode == "multiply":
-            return friction1 * friction2
-        elif self.friction_combine_mode == "min":
-            return min(friction1, friction2)
-        elif self.friction_combine_mode == "max":
-            return max(friction1, friction2)
-        else:
-            return (friction1 + friction2) / 2
+        combine = _FRICTION_COMBINERS.get(self.friction_combine_mode, _average_friction)
+        return combine(friction1, friction2)
 
     def _check_wake_conditions(self):
         """Check if sleeping colliders should wake up."""
@@ -527,28 +515,23 @@ class PhysicsEngine:
 
     def _should_wake_collider(self, collider: Collider) -> bool:
         """Check if a collider should wake up."""
-        try:
-            from .rigidbody import Rigidbody
-            rigidbody = collider.game_object.get_component(Rigidbody) if collider.game_object else None
-            if rigidbody:
-                # Wake if forces are applied
-                if hasattr(rigidbody, 'accumulated_force') and rigidbody.accumulated_force.magnitude() > 0.1:
-                    return True
-                
-                # Wake if velocity is above threshold
-                if rigidbody.velocity.magnitude() > self.sleep_velocity_threshold:
-                    return True
-        except ImportError:
-            pass
+        rigidbody = collider.game_object.get_component(Rigidbody) if collider.game_object else None
+        if rigidbody:
+            # Wake if forces are applied
+            if rigidbody.accumulated_force.magnitude_squared() > 0.1 * 0.1:
+                return True
+            
+            # Wake if velocity is above threshold
+            if rigidbody.velocity.magnitude_squared() > self.sleep_velocity_threshold ** 2:
+                return True
         
         return False
 
     def _wake_collider(self, collider: Collider):
         """Wake up a sleeping collider."""
         self._sleeping_colliders.discard(collider)
-        if hasattr(collider, 'sleep_timer'):
-            collider.sleep_timer = 0.0
-            collider.is_sleeping = False
+        collider.sleep_timer = 0.0
+        collider.is_sleeping = False
 
     def _check_sleeping_conditions(self, delta_time: float):
         """Check which colliders should go to sleep."""
@@ -556,39 +539,26 @@ class PhysicsEngine:
             if collider in self._sleeping_colliders:
                 continue
             
-            try:
-                from .rigidbody import Rigidbody
-                rigidbody = collider.game_object.get_component(Rigidbody) if collider.game_object else None
-                if rigidbody and not rigidbody.is_kinematic:
-                    if rigidbody.velocity.magnitude() < self.sleep_velocity_threshold:
-                        if not hasattr(collider, 'sleep_timer'):
-                            collider.sleep_timer = 0.0
-                        collider.sleep_timer += delta_time
-                        
-                        if collider.sleep_timer >= self.sleep_time_threshold:
-                            self._put_collider_to_sleep(collider)
-                    else:
-                        if hasattr(collider, 'sleep_timer'):
-                            collider.sleep_timer = 0.0
-            except ImportError:
-                pass
+            rigidbody = collider.game_object.get_component(Rigidbody) if collider.game_object else None
+            if rigidbody and not rigidbody.is_kinematic:
+                if rigidbody.velocity.magnitude_squared() < self.sleep_velocity_threshold ** 2:
+                    collider.sleep_timer += delta_time
+                    
+                    if collider.sleep_timer >= self.sleep_time_threshold:
+                        self._put_collider_to_sleep(collider)
+                else:
+                    collider.sleep_timer = 0.0
 
     def _put_collider_to_sleep(self, collider: Collider):
         """Put a collider to sleep."""
         self._sleeping_colliders.add(collider)
-        if hasattr(collider, 'is_sleeping'):
-            collider.is_sleeping = True
+        collider.is_sleeping = True
         
         # Zero out small velocities
-        try:
-            from .rigidbody import Rigidbody
-            rigidbody = collider.game_object.get_component(Rigidbody) if collider.game_object else None
-            if rigidbody:
-                rigidbody.velocity = Vector2.zero()
-                if hasattr(rigidbody, 'angular_velocity'):
-                    rigidbody.angular_velocity = 0.0
-        except ImportError:
-            pass
+        rigidbody = collider.game_object.get_component(Rigidbody) if collider.game_object else None
+        if rigidbody:
+            rigidbody.velocity = Vector2.zero()
+            rigidbody.angular_velocity = 0.0
 
     def _trigger_collision_callbacks(self, collider1: Collider, collider2: Collider, collision_info: Dict[str, Any]):
         """Trigger collision callbacks with error handling."""
@@ -597,14 +567,14 @@ class PhysicsEngine:
             try:
                 callback(collider1, collider2, collision_info)
             except Exception as e:
-                print(f"Error in collision callback: {e}")
+                engine_logger.error(f"Error in collision callback: {e}")
         
         # Individual collider callbacks
         try:
             collider1.trigger_collision_event(collider2, collision_info)
             collider2.trigger_collision_event(collider1, collision_info)
         except Exception as e:
-            print(f"Error in collider callback: {e}")
+            engine_logger.error(f"Error in collider callback: {e}")
 
     # Enhanced query methods
     def raycast_enhanced(self, start: Vector2, direction: Vector2, max_distance: float = float('inf'), 
@@ -630,7 +600,6 @@ class PhysicsEngine:
     def _raycast_collider(self, start: Vector2, direction: Vector2, collider: Collider, max_distance: float) -> Optional[Dict[str, Any]]:
         """Perform raycast against a single collider with proper shape detection."""
         # Enhanced raycast for different collider types
-        from .collision import BoxCollider, CircleCollider
         
         if isinstance(collider, CircleCollider):
             return self._raycast_circle(start, direction, collider, max_distance)
@@ -788,14 +757,16 @@ class PhysicsEngine:
         """Draw spatial grid for debugging."""
         from ..graphics.renderer import Color
         
-        for (grid_x, grid_y), colliders in self.spatial_grid.items():
-            if colliders:
-                x = grid_x * self.spatial_grid_size
-                y = grid_y * self.spatial_grid_size
-                
-                renderer.draw_rect(
-                    Vector2(x, y),
-                    Vector2(self.spatial_grid_size, self.spatial_grid_size),
-                    Color.GREEN if len(colliders) == 1 else Color.YELLOW,
-                    filled=False
-                )
+        size = self.spatial_grid_size
+        cells = [
+            ((grid_x * size, grid_y * size, size, size),
+             Color.GREEN if len(colliders) == 1 else Color.YELLOW)
+            for (grid_x, grid_y), colliders in self.spatial_grid.items()
+            if colliders
+        ]
+        
+        if hasattr(renderer, 'draw_rects'):
+            renderer.draw_rects(cells, filled=False)
+        else:
+            for (x, y, w, h), color in cells:
+                renderer.draw_rect(Vector2(x, y), Vector2(w, h), color, filled=False)
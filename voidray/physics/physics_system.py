@@ -3,10 +3,12 @@ VoidRay Physics System
 High-level physics system that manages rigidbodies and coordinates with the physics engine.
 """
 
+import math
 from typing import List, Set, Optional, Callable, Dict
 from ..math.vector2 import Vector2
 from .rigidbody import Rigidbody
 from .physics_engine import PhysicsEngine
+from ..core.logger import engine_logger
 
 
 class PhysicsSystem:
@@ -53,6 +55,8 @@ class PhysicsSystem:
         """
         if rigidbody in self.rigidbodies:
             self.rigidbodies.remove(rigidbody)
+            if rigidbody.managed_by is self:
+                rigidbody.managed_by = None
 
     def set_gravity(self, gravity: Vector2):
         """
@@ -78,13 +82,19 @@ class PhysicsSystem:
         active_rigidbodies = [rb for rb in self.rigidbodies if rb.enabled and not rb.is_sleeping]
 
         for rigidbody in active_rigidbodies:
+            # Bodies with colliders are already stepped by the physics engine
+            if rigidbody.managed_by is None:
+                rigidbody.managed_by = self
+            elif rigidbody.managed_by is not self:
+                continue
+
             if not rigidbody.is_kinematic:
                 # Apply gravity if enabled
                 if rigidbody.use_gravity:
                     rigidbody.add_force(self.gravity * rigidbody.mass)
 
                 # Update rigidbody
-                rigidbody.update(scaled_delta)
+                rigidbody.step(scaled_delta)
 
                 # Check for sleeping
                 self._check_sleeping(rigidbody, scaled_delta)
@@ -92,12 +102,12 @@ class PhysicsSystem:
         # Wake up sleeping rigidbodies if they have forces applied
         sleeping_rigidbodies = [rb for rb in self.rigidbodies if rb.is_sleeping]
         for rigidbody in sleeping_rigidbodies:
-            if rigidbody.accumulated_force.magnitude() > 0.1:
+            if rigidbody.accumulated_force.magnitude_squared() > 0.1 * 0.1:
                 self._wake_up(rigidbody)
 
     def _check_sleeping(self, rigidbody: Rigidbody, delta_time: float):
         """Check if a rigidbody should go to sleep."""
-        if rigidbody.velocity.magnitude() < self.sleeping_threshold:
+        if rigidbody.velocity.magnitude_squared() < self.sleeping_threshold * self.sleeping_threshold:
             rigidbody.sleep_timer += delta_time
             if rigidbody.sleep_timer >= self.sleep_time_threshold:
                 self._put_to_sleep(rigidbody)
@@ -109,13 +119,15 @@ class PhysicsSystem:
         rigidbody.is_sleeping = True
         rigidbody.velocity = Vector2(0, 0)
         rigidbody.angular_velocity = 0.0
-        print(f"Rigidbody {rigidbody} went to sleep")
+        if engine_logger.debug_enabled():
+            engine_logger.debug(f"Rigidbody {rigidbody} went to sleep")
 
     def _wake_up(self, rigidbody: Rigidbody):
         """Wake up a sleeping rigidbody."""
         rigidbody.is_sleeping = False
         rigidbody.sleep_timer = 0.0
-        print(f"Rigidbody {rigidbody} woke up")
+        if engine_logger.debug_enabled():
+            engine_logger.debug(f"Rigidbody {rigidbody} woke up")
 
     def apply_impulse_to_area(self, center: Vector2, radius: float, impulse: Vector2):
         """
@@ -126,13 +138,15 @@ class PhysicsSystem:
             radius: Radius of the area
             impulse: Impulse to apply
         """
+        radius_sq = radius * radius
         for rigidbody in self.rigidbodies:
             if rigidbody.game_object and rigidbody.game_object.transform:
                 position = rigidbody.game_object.transform.position
-                distance = (position - center).magnitude()
+                distance_sq = position.distance_squared_to(center)
 
-                if distance <= radius:
+                if distance_sq <= radius_sq:
                     # Apply impulse with falloff based on distance
+                    distance = math.sqrt(distance_sq)
                     falloff = 1.0 - (distance / radius)
                     scaled_impulse = impulse * falloff
                     rigidbody.add_impulse(scaled_impulse)
@@ -153,12 +167,12 @@ class PhysicsSystem:
             List of rigidbodies in the area
         """
         result = []
+        radius_sq = radius * radius
         for rigidbody in self.rigidbodies:
             if rigidbody.game_object and rigidbody.game_object.transform:
                 position = rigidbody.game_object.transform.position
-                distance = (position - center).magnitude()
 
-                if distance <= radius:
+                if position.distance_squared_to(center) <= radius_sq:
                     result.append(rigidbody)
 
         return result
@@ -198,7 +212,7 @@ class PhysicsSystem:
             try:
                 callback(collision_data)
             except Exception as e:
-                print(f"Error in collision callback: {e}")
+                engine_logger.error(f"Error in collision callback: {e}")
 
     def optimize_performance(self):
         """Optimize physics performance by removing inactive rigidbodies."""
@@ -6,6 +6,7 @@ High-performance spatial indexing for collision detection and object queries.
 
 from typing import List, Optional, Set, Tuple, Callable
 from ..math.vector2 import Vector2
+from ..core.logger import engine_logger
 import time
 
 
@@ -77,14 +78,14 @@ class QuadTreeNode:
         
         # Filter by actual distance
         result = []
+        radius_sq = radius * radius
         for obj in candidates:
             # Get object position (this would need to be stored with the object)
             obj_pos = getattr(obj, 'position', center)
             if hasattr(obj, 'transform'):
                 obj_pos = obj.transform.position
             
-            distance = (obj_pos - center).magnitude()
-            if distance <= radius:
+            if obj_pos.distance_squared_to(center) <= radius_sq:
                 result.append(obj)
         
         return result
@@ -251,6 +252,7 @@ class AdvancedQuadTree:
         # Start with a small radius and expand if needed
         search_radius = 100.0
         found_objects = []
+        max_radius_sq = max_radius * max_radius
         
         while len(found_objects) < max_count and search_radius <= max_radius:
             candidates = self.query_radius(position, search_radius)
@@ -262,9 +264,10 @@ class AdvancedQuadTree:
                 if hasattr(obj, 'transform'):
                     obj_pos = obj.transform.position
                 
-                distance = (obj_pos - position).magnitude()
-                if distance <= max_radius:
-                    with_distances.append((obj, distance))
+                # Squared distances sort the same as distances
+                distance_sq = obj_pos.distance_squared_to(position)
+                if distance_sq <= max_radius_sq:
+                    with_distances.append((obj, distance_sq))
             
             # Sort by distance and take the closest
             with_distances.sort(key=lambda x: x[1])
@@ -294,7 +297,8 @@ class AdvancedQuadTree:
             self.insert(obj, position)
         
         self.last_rebuild_time = time.perf_counter() - start_time
-        print(f"Quadtree rebuilt in {self.last_rebuild_time:.3f}s")
+        if engine_logger.debug_enabled():
+            engine_logger.debug(f"Quadtree rebuilt in {self.last_rebuild_time:.3f}s")
     
     def update(self, delta_time: float):
         """Update the quadtree (auto-optimization)."""
@@ -311,7 +315,8 @@ class AdvancedQuadTree:
         # Rebuild if average query time is too high
         avg_query_time = stats.get('avg_query_time_ms', 0)
         if avg_query_time > 5.0:  # 5ms threshold
-            print(f"Auto-optimizing quadtree (avg query time: {avg_query_time:.2f}ms)")
+            if engine_logger.debug_enabled():
+                engine_logger.debug(f"Auto-optimizing quadtree (avg query time: {avg_query_time:.2f}ms)")
             self.rebuild()
             
             # Reset performance counters
@@ -350,7 +355,7 @@ class AdvancedQuadTree:
         
         # Draw node boundary
         color = (0, 255, 0) if len(node.objects) > 0 else (100, 100, 100)
-        renderer.draw_rect(Vector2(x, y), Vector2(w, h), color, filled=False)
+        renderer.draw_rect_xywh(x, y, w, h, color, filled=False)
         
         # Draw children
         if node.is_divided:
@@ -5,8 +5,37 @@ Provides physics simulation for game objects including velocity,
 acceleration, and physics properties like mass and drag.
 """
 
+from typing import Optional
+
 from ..core.component import Component
 from ..math.vector2 import Vector2
+from ..utils.jit import njit
+
+
+@njit(cache=True, fastmath=True,
+      precompile=("(float64, float64, float64, float64, float64, float64, float64)",))
+def _integrate_linear(vx: float, vy: float, fx: float, fy: float,
+                      inv_mass: float, drag: float, delta_time: float):
+    """
+    Apply accumulated force and linear drag to a velocity.
+
+    Works on plain floats so the per-body step allocates no Vector2
+    temporaries; compiled with numba when it is installed.
+
+    Returns:
+        The new (vx, vy) velocity
+    """
+    vx += fx * inv_mass * delta_time
+    vy += fy * inv_mass * delta_time
+
+    if drag > 0.0:
+        drag_factor = 1.0 - drag * delta_time
+        if drag_factor < 0.0:
+            drag_factor = 0.0
+        vx *= drag_factor
+        vy *= drag_factor
+
+    return vx, vy
 
 
 class Rigidbody(Component):
@@ -36,11 +65,19 @@ class Rigidbody(Component):
         self.is_sleeping = False
         self.sleep_timer = 0.0
 
+        # Position at the start of the physics step, recorded by the engine
+        # when continuous collision is enabled
+        self.previous_position: Optional[Vector2] = None
+
         # Position and rotation constraints
         self.freeze_position_x = False
         self.freeze_position_y = False
         self.freeze_rotation = False
 
+        # Physics stepper that integrates this body each frame. While set,
+        # the component update does nothing so the body moves exactly once.
+        self.managed_by = None
+
     def on_attach(self) -> None:
         """Called when attached to a game object."""
         # Register with physics system if available
@@ -75,8 +112,7 @@ class Rigidbody(Component):
             impulse: The impulse vector to apply
         """
         if not self.is_kinematic:
-            velocity_change = impulse / self.mass
-            self.velocity += velocity_change
+            self.velocity.add_scaled(impulse, 1.0 / self.mass)
 
     def add_torque(self, torque: float) -> None:
         """
@@ -180,19 +216,31 @@ class Rigidbody(Component):
 
     def update(self, delta_time: float) -> None:
         """
-        Update the rigidbody physics simulation.
+        Component update; integrates the body unless a physics stepper owns it.
 
         Args:
             delta_time: Time elapsed since last frame
         """
+        if self.managed_by is None:
+            self.step(delta_time)
+
+    def step(self, delta_time: float) -> None:
+        """
+        Advance the rigidbody physics simulation.
+
+        Args:
+            delta_time: Time elapsed since last step
+        """
         if self.is_kinematic or not self.game_object:
             return
 
-        # Apply accumulated forces
-        if self.accumulated_force.magnitude() > 0:
-            acceleration = self.accumulated_force / self.mass
-            self.velocity += acceleration * delta_time
-            self.accumulated_force = Vector2.zero()
+        # Apply accumulated forces and linear drag in one step
+        velocity = self.velocity
+        force = self.accumulated_force
+        velocity.x, velocity.y = _integrate_linear(
+            velocity.x, velocity.y, force.x, force.y,
+            1.0 / self.mass, self.drag, delta_time)
+        force.x = force.y = 0.0
 
         # Apply accumulated torque
         if self.accumulated_torque != 0 and not self.freeze_rotation:
@@ -200,21 +248,17 @@ class Rigidbody(Component):
             self.angular_velocity += angular_acceleration * delta_time
             self.accumulated_torque = 0.0
 
-        # Apply drag
-        if self.drag > 0:
-            drag_factor = max(0, 1 - self.drag * delta_time)
-            self.velocity *= drag_factor
-
         # Apply angular drag
         if self.angular_drag > 0:
             angular_drag_factor = max(0, 1 - self.angular_drag * delta_time)
             self.angular_velocity *= angular_drag_factor
 
         # Update position
+        position = self.game_object.transform.position
         if not self.freeze_position_x:
-            self.game_object.transform.position.x += self.velocity.x * delta_time
+            position.x += velocity.x * delta_time
         if not self.freeze_position_y:
-            self.game_object.transform.position.y += self.velocity.y * delta_time
+            position.y += velocity.y * delta_time
 
         # Update rotation
         if not self.freeze_rotation:
@@ -244,4 +288,8 @@ class Rigidbody(Component):
 
     def __repr__(self) -> str:
         return (f"Rigidbody(mass={self.mass}, velocity={self.velocity}, "
-                f"angular_velocity={self.angular_velocity}, use_gravity={self.use_gravity})")
\ No newline at end of file
+                f"angular_velocity={self.angular_velocity}, use_gravity={self.use_gravity})")
+
+
+# Component classes registered by ComponentRegistry.auto_discover
+__voidray_components__ = (Rigidbody,)
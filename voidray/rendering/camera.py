@@ -345,14 +345,14 @@ class Camera:
     """
     
     def __init__(self, position: Vector2 = None):
-        self.transform = Transform(position or Vector2.zero())
+        self.transform = Transform(position)
         self.zoom = 1.0
         self.rotation = 0.0
         self.viewport_size = Vector2(800, 600)
         
     def set_position(self, position: Vector2):
         """Set camera position."""
-        self.transform.position = position
+        self.transform.position = position.copy()
     
     def move(self, offset: Vector2):
         """Move camera by offset."""
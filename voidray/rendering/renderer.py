@@ -5,10 +5,13 @@ rendering system with texture mapping, raycasting, and advanced visual effects.
 
 import pygame
 import math
+import time
 import numpy as np
+from collections import OrderedDict
 from typing import Optional, Tuple, List, Dict, Union
 from ..math.vector2 import Vector2
 from ..utils.color import Color
+from ..utils.fonts import get_font, clear_font_cache
 
 
 class TextureAtlas:
@@ -45,6 +48,40 @@ class Wall:
         return Vector2(-direction.y, direction.x).normalized()
 
 
+# Rendered text keyed by (text, color, size, font_name); UI text is mostly
+# static between frames
+_TEXT_SURFACE_CACHE: Dict[Tuple, pygame.Surface] = {}
+_TEXT_SURFACE_CACHE_LIMIT = 512
+
+
+def _render_text(text: str, color: Tuple[int, int, int], font_size: int,
+                 font_name: Optional[str]) -> pygame.Surface:
+    """Get a cached text surface, rendering it on first use."""
+    key = (text, tuple(color), font_size, font_name)
+    surface = _TEXT_SURFACE_CACHE.get(key)
+    if surface is None:
+        if len(_TEXT_SURFACE_CACHE) >= _TEXT_SURFACE_CACHE_LIMIT:
+            _TEXT_SURFACE_CACHE.clear()
+        surface = get_font(font_name, font_size).render(text, True, color)
+        _TEXT_SURFACE_CACHE[key] = surface
+    return surface
+
+
+# Trig lookup tables for the raycaster at 0.1 degree resolution
+TRIG_LUT_STEPS = 3600
+_LUT_ANGLES = np.radians(np.arange(TRIG_LUT_STEPS) / (TRIG_LUT_STEPS / 360.0))
+COS_LUT = np.cos(_LUT_ANGLES)
+SIN_LUT = np.sin(_LUT_ANGLES)
+
+
+# Packed wall layout for the raycaster: one contiguous record per wall
+WALL_DTYPE = np.dtype([
+    ('sx', 'f8'), ('sy', 'f8'),
+    ('ex', 'f8'), ('ey', 'f8'),
+    ('tid', 'i4'), ('h', 'f8')
+])
+
+
 class Sector:
     """Represents a sector in DOOM-style rendering."""
 
@@ -125,6 +162,10 @@ class Advanced2DRenderer:
         self.bloom_enabled = False
         self.ssao_enabled = False
         
+        # Queued rect primitives grouped by (color, filled); None while
+        # drawing immediately (see begin_frame)
+        self._rect_queue: Optional[Dict[Tuple, List]] = None
+        
         # Performance tracking
         self.draw_calls_this_frame = 0
         self.vertices_rendered = 0
@@ -146,10 +187,37 @@ class Advanced2DRenderer:
         self.sectors: List[Sector] = []
         self.walls: List[Wall] = []
 
+        # Struct-of-arrays copy of wall geometry used by the raycaster
+        self.wall_array = np.zeros(0, dtype=WALL_DTYPE)
+        self.wall_texture_names: List[Optional[str]] = []
+        self._walls_dirty = False
+
         # Lighting system
         self.ambient_light = 0.3
         self.light_sources: List[Dict] = []
 
+        # Rendered 2.5D views (surface, z-buffer) keyed by quantized camera
+        # pose and view settings, least recently used first. Each entry holds
+        # a full screen copy; set view_cache_size to 0 to disable.
+        self.view_cache_size = 16
+        self.view_cache_position_step = 4.0
+        self.view_cache_angle_steps = 64
+        self._view_cache: OrderedDict = OrderedDict()
+
+        # Progressive 2.5D rendering: with a budget set, every
+        # progressive_stride-th column is cast first as a wide preview and the
+        # gaps are refined in halving passes until the budget runs out. An
+        # unfinished view is kept and refined further on the next frame if
+        # the camera has not moved out of its cache slot.
+        self.progressive_budget_ms = 0.0
+        self.progressive_stride = 4
+        self._progressive_view: Optional[Tuple] = None
+
+        # Per-column ray angle offsets from the view direction, built on
+        # first use for the current (width, field_of_view)
+        self._column_offsets: Optional[np.ndarray] = None
+        self._column_offsets_key: Optional[Tuple[int, float]] = None
+
         # Effects
         self.enable_fog = True
         self.enable_lighting = True
@@ -172,13 +240,44 @@ class Advanced2DRenderer:
 
     def present(self):
         """Present the rendered frame."""
+        if self._rect_queue is not None:
+            self.end_frame()
         pygame.display.flip()
 
+    def begin_frame(self):
+        """
+        Start queuing rectangles instead of drawing them immediately.
+
+        Rectangles drawn until end_frame() are grouped by color and style and
+        submitted together, so they land on top of anything else drawn in
+        between and may be reordered relative to other colors. Use it for
+        flat layers such as UI or debug geometry.
+        """
+        self._rect_queue = {}
+
+    def end_frame(self):
+        """Draw all rectangles queued since begin_frame() and stop queuing."""
+        queue = self._rect_queue
+        self._rect_queue = None
+        if not queue:
+            return
+
+        screen = self.screen
+        draw_rect = pygame.draw.rect
+        for (color, filled), rects in queue.items():
+            if filled:
+                for rect in rects:
+                    draw_rect(screen, color, rect)
+            else:
+                for rect in rects:
+                    draw_rect(screen, color, rect, 1)
+
     def load_texture(self, name: str, image_path: str) -> bool:
         """Load a texture for 2.5D rendering."""
         try:
             surface = pygame.image.load(image_path).convert_alpha()
             self.texture_atlas.add_texture(name, surface)
+            self.invalidate_view_cache()
             print(f"Loaded texture: {name}")
             return True
         except pygame.error as e:
@@ -220,17 +319,42 @@ class Advanced2DRenderer:
                         surface.set_at((x, y), (140, 140, 160))
 
         self.texture_atlas.add_texture(name, surface)
+        self.invalidate_view_cache()
         return surface
 
     def add_sector(self, sector: Sector):
         """Add a sector to the world."""
         self.sectors.append(sector)
         self.walls.extend(sector.walls)
+        self._walls_dirty = True
 
     def add_wall(self, start: Vector2, end: Vector2, texture_name: str = None, height: float = 64.0):
         """Add a wall to the world."""
         wall = Wall(start, end, texture_name, height)
         self.walls.append(wall)
+        self._walls_dirty = True
+
+    def build_wall_arrays(self):
+        """
+        Pack the wall list into the struct-of-arrays layout used by cast_ray.
+
+        Rebuilt lazily on the next ray after walls are added; call it
+        manually after mutating self.walls directly (e.g. for a new level).
+        """
+        self.wall_texture_names = []
+        texture_ids: Dict[Optional[str], int] = {}
+        records = []
+        for wall in self.walls:
+            tid = texture_ids.get(wall.texture_name)
+            if tid is None:
+                tid = len(self.wall_texture_names)
+                texture_ids[wall.texture_name] = tid
+                self.wall_texture_names.append(wall.texture_name)
+            records.append((wall.start.x, wall.start.y, wall.end.x, wall.end.y,
+                            tid, wall.height))
+        self.wall_array = np.array(records, dtype=WALL_DTYPE)
+        self._walls_dirty = False
+        self.invalidate_view_cache()
 
     def add_light_source(self, position: Vector2, intensity: float = 1.0, 
                         color: Tuple[int, int, int] = (255, 255, 255), radius: float = 100.0):
@@ -241,77 +365,206 @@ class Advanced2DRenderer:
             'color': color,
             'radius': radius
         })
+        self.invalidate_view_cache()
+
+    def invalidate_view_cache(self):
+        """
+        Forget cached 2.5D views.
+
+        Walls, textures and lights added through the renderer do this
+        automatically; call it after changing them in place (e.g. moving a
+        light).
+        """
+        self._view_cache.clear()
+        self._progressive_view = None
 
     def cast_ray(self, origin: Vector2, direction: Vector2) -> Tuple[float, Wall, float]:
         """Cast a ray and return distance, wall hit, and texture coordinate."""
-        min_distance = float('inf')
-        hit_wall = None
-        texture_coord = 0.0
-
-        for wall in self.walls:
-            # Line intersection math
-            wall_vec = wall.end - wall.start
-            to_start = origin - wall.start
+        if self._walls_dirty or len(self.wall_array) != len(self.walls):
+            self.build_wall_arrays()
+        if not self.walls:
+            return float('inf'), None, 0.0
 
-            # Calculate intersection using cross products
-            wall_cross_ray = wall_vec.x * direction.y - wall_vec.y * direction.x
+        walls = self.wall_array
+        dir_x = direction.x
+        dir_y = direction.y
 
-            if abs(wall_cross_ray) < 1e-10:  # Parallel lines
-                continue
+        # Line intersection math, evaluated for every wall at once
+        wall_x = walls['ex'] - walls['sx']
+        wall_y = walls['ey'] - walls['sy']
+        to_start_x = origin.x - walls['sx']
+        to_start_y = origin.y - walls['sy']
 
-            t = (to_start.x * direction.y - to_start.y * direction.x) / wall_cross_ray
-            u = (to_start.x * wall_vec.y - to_start.y * wall_vec.x) / wall_cross_ray
+        # Calculate intersection using cross products
+        wall_cross_ray = wall_x * dir_y - wall_y * dir_x
+        parallel = np.abs(wall_cross_ray) < 1e-10
+        wall_cross_ray[parallel] = 1.0
 
-            if 0 <= t <= 1 and u > 0:  # Valid intersection
-                distance = u
-                if distance < min_distance:
-                    min_distance = distance
-                    hit_wall = wall
-                    texture_coord = t  # Position along wall for texture mapping
+        t = (to_start_x * dir_y - to_start_y * dir_x) / wall_cross_ray
+        u = (to_start_x * wall_y - to_start_y * wall_x) / wall_cross_ray
 
-        return min_distance, hit_wall, texture_coord
+        # Valid intersection: within the segment and in front of the ray
+        u[parallel | (t < 0) | (t > 1) | (u <= 0)] = np.inf
 
-    def render_2_5d_view(self, camera_pos: Vector2, camera_angle: float):
-        """Render the 2.5D view using raycasting."""
-        half_fov = math.radians(self.field_of_view / 2)
+        index = int(np.argmin(u))
+        distance = float(u[index])
+        if distance == float('inf'):
+            return distance, None, 0.0
 
-        for x in range(self.width):
-            # Calculate ray angle
-            screen_x = (2 * x / self.width) - 1
-            ray_angle = camera_angle + screen_x * half_fov
-            ray_direction = Vector2(math.cos(ray_angle), math.sin(ray_angle))
+        # Position along wall for texture mapping
+        return distance, self.walls[index], float(t[index])
 
-            # Cast ray
-            distance, wall, texture_coord = self.cast_ray(camera_pos, ray_direction)
+    def render_2_5d_view(self, camera_pos: Vector2, camera_angle: float):
+        """
+        Render the 2.5D view using raycasting.
 
-            if wall and distance < self.render_distance:
-                # Calculate wall height on screen
-                wall_height = int(wall.height * self.height / distance)
-                wall_top = (self.height - wall_height) // 2
-                wall_bottom = wall_top + wall_height
+        The walls, floor and ceiling only depend on the camera pose, so the
+        finished view is cached by pose quantized to view_cache_position_step
+        world units and 1/view_cache_angle_steps radians. A stationary or
+        slowly turning camera then costs a single blit.
 
-                # Apply camera pitch
-                pitch_offset = int(self.camera_pitch * self.height / 100)
-                wall_top += pitch_offset
-                wall_bottom += pitch_offset
+        With progressive_budget_ms set, a coarse preview is drawn first and
+        refined only while the budget lasts, so a new view costs a bounded
+        amount of frame time; it is cached once fully refined.
+        """
+        cache_key = None
+        if self.view_cache_size > 0:
+            if self._walls_dirty or len(self.wall_array) != len(self.walls):
+                self.build_wall_arrays()
+            step = self.view_cache_position_step
+            cache_key = (int(camera_pos.x // step), int(camera_pos.y // step),
+                         int(camera_angle * self.view_cache_angle_steps),
+                         self.camera_pitch, self.field_of_view, self.render_distance,
+                         self.fog_distance, self.enable_fog, self.enable_lighting,
+                         self.ambient_light)
+            cached = self._view_cache.get(cache_key)
+            if cached is not None:
+                self._view_cache.move_to_end(cache_key)
+                view, z_buffer = cached
+                self.screen.blit(view, (0, 0))
+                self.z_buffer[:] = z_buffer
+                return
+
+        passes = self._get_column_passes()
+        first_pass = 0
+        deadline = None
+        if self.progressive_budget_ms > 0 and len(passes) > 1:
+            deadline = time.perf_counter() + self.progressive_budget_ms / 1000.0
+            partial = self._progressive_view
+            if partial is not None and cache_key is not None and partial[0] == cache_key:
+                _, view, z_buffer, first_pass = partial
+                self.screen.blit(view, (0, 0))
+                self.z_buffer[:] = z_buffer
+        self._progressive_view = None
+
+        done = self._raycast_view(camera_pos, camera_angle, passes, first_pass, deadline)
+
+        if done < len(passes):
+            if cache_key is not None:
+                self._progressive_view = (cache_key, self.screen.copy(),
+                                          self.z_buffer.copy(), done)
+            return
 
-                # Get wall texture
-                texture = None
-                if wall.texture_name:
-                    texture = self.texture_atlas.get_texture(wall.texture_name)
+        if cache_key is not None:
+            self._view_cache[cache_key] = (self.screen.copy(), self.z_buffer.copy())
+            if len(self._view_cache) > self.view_cache_size:
+                self._view_cache.popitem(last=False)
 
-                # Calculate lighting
-                light_factor = self._calculate_lighting(camera_pos, wall, distance)
+    def _get_column_passes(self) -> List[Tuple[range, int]]:
+        """
+        Split the screen columns into (columns, span) passes.
 
-                # Render wall column
-                self._render_wall_column(x, wall_top, wall_bottom, texture, 
-                                       texture_coord, light_factor, distance)
+        The first pass casts every progressive_stride-th column and draws it
+        stride pixels wide; each later pass fills the remaining gaps at half
+        the span, down to single columns.
+        """
+        stride = 1
+        if self.progressive_budget_ms > 0:
+            while stride * 2 <= max(1, self.progressive_stride):
+                stride *= 2
+        passes = [(range(0, self.width, stride), stride)]
+        while stride > 1:
+            stride //= 2
+            passes.append((range(stride, self.width, stride * 2), stride))
+        return passes
+
+    def _raycast_view(self, camera_pos: Vector2, camera_angle: float,
+                      passes: List[Tuple[range, int]], first_pass: int = 0,
+                      deadline: Optional[float] = None) -> int:
+        """
+        Raycast the screen columns pass by pass and draw their walls.
 
-                # Update z-buffer
-                self.z_buffer[x] = distance
+        Starting at first_pass, at least one pass is drawn; later ones stop
+        once deadline (a perf_counter value) has passed. Returns the number
+        of passes completed.
+        """
+        # Floor and ceiling are flat colors split at the horizon, so they are
+        # drawn once for the whole view and the walls go on top
+        pitch_offset = int(self.camera_pitch * self.height / 100)
+        horizon = self.height // 2 + pitch_offset
+        if first_pass == 0:
+            self._render_floor_ceiling(horizon)
+
+        # Look up every column's ray direction in the trig tables instead of
+        # calling cos/sin per column
+        ray_angles = camera_angle + self._get_column_offsets()
+        lut_index = np.rint(ray_angles * (TRIG_LUT_STEPS / (2 * math.pi))).astype(np.int64) % TRIG_LUT_STEPS
+        ray_cos = COS_LUT[lut_index].tolist()
+        ray_sin = SIN_LUT[lut_index].tolist()
+
+        for pass_index in range(first_pass, len(passes)):
+            if pass_index > first_pass and deadline is not None and time.perf_counter() > deadline:
+                return pass_index
+            columns, span = passes[pass_index]
+            for x in columns:
+                # Refined columns overwrite part of a wider preview column
+                if pass_index > 0:
+                    self._render_floor_ceiling(horizon, x, span)
+
+                ray_direction = Vector2(ray_cos[x], ray_sin[x])
+
+                # Cast ray
+                distance, wall, texture_coord = self.cast_ray(camera_pos, ray_direction)
+
+                if wall and distance < self.render_distance:
+                    # Calculate wall height on screen, shifted by the camera pitch
+                    wall_height = int(wall.height * self.height / distance)
+                    wall_top = (self.height - wall_height) // 2 + pitch_offset
+                    wall_bottom = wall_top + wall_height
+
+                    # Get wall texture
+                    texture = None
+                    if wall.texture_name:
+                        texture = self.texture_atlas.get_texture(wall.texture_name)
+
+                    # Calculate lighting
+                    light_factor = self._calculate_lighting(camera_pos, wall, distance)
+
+                    # Render wall column
+                    self._render_wall_column(x, wall_top, wall_bottom, texture,
+                                           texture_coord, light_factor, distance, span)
+
+                    # Update z-buffer
+                    self.z_buffer[x:x + span] = distance
+                elif pass_index > 0:
+                    self.z_buffer[x:x + span] = float('inf')
+
+        return len(passes)
+
+    def _get_column_offsets(self) -> np.ndarray:
+        """
+        Get each screen column's ray angle relative to the view direction.
 
-            # Render floor and ceiling
-            self._render_floor_ceiling_column(x, camera_pos, ray_direction, camera_angle)
+        The table only depends on the screen width and field of view, so it
+        is rebuilt only when one of them changes.
+        """
+        key = (self.width, self.field_of_view)
+        if self._column_offsets_key != key:
+            half_fov = math.radians(self.field_of_view / 2)
+            screen_x = (2 * np.arange(self.width) / self.width) - 1
+            self._column_offsets = screen_x * half_fov
+            self._column_offsets_key = key
+        return self._column_offsets
 
     def _calculate_lighting(self, camera_pos: Vector2, wall: Wall, distance: float) -> float:
         """Calculate lighting factor for a wall."""
@@ -341,8 +594,8 @@ class Advanced2DRenderer:
 
     def _render_wall_column(self, x: int, wall_top: int, wall_bottom: int, 
                           texture: pygame.Surface, texture_coord: float, 
-                          light_factor: float, distance: float):
-        """Render a single wall column with texture mapping."""
+                          light_factor: float, distance: float, span: int = 1):
+        """Render a wall column, span pixels wide, with texture mapping."""
         wall_top = max(0, wall_top)
         wall_bottom = min(self.height, wall_bottom)
 
@@ -370,31 +623,36 @@ class Advanced2DRenderer:
                     # Apply lighting
                     final_color = tuple(int(c * light_factor) for c in pixel_color)
 
-                    self.screen.set_at((x, y), final_color)
                 except IndexError:
                     # Fallback color
                     final_color = tuple(int(c * light_factor) for c in wall_color)
+
+                if span == 1:
                     self.screen.set_at((x, y), final_color)
+                else:
+                    self.screen.fill(final_color, (x, y, span, 1))
         else:
             # Render solid color wall
             final_color = tuple(int(c * light_factor) for c in wall_color)
-            pygame.draw.line(self.screen, final_color, (x, wall_top), (x, wall_bottom))
+            if span == 1:
+                pygame.draw.line(self.screen, final_color, (x, wall_top), (x, wall_bottom))
+            else:
+                self.screen.fill(final_color, (x, wall_top, span, wall_bottom - wall_top + 1))
 
-    def _render_floor_ceiling_column(self, x: int, camera_pos: Vector2, 
-                                   ray_direction: Vector2, camera_angle: float):
-        """Render floor and ceiling for a column using texture mapping."""
-        # Simple floor/ceiling rendering
-        horizon = self.height // 2 + int(self.camera_pitch * self.height / 100)
+    def _render_floor_ceiling(self, horizon: int, x: int = 0, width: Optional[int] = None):
+        """Fill the floor below and the ceiling above the horizon line."""
+        if width is None:
+            width = self.width
 
         # Floor
         if horizon < self.height:
             floor_color = (64, 64, 64)  # Dark gray
-            pygame.draw.line(self.screen, floor_color, (x, horizon), (x, self.height))
+            self.screen.fill(floor_color, (x, horizon, width, self.height - horizon))
 
         # Ceiling
         if horizon > 0:
             ceiling_color = (32, 32, 64)  # Dark blue
-            pygame.draw.line(self.screen, ceiling_color, (x, 0), (x, horizon))
+            self.screen.fill(ceiling_color, (x, 0, width, horizon))
 
     def render_sprite_2_5d(self, sprite_pos: Vector2, sprite_texture: str, 
                          camera_pos: Vector2, camera_angle: float, scale: float = 1.0):
@@ -601,13 +859,7 @@ class Advanced2DRenderer:
     def draw_rect(self, position: Vector2, size: Vector2, 
                   color: Tuple[int, int, int], filled: bool = True):
         """Draw a rectangle."""
-        screen_pos = self.world_to_screen(position)
-        rect = pygame.Rect(screen_pos.x, screen_pos.y, size.x, size.y)
-
-        if filled:
-            pygame.draw.rect(self.screen, color, rect)
-        else:
-            pygame.draw.rect(self.screen, color, rect, 1)
+        self.draw_rect_xywh(position.x, position.y, size.x, size.y, color, filled)
 
     def draw_circle(self, center: Vector2, radius: float, 
                    color: Tuple[int, int, int], filled: bool = True):
@@ -633,8 +885,7 @@ class Advanced2DRenderer:
                   color: Tuple[int, int, int] = Color.WHITE, 
                   font_size: int = 24, font_name: Optional[str] = None):
         """Draw text."""
-        font = pygame.font.Font(font_name, font_size)
-        text_surface = font.render(text, True, color)
+        text_surface = _render_text(text, color, font_size, font_name)
 
         screen_pos = self.world_to_screen(position)
         self.screen.blit(text_surface, (screen_pos.x, screen_pos.y))
@@ -652,8 +903,12 @@ class Advanced2DRenderer:
         Returns:
             (width, height) tuple
         """
-        font = pygame.font.Font(font_name, font_size)
-        return font.size(text)
+        return get_font(font_name, font_size).size(text)
+
+    def cleanup(self):
+        """Release cached fonts and text, which are invalid once pygame quits."""
+        clear_font_cache()
+        _TEXT_SURFACE_CACHE.clear()
 
     def get_memory_usage(self) -> Dict[str, int]:
         """Get renderer memory usage statistics."""
@@ -709,14 +964,56 @@ class Advanced2DRenderer:
     def draw_rect(self, position: Vector2, size: Vector2, 
                   color: Tuple[int, int, int], filled: bool = True):
         """Draw a rectangle."""
-        screen_pos = self.world_to_screen(position)
-        rect = pygame.Rect(screen_pos.x, screen_pos.y, size.x, size.y)
+        self.draw_rect_xywh(position.x, position.y, size.x, size.y, color, filled)
+
+    def draw_rect_xywh(self, x: float, y: float, width: float, height: float,
+                       color: Tuple[int, int, int], filled: bool = True):
+        """
+        Draw a rectangle from raw world coordinates.
+
+        Same as draw_rect, but callers that already have floats don't need
+        to build Vector2 temporaries just to pass them in.
+        """
+        rect = (x - self.camera_offset.x, y - self.camera_offset.y, width, height)
+
+        queue = self._rect_queue
+        if queue is not None:
+            key = (tuple(color), filled)
+            batch = queue.get(key)
+            if batch is None:
+                queue[key] = [rect]
+            else:
+                batch.append(rect)
+            return
 
         if filled:
             pygame.draw.rect(self.screen, color, rect)
         else:
             pygame.draw.rect(self.screen, color, rect, 1)
 
+    def draw_rects(self, rects: List[Tuple[Tuple[float, float, float, float], Tuple[int, int, int]]],
+                   filled: bool = True):
+        """
+        Draw many rectangles in one call.
+
+        Args:
+            rects: List of ((x, y, width, height), color) in world coordinates.
+                   Static lists can be built once and reused every frame.
+            filled: Whether to fill the rectangles or draw outlines
+        """
+        offset_x = self.camera_offset.x
+        offset_y = self.camera_offset.y
+        screen = self.screen
+
+        if filled:
+            fill = screen.fill
+            for (x, y, w, h), color in rects:
+                fill(color, (x - offset_x, y - offset_y, w, h))
+        else:
+            draw_rect = pygame.draw.rect
+            for (x, y, w, h), color in rects:
+                draw_rect(screen, color, (x - offset_x, y - offset_y, w, h), 1)
+
     def draw_circle(self, center: Vector2, radius: float, 
                    color: Tuple[int, int, int], filled: bool = True):
         """Draw a circle."""
@@ -741,8 +1038,7 @@ class Advanced2DRenderer:
                   color: Tuple[int, int, int] = (255, 255, 255), 
                   font_size: int = 24, font_name: Optional[str] = None):
         """Draw text."""
-        font = pygame.font.Font(font_name, font_size)
-        text_surface = font.render(text, True, color)
+        text_surface = _render_text(text, color, font_size, font_name)
 
         screen_pos = self.world_to_screen(position)
         self.screen.blit(text_surface, (screen_pos.x, screen_pos.y))
@@ -750,8 +1046,7 @@ class Advanced2DRenderer:
     def get_text_size(self, text: str, font_size: int = 24, 
                      font_name: Optional[str] = None) -> Tuple[int, int]:
         """Get the size of rendered text."""
-        font = pygame.font.Font(font_name, font_size)
-        return font.size(text)
+        return get_font(font_name, font_size).size(text)
 
 
 # Alias for backward compatibility
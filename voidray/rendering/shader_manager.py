@@ -65,19 +65,29 @@ class ScanlineShader(Shader):
         super().__init__("scanlines")
         self.line_intensity = 0.3
         self.line_spacing = 2
+        self._overlay: Optional[pygame.Surface] = None
+        self._overlay_key = None
+
+    def _build_overlay(self, size) -> pygame.Surface:
+        """Draw the scanline overlay for a surface size."""
+        overlay = pygame.Surface(size, pygame.SRCALPHA)
+        width, height = size
+        alpha = int(255 * self.line_intensity)
+        for y in range(0, height, self.line_spacing):
+            pygame.draw.line(overlay, (0, 0, 0, alpha), (0, y), (width, y))
+        return overlay
 
     def apply(self, surface: pygame.Surface, delta_time: float) -> pygame.Surface:
         """Apply scanline effect."""
         result = surface.copy()
-        overlay = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
 
-        height = surface.get_height()
-        for y in range(0, height, self.line_spacing):
-            alpha = int(255 * self.line_intensity)
-            pygame.draw.line(overlay, (0, 0, 0, alpha), 
-                           (0, y), (surface.get_width(), y))
+        # The overlay is static; only redraw it when its inputs change
+        key = (surface.get_size(), self.line_spacing, self.line_intensity)
+        if key != self._overlay_key:
+            self._overlay = self._build_overlay(key[0])
+            self._overlay_key = key
 
-        result.blit(overlay, (0, 0), special_flags=pygame.BLEND_ALPHA_SDL2)
+        result.blit(self._overlay, (0, 0), special_flags=pygame.BLEND_ALPHA_SDL2)
         return result
 
 
@@ -124,3 +124,7 @@ class ScriptComponent(Component):
         
         self.script_instance = None
         self.initialized = False
+
+
+# Component classes registered by ComponentRegistry.auto_discover
+__voidray_components__ = (ScriptComponent,)
@@ -199,6 +199,43 @@ class ScriptManager:
         
         return None
     
+    def register_script_scenes(self, script_name: str, engine=None) -> bool:
+        """
+        Let a script register its scenes with a running engine.
+        
+        Scripts that define ``register(engine)`` can add their scenes to the
+        engine in-process, so a launcher switches to them with set_scene()
+        instead of starting a new interpreter and window for each game.
+        
+        Args:
+            script_name: Name of the script
+            engine: Engine to register with (defaults to the global engine)
+            
+        Returns:
+            True if the script's register function ran successfully
+        """
+        if engine is None:
+            import voidray
+            engine = voidray.get_engine()
+        
+        module = self.loaded_scripts.get(script_name) or self.load_script(script_name)
+        if module is None:
+            return False
+        
+        register = getattr(module, 'register', None)
+        if register is None:
+            print(f"Script {script_name} has no register(engine) function")
+            return False
+        
+        try:
+            register(engine)
+            return True
+        except Exception as e:
+            print(f"Error registering scenes from script {script_name}: {e}")
+            traceback.print_exc()
+        
+        return False
+    
     def reload_script(self, script_name: str) -> bool:
         """
         Reload a script and update all instances.
@@ -4,7 +4,17 @@ VoidRay Development Tools
 Tools and utilities for game development.
 """
 
-from .level_editor import LevelEditor
 from .performance_monitor import PerformanceMonitor
 
-__all__ = ['LevelEditor', 'PerformanceMonitor']
+__all__ = ['LevelEditor', 'ProjectTemplateManager', 'PerformanceMonitor']
+
+
+def __getattr__(name):
+    """Import the editor tools on first use; games rarely need them."""
+    if name == 'LevelEditor':
+        from .level_editor import LevelEditor
+        return LevelEditor
+    if name == 'ProjectTemplateManager':
+        from .project_templates import ProjectTemplateManager
+        return ProjectTemplateManager
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -352,6 +352,7 @@ from typing import Dict, List, Optional, Tuple, Any
 from ..math.vector2 import Vector2
 from ..tilemap.tilemap_system import Tilemap, TileLayer
 from ..input.input_manager import InputManager, Keys, MouseButtons
+from ..utils.fonts import get_font
 
 
 class LevelEditor:
@@ -423,37 +424,40 @@ class LevelEditor:
     
     def _handle_input(self):
         """Handle editor input."""
+        input_manager = self.input_manager
+        just_pressed = input_manager.is_key_just_pressed
+        
         # Tool switching
-        if self.input_manager.is_key_just_pressed(Keys.NUM_1):
+        if just_pressed(Keys.NUM_1):
             self.current_tool = "paint"
-        elif self.input_manager.is_key_just_pressed(Keys.NUM_2):
+        elif just_pressed(Keys.NUM_2):
             self.current_tool = "erase"
-        elif self.input_manager.is_key_just_pressed(Keys.NUM_3):
+        elif just_pressed(Keys.NUM_3):
             self.current_tool = "fill"
-        elif self.input_manager.is_key_just_pressed(Keys.NUM_4):
+        elif just_pressed(Keys.NUM_4):
             self.current_tool = "select"
         
         # Undo/Redo
-        if self.input_manager.is_key_pressed(Keys.CTRL):
-            if self.input_manager.is_key_just_pressed(Keys.Z):
+        if input_manager.is_key_pressed(Keys.CTRL):
+            if just_pressed(Keys.Z):
                 self.undo()
-            elif self.input_manager.is_key_just_pressed(Keys.Y):
+            elif just_pressed(Keys.Y):
                 self.redo()
         
         # Layer switching
-        if self.input_manager.is_key_just_pressed(Keys.UP):
+        if just_pressed(Keys.UP):
             self.change_layer(1)
-        elif self.input_manager.is_key_just_pressed(Keys.DOWN):
+        elif just_pressed(Keys.DOWN):
             self.change_layer(-1)
         
         # Mouse input
-        mouse_pos = self.input_manager.get_mouse_position()
+        mouse_pos = input_manager.get_mouse_position()
         world_pos = self.screen_to_world(mouse_pos)
         tile_pos = self.world_to_tile(world_pos)
         
-        if self.input_manager.is_mouse_button_pressed(MouseButtons.LEFT):
+        if input_manager.is_mouse_button_pressed(MouseButtons.LEFT):
             self._handle_mouse_action(tile_pos, True)
-        elif self.input_manager.is_mouse_button_pressed(MouseButtons.RIGHT):
+        elif input_manager.is_mouse_button_pressed(MouseButtons.RIGHT):
             self._handle_mouse_action(tile_pos, False)
     
     def _handle_mouse_action(self, tile_pos: Vector2, primary: bool):
@@ -638,16 +642,18 @@ class LevelEditor:
     
     def _update_camera(self, delta_time: float):
         """Update camera movement."""
-        move_speed = 300.0 / self.zoom_level
-        
-        if self.input_manager.is_key_pressed(Keys.A):
-            self.camera_position.x -= move_speed * delta_time
-        if self.input_manager.is_key_pressed(Keys.D):
-            self.camera_position.x += move_speed * delta_time
-        if self.input_manager.is_key_pressed(Keys.W):
-            self.camera_position.y -= move_speed * delta_time
-        if self.input_manager.is_key_pressed(Keys.S):
-            self.camera_position.y += move_speed * delta_time
+        step = 300.0 / self.zoom_level * delta_time
+        is_pressed = self.input_manager.is_key_pressed
+        camera_position = self.camera_position
+        
+        if is_pressed(Keys.A):
+            camera_position.x -= step
+        if is_pressed(Keys.D):
+            camera_position.x += step
+        if is_pressed(Keys.W):
+            camera_position.y -= step
+        if is_pressed(Keys.S):
+            camera_position.y += step
         
         # Zoom
         wheel_delta = self.input_manager.get_mouse_wheel_delta()
@@ -807,7 +813,7 @@ class LevelEditor:
         
         # Draw layer list
         if self.current_tilemap:
-            font = pygame.font.Font(None, 24)
+            font = get_font(None, 24)
             for i, layer in enumerate(self.current_tilemap.layers):
                 y_offset = pos.y + 30 + i * 25
                 
@@ -833,7 +839,7 @@ class LevelEditor:
         pygame.draw.rect(self.renderer.screen, (100, 100, 100), panel_rect, 2)
         
         # Draw properties
-        font = pygame.font.Font(None, 20)
+        font = get_font(None, 20)
         y_offset = pos.y + 25
         
         properties = [
@@ -49,21 +49,24 @@ class Player(Sprite):
         self.create_colored_rect(32, 32, (0, 100, 255))
         self.speed = 200
         self.jump_strength = 400
+        self._input = None
         
     def update(self, delta_time):
         super().update(delta_time)
         
-        engine = voidray.get_engine()
-        velocity = Vector2.zero()
+        # Look the input manager up once instead of every frame
+        input_manager = self._input
+        if input_manager is None:
+            input_manager = self._input = voidray.get_engine().input_manager
+        keys = input_manager.keys
         
-        if engine.input_manager.is_key_pressed(Keys.LEFT):
-            velocity.x = -self.speed
-        if engine.input_manager.is_key_pressed(Keys.RIGHT):
-            velocity.x = self.speed
-        if engine.input_manager.is_key_just_pressed(Keys.SPACE):
-            velocity.y = -self.jump_strength
-            
-        self.transform.position += velocity * delta_time
+        # Plain floats: no temporary Vector2 per frame
+        vx = self.speed if keys[Keys.RIGHT] else -self.speed if keys[Keys.LEFT] else 0.0
+        vy = -self.jump_strength if input_manager.is_key_just_pressed(Keys.SPACE) else 0.0
+        
+        position = self.transform.position
+        position.x += vx * delta_time
+        position.y += vy * delta_time
 
 class GameScene(Scene):
     def __init__(self):
@@ -114,23 +117,24 @@ class Player(Sprite):
         super().__init__("Player")
         self.create_colored_triangle(20, (0, 255, 0))
         self.speed = 300
+        self._input = None
         
     def update(self, delta_time):
         super().update(delta_time)
         
-        engine = voidray.get_engine()
-        velocity = Vector2.zero()
-        
-        if engine.input_manager.is_key_pressed(Keys.W):
-            velocity.y = -self.speed
-        if engine.input_manager.is_key_pressed(Keys.S):
-            velocity.y = self.speed
-        if engine.input_manager.is_key_pressed(Keys.A):
-            velocity.x = -self.speed
-        if engine.input_manager.is_key_pressed(Keys.D):
-            velocity.x = self.speed
-            
-        self.transform.position += velocity * delta_time
+        # Look the input manager up once instead of every frame
+        input_manager = self._input
+        if input_manager is None:
+            input_manager = self._input = voidray.get_engine().input_manager
+        keys = input_manager.keys
+        
+        # Plain floats: no temporary Vector2 per frame
+        vx = self.speed if keys[Keys.D] else -self.speed if keys[Keys.A] else 0.0
+        vy = self.speed if keys[Keys.S] else -self.speed if keys[Keys.W] else 0.0
+        
+        position = self.transform.position
+        position.x += vx * delta_time
+        position.y += vy * delta_time
 
 class GameScene(Scene):
     def __init__(self):
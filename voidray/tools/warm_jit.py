@@ -0,0 +1,53 @@
+"""
+VoidRay JIT Warm-up Tool
+Pre-compiles the numba kernels into a cache directory that ships with a game.
+
+Usage:
+    python -m voidray.tools.warm_jit [output_dir]
+
+The output directory defaults to ``numba_cache`` in the current directory.
+Copy it next to the game's entry script so first launches load the kernels
+instead of compiling them. numba keys cached kernels by the source file's
+timestamp and size, so run this against the installed copy of the engine.
+"""
+
+import sys
+import os
+import subprocess
+
+# Add the parent directory to the path so we can import voidray
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+# Runs in a fresh interpreter: numba fixes each kernel's cache location when
+# the kernel module is imported, which has already happened in this process.
+# Importing the kernel modules registers their signatures.
+_WARM_SCRIPT = """
+import sys
+import voidray
+from voidray.animation import animation_manager
+from voidray.utils.jit import NUMBA_AVAILABLE, precompile
+if not NUMBA_AVAILABLE:
+    print("numba is not installed; nothing to compile")
+    sys.exit(1)
+print(f"Compiled {precompile()} kernel signatures")
+"""
+
+
+def main(argv=None):
+    """Main function for the JIT warm-up."""
+    argv = sys.argv[1:] if argv is None else argv
+    cache_dir = os.path.abspath(argv[0] if argv else 'numba_cache')
+    os.makedirs(cache_dir, exist_ok=True)
+
+    env = dict(os.environ, NUMBA_CACHE_DIR=cache_dir)
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, (
+        os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')),
+        env.get('PYTHONPATH'))))
+    result = subprocess.call([sys.executable, '-c', _WARM_SCRIPT], env=env)
+    if result == 0:
+        print(f"Kernel cache written to {cache_dir}")
+    return result
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -8,6 +8,7 @@ import pygame
 from typing import Callable, Optional
 from ..math.vector2 import Vector2
 from .ui_element import UIElement
+from ..core.logger import engine_logger
 
 
 class Button(UIElement):
@@ -58,7 +59,8 @@ class Button(UIElement):
         
         self.pressed = True
         super().on_click(mouse_pos)
-        print(f"Button clicked: {self.text}")
+        if engine_logger.debug_enabled():
+            engine_logger.debug(f"Button clicked: {self.text}")
     
     def on_mouse_enter(self):
         """Handle mouse enter."""
@@ -39,6 +39,10 @@ class Label(UIElement):
         # Text alignment
         self.alignment = "left"  # "left", "center", "right"
         
+        # Line layout cached between frames: (line, x offset, y offset) tuples
+        self._layout = []
+        self._layout_key = None
+        
         # Auto-size based on text
         self._update_size()
     
@@ -83,26 +87,49 @@ class Label(UIElement):
         # Render background if needed
         super().render(renderer)
         
-        # Split text into lines
+        # Lay the lines out again only when something affecting them changed
+        layout_key = (self.text, self.font_size, self.alignment, self.size.x)
+        if layout_key != self._layout_key:
+            self._layout = self._build_layout(renderer)
+            self._layout_key = layout_key
+        
+        x = self.position.x
+        y = self.position.y
+        for line, offset_x, offset_y in self._layout:
+            renderer.draw_text(
+                line,
+                Vector2(x + offset_x, y + offset_y),
+                self.color,
+                font_size=self.font_size
+            )
+    
+    def _build_layout(self, renderer) -> list:
+        """
+        Compute each line's offset from the label position.
+        
+        Args:
+            renderer: Renderer used to measure text for alignment
+            
+        Returns:
+            List of (line, x offset, y offset) tuples
+        """
+        layout = []
         lines = self.text.split('\n')
         line_height = self.font_size * 1.2
         
         for i, line in enumerate(lines):
-            line_pos = Vector2(self.position.x, self.position.y + i * line_height)
+            offset_x = 0
             
             # Apply alignment
             if self.alignment == "center":
                 if hasattr(renderer, 'get_text_size'):
                     text_width, _ = renderer.get_text_size(line, self.font_size)
-                    line_pos.x += (self.size.x - text_width) // 2
+                    offset_x = (self.size.x - text_width) // 2
             elif self.alignment == "right":
                 if hasattr(renderer, 'get_text_size'):
                     text_width, _ = renderer.get_text_size(line, self.font_size)
-                    line_pos.x += self.size.x - text_width
+                    offset_x = self.size.x - text_width
             
-            renderer.draw_text(
-                line,
-                line_pos,
-                self.color,
-                font_size=self.font_size
-            )
+            layout.append((line, offset_x, i * line_height))
+        
+        return layout
@@ -68,6 +68,7 @@ class TextBox(UIElement):
         super().on_focus_gained()
         self.border_color = self.focused_border_color
         self.cursor_visible = True
+        self.cursor_blink_timer = 0
     
     def on_focus_lost(self):
         """Handle losing focus."""
@@ -209,10 +210,11 @@ class TextBox(UIElement):
         
         # Update cursor blink
         if self.focused:
-            self.cursor_blink_timer += delta_time
-            if self.cursor_blink_timer >= self.cursor_blink_rate:
-                self.cursor_visible = not self.cursor_visible
-                self.cursor_blink_timer = 0
+            # Visible for the first half of each on/off cycle
+            period = 2 * self.cursor_blink_rate
+            if period > 0:
+                self.cursor_blink_timer = (self.cursor_blink_timer + delta_time) % period
+                self.cursor_visible = self.cursor_blink_timer < self.cursor_blink_rate
     
     def render(self, renderer):
         """Render the text box."""
@@ -247,9 +249,8 @@ class TextBox(UIElement):
             cursor_y = self.position.y + self.padding
             
             if self.position.x + self.padding <= cursor_x <= self.position.x + self.size.x - self.padding:
-                renderer.draw_rect(
-                    Vector2(cursor_x, cursor_y),
-                    Vector2(2, self.font_size),
+                renderer.draw_rect_xywh(
+                    cursor_x, cursor_y, 2, self.font_size,
                     self.text_color,
                     filled=True
                 )
@@ -155,9 +155,8 @@ class UIElement:
                 )
             else:
                 # Fallback to regular rect
-                renderer.draw_rect(
-                    Vector2(rect.x, rect.y),
-                    Vector2(rect.width, rect.height),
+                renderer.draw_rect_xywh(
+                    rect.x, rect.y, rect.width, rect.height,
                     self.background_color[:3],
                     filled=True
                 )
@@ -165,9 +164,8 @@ class UIElement:
         # Draw border
         if self.border_width > 0:
             rect = self.get_rect()
-            renderer.draw_rect(
-                Vector2(rect.x, rect.y),
-                Vector2(rect.width, rect.height),
+            renderer.draw_rect_xywh(
+                rect.x, rect.y, rect.width, rect.height,
                 self.border_color,
                 filled=False
             )
@@ -125,6 +125,13 @@ class UIManager:
         self.mouse_just_released = False
         self.text_input = ""
         
+        # Motion events are usually blocked by the engine, so read the
+        # cursor directly. A new vector each frame, since callbacks receive
+        # mouse_position and may keep it.
+        if pygame.display.get_init():
+            mouse_x, mouse_y = pygame.mouse.get_pos()
+            self.mouse_position = Vector2(mouse_x, mouse_y)
+        
         # Update hover state
         hovered = self.get_element_at_position(self.mouse_position)
         if hovered != self.hovered_element:
@@ -0,0 +1,36 @@
+"""
+VoidRay Font Cache
+Shared pygame font objects keyed by name and size.
+
+Constructing a pygame Font loads and parses the font file, so per-frame
+code should fetch fonts from here instead of building new ones.
+"""
+
+import pygame
+from typing import Dict, Optional, Tuple
+
+
+_FONT_CACHE: Dict[Tuple[Optional[str], int], pygame.font.Font] = {}
+
+
+def get_font(font_name: Optional[str], font_size: int) -> pygame.font.Font:
+    """
+    Get a cached font, loading it on first use.
+
+    Args:
+        font_name: Font file path, or None for pygame's default font
+        font_size: Font size in points
+
+    Returns:
+        Shared pygame Font instance
+    """
+    key = (font_name, font_size)
+    font = _FONT_CACHE.get(key)
+    if font is None:
+        font = _FONT_CACHE[key] = pygame.font.Font(font_name, font_size)
+    return font
+
+
+def clear_font_cache():
+    """Drop all cached fonts; they are invalid once pygame quits."""
+    _FONT_CACHE.clear()
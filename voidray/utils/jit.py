@@ -0,0 +1,106 @@
+"""
+VoidRay JIT Helpers
+Optional numba acceleration for numeric hot paths.
+
+numba is not a required dependency. When it isn't installed, ``njit``
+is a pass-through decorator and the decorated functions run as plain
+Python, so kernels must stay valid Python as well as valid nopython code.
+
+Kernels compile lazily on first call and are cached on disk, so only the
+first launch pays the compile cost. The cache lives in a per-user
+directory unless NUMBA_CACHE_DIR is already set or a pre-warmed
+``numba_cache`` directory ships next to the game (see
+``voidray.tools.warm_jit``).
+
+Builds compiled with Nuitka already turn the kernels into C, and numba
+cannot JIT functions that have no Python bytecode, so there ``njit`` is
+always a pass-through::
+
+    python -m nuitka --onefile --include-package=voidray your_game.py
+"""
+
+import os
+import sys
+
+# Nuitka defines __compiled__ in every module it compiles
+COMPILED_BUILD = '__compiled__' in globals()
+
+
+def _default_cache_dir() -> str:
+    """Prefer a cache shipped next to the game over the per-user one."""
+    for base in (os.path.dirname(os.path.abspath(sys.argv[0] or '.')),
+                 os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))):
+        bundled = os.path.join(base, 'numba_cache')
+        if os.path.isdir(bundled):
+            return bundled
+    return os.path.join(os.path.expanduser('~'), '.cache', 'voidray', 'numba')
+
+
+try:
+    if COMPILED_BUILD:
+        raise ImportError("kernels are compiled ahead of time")
+    import numba
+    from numba import njit as _numba_njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    _numba_njit = None
+    NUMBA_AVAILABLE = False
+
+# Kernels pick up the cache location when they're decorated, so this has to
+# happen before any kernel module is imported. An explicit NUMBA_CACHE_DIR
+# wins; the environment itself is left alone.
+if NUMBA_AVAILABLE and not numba.config.CACHE_DIR:
+    numba.config.CACHE_DIR = _default_cache_dir()
+
+
+# (dispatcher, signatures) for every kernel that declared its signatures
+_KERNELS = []
+
+
+def njit(*args, precompile=(), **kwargs):
+    """
+    Compile a function with ``numba.njit`` when numba is available.
+
+    Usable both bare (``@njit``) and with options (``@njit(cache=True)``).
+    Without numba the function is returned unchanged.
+
+    Args:
+        precompile: Signature strings such as ``"(float64, float64)"`` to
+                    compile ahead of time when ``precompile()`` is called.
+                    Compilation stays lazy otherwise.
+    """
+    if len(args) == 1 and callable(args[0]) and not kwargs:
+        return _compile(args[0], args[1:], kwargs, precompile)
+
+    def decorator(func):
+        return _compile(func, args, kwargs, precompile)
+    return decorator
+
+
+def _compile(func, args, kwargs, signatures):
+    """Wrap one function with numba and register its signatures."""
+    if not NUMBA_AVAILABLE:
+        return func
+
+    dispatcher = _numba_njit(*args, **kwargs)(func)
+    if signatures:
+        _KERNELS.append((dispatcher, tuple(signatures)))
+    return dispatcher
+
+
+def precompile() -> int:
+    """
+    Compile every registered kernel for its declared signatures.
+
+    With caching enabled this populates the on-disk cache, so installers
+    or CI can call it once instead of the first game launch paying for it.
+
+    Returns:
+        Number of signatures compiled (0 when numba isn't installed)
+    """
+    compiled = 0
+    for dispatcher, signatures in _KERNELS:
+        for signature in signatures:
+            dispatcher.compile(signature)
+            compiled += 1
+    return compiled